@@ -4,8 +4,12 @@ Expose les endpoints HTTP et fait le pont entre HTTP et le domaine.
 Dépend du PORT PRIMAIRE (interface), pas directement du service.
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from typing import Annotated
+from datetime import date
+from itertools import chain
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import Annotated, Iterable, Iterator, Optional
 
 from src.adapters.primary.fastapi.schemas.project_schemas import (
     CreateProjectRequest,
@@ -22,6 +26,7 @@ from src.domain.exceptions import (
     ProjectNotFoundError
 )
 from src.ports.primary.project_use_cases import ProjectUseCasesPort
+from src.di_container import get_db_session, get_project_service
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -34,23 +39,32 @@ router = APIRouter(
 )
 
 
-def get_project_use_cases() -> ProjectUseCasesPort:
+def get_project_use_cases(
+    session: Annotated[Session, Depends(get_db_session)]
+) -> ProjectUseCasesPort:
     """
     Dépendance FastAPI pour injecter les cas d'usage.
 
     IMPORTANT: Cette fonction sera remplacée par le DI container.
     C'est ici que l'injection de dépendances se produit.
+    La session est ouverte et fermée par get_db_session pour chaque requête.
     """
-    from src.di_container import get_project_service
-    return get_project_service()
+    return get_project_service(session)
 
 
 # Type annotation pour l'injection de dépendances
 ProjectUseCasesDep = Annotated[ProjectUseCasesPort, Depends(get_project_use_cases)]
 
 
-def _project_to_response(project) -> ProjectResponse:
-    """Convertit une entité Project du domaine en DTO de réponse."""
+def _project_to_response(project, today: Optional[date] = None) -> ProjectResponse:
+    """
+    Convertit une entité Project du domaine en DTO de réponse.
+
+    Args:
+        project: L'entité du domaine
+        today: Date de référence pour les champs calculés. Les endpoints de liste
+               la calculent une seule fois au lieu d'un date.today() par projet.
+    """
     return ProjectResponse(
         id=project.id,
         numero=project.numero,
@@ -70,14 +84,29 @@ def _project_to_response(project) -> ProjectResponse:
         entreprise_id=project.entreprise_id,
         contact_id=project.contact_id,
         # Champs calculés
-        is_active=project.is_active(),
-        days_remaining=project.days_remaining(),
+        is_active=project.is_active(today),
+        days_remaining=project.days_remaining(today),
         avancement=project.calculer_avancement(),
         ecart_temps=project.calculer_ecart_temps(),
-        est_en_retard=project.est_en_retard()
+        est_en_retard=project.est_en_retard(today)
     )
 
 
+def _stream_json_array(projects: Iterable) -> Iterator[str]:
+    """
+    Sérialise des projets en tableau JSON, un élément par fragment.
+
+    Le tableau n'est jamais construit en entier: chaque projet est converti
+    puis envoyé dès qu'il est lu en base.
+    """
+    today = date.today()
+    separator = "["
+    for project in projects:
+        yield separator + _project_to_response(project, today).model_dump_json()
+        separator = ","
+    yield "[]" if separator == "[" else "]"
+
+
 @router.post(
     "",
     response_model=ProjectResponse,
@@ -171,13 +200,25 @@ def get_project(
 )
 def list_projects(
     use_cases: ProjectUseCasesDep,
+    response: Response,
     offset: int = Query(0, ge=0, description="Nombre de projets à ignorer"),
-    limit: int = Query(20, ge=1, le=100, description="Nombre maximum de projets")
+    limit: int = Query(20, ge=1, le=100, description="Nombre maximum de projets"),
+    cursor: Optional[int] = Query(
+        None, ge=0,
+        description="Pagination par curseur (0 pour la première page, ignore offset). "
+                    "Le curseur suivant est renvoyé dans l'en-tête X-Next-Cursor."
+    )
 ) -> list[ProjectResponse]:
     """Endpoint GET /api/projects"""
     try:
-        projects = use_cases.list_projects(offset=offset, limit=limit)
-        return [_project_to_response(p) for p in projects]
+        if cursor is None:
+            projects = use_cases.list_projects(offset=offset, limit=limit)
+        else:
+            projects, next_cursor = use_cases.list_projects_after(cursor=cursor, limit=limit)
+            if next_cursor is not None:
+                response.headers["X-Next-Cursor"] = str(next_cursor)
+        today = date.today()
+        return [_project_to_response(p, today) for p in projects]
 
     except Exception as e:
         logger.error(f"Erreur lors de la liste: {e}", exc_info=True)
@@ -187,6 +228,40 @@ def list_projects(
         )
 
 
+@router.get(
+    "/stream/list",
+    response_class=StreamingResponse,
+    summary="Parcourir les projets par curseur",
+    description=(
+        "Renvoie les projets d'ID supérieur à last_id, triés par ID, en flux JSON. "
+        "Pour la page suivante, passer l'ID du dernier projet reçu."
+    )
+)
+def stream_projects(
+    use_cases: ProjectUseCasesDep,
+    last_id: Optional[int] = Query(None, ge=0, description="ID du dernier projet déjà reçu"),
+    limit: int = Query(100, ge=1, le=1000, description="Nombre maximum de projets")
+) -> StreamingResponse:
+    """Endpoint GET /api/projects/stream/list"""
+    try:
+        projects = use_cases.stream_projects(last_id=last_id, limit=limit)
+        # Lecture du premier projet avant l'envoi des en-têtes: une erreur de
+        # base de données donne encore une réponse 500 propre.
+        first = next(projects, None)
+        projects = chain([first], projects) if first is not None else iter(())
+
+    except Exception as e:
+        logger.error(f"Erreur lors du parcours des projets: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erreur interne du serveur"
+        )
+
+    # Le curseur est lu pendant l'envoi du corps: la session (get_db_session)
+    # doit encore être ouverte, ce que garantit FastAPI >= 0.118 (pyproject)
+    return StreamingResponse(_stream_json_array(projects), media_type="application/json")
+
+
 @router.put(
     "/{project_id}",
     response_model=ProjectResponse,
@@ -278,15 +353,18 @@ def delete_project(
     "/templates/list",
     response_model=list[ProjectResponse],
     summary="Lister les templates",
-    description="Récupère tous les projets templates"
+    description="Récupère les projets templates avec pagination"
 )
 def list_templates(
-    use_cases: ProjectUseCasesDep
+    use_cases: ProjectUseCasesDep,
+    offset: int = Query(0, ge=0, description="Nombre de templates à ignorer"),
+    limit: int = Query(20, ge=1, le=100, description="Nombre maximum de templates")
 ) -> list[ProjectResponse]:
     """Endpoint GET /api/projects/templates/list"""
     try:
-        templates = use_cases.find_templates()
-        return [_project_to_response(t) for t in templates]
+        templates = use_cases.find_templates(offset=offset, limit=limit)
+        today = date.today()
+        return [_project_to_response(t, today) for t in templates]
 
     except Exception as e:
         logger.error(f"Erreur lors de la liste des templates: {e}", exc_info=True)
@@ -475,24 +553,10 @@ def get_ecart_temps(
 ) -> EcartTempsResponse:
     """Endpoint GET /api/projects/{project_id}/ecart-temps"""
     try:
-        # Un seul appel au service pour récupérer le projet
-        project = use_cases.get_project(project_id)
-
-        # Calcul de l'écart via la méthode métier de l'entité
-        ecart = project.calculer_ecart_temps()
-
-        # Calcul du pourcentage d'écart
-        ecart_pourcentage = 0.0
-        if project.heures_planifiees > 0:
-            ecart_pourcentage = (ecart / project.heures_planifiees) * 100
+        # Le service ne lit que les heures du projet
+        ecart_temps = use_cases.calculer_ecart_temps(project_id)
 
-        return EcartTempsResponse(
-            project_id=project_id,
-            heures_planifiees=project.heures_planifiees,
-            heures_reelles=project.heures_reelles,
-            ecart=ecart,
-            ecart_pourcentage=ecart_pourcentage
-        )
+        return EcartTempsResponse(project_id=project_id, **ecart_temps)
 
     except ProjectNotFoundError:
         raise HTTPException(
@@ -4,8 +4,10 @@ Adapter primaire: Router FastAPI pour Utilisateur.
 Expose les endpoints HTTP et fait le pont entre HTTP et le domaine.
 Dépend du PORT PRIMAIRE (interface), pas directement du service.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import Annotated, List
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query, Response
+from sqlalchemy.orm import Session
+from typing import Annotated, List, Optional
+import hashlib
 import logging
 
 from src.adapters.primary.fastapi.schemas.user_schemas import (
@@ -17,7 +19,8 @@ from src.adapters.primary.fastapi.schemas.user_schemas import (
     UserResponse
 )
 from src.ports.primary.user_use_cases import UserUseCasesPort
-from src.domain.entities.user import RoleUtilisateur
+from src.di_container import get_db_session, get_user_service
+from src.domain.entities.user import RoleUtilisateur, Utilisateur
 from src.domain.exceptions import (
     EntityAlreadyExistsError,
     EntityNotFoundError,
@@ -34,21 +37,50 @@ router = APIRouter(
 )
 
 
-def get_user_use_cases() -> UserUseCasesPort:
+def get_user_use_cases(
+    session: Annotated[Session, Depends(get_db_session)]
+) -> UserUseCasesPort:
     """
     Dépendance FastAPI pour injecter les cas d'usage.
 
     Cette fonction est appelée par FastAPI pour obtenir le service.
     C'est ici que l'injection de dépendances se produit.
+    La session est ouverte et fermée par get_db_session pour chaque requête.
     """
-    from src.di_container import get_user_service
-    return get_user_service()
+    return get_user_service(session)
 
 
 # Type annotation pour l'injection de dépendances
 UserUseCasesDep = Annotated[UserUseCasesPort, Depends(get_user_use_cases)]
 
 
+def _etag_utilisateur(utilisateur: Utilisateur) -> str:
+    """
+    Calcule l'ETag d'un utilisateur à partir des champs exposés par l'API.
+
+    Le hash (64 bits) porte sur le contenu de la réponse: toute modification
+    d'un de ces champs change l'ETag, sans champ de version à maintenir.
+    """
+    contenu = (
+        f"{utilisateur.id}:{utilisateur.date_creation.isoformat()}:{utilisateur.actif}:"
+        f"{utilisateur.role.value}:{utilisateur.email}:{utilisateur.nom}:{utilisateur.prenom}"
+    )
+    return '"' + hashlib.blake2b(contenu.encode(), digest_size=8).hexdigest() + '"'
+
+
+def _etag_correspond(if_none_match: Optional[str], etag: str) -> bool:
+    """Indique si l'en-tête If-None-Match du client désigne l'ETag courant."""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Comparaison faible (RFC 9110): le préfixe W/ est ignoré
+    return any(
+        candidat.strip().removeprefix("W/") == etag
+        for candidat in if_none_match.split(",")
+    )
+
+
 @router.post(
     "",
     response_model=UserResponse,
@@ -140,17 +172,23 @@ def create_user(
 )
 def get_user(
     user_id: int,
-    use_cases: UserUseCasesDep
-) -> UserResponse:
+    use_cases: UserUseCasesDep,
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+) -> UserResponse | Response:
     """
     Endpoint GET /api/users/{user_id}
 
+    La réponse porte un ETag; si le client renvoie le même dans If-None-Match,
+    on répond 304 sans sérialiser ni renvoyer le corps.
+
     Args:
         user_id: ID de l'utilisateur (extrait de l'URL par FastAPI)
         use_cases: Service métier injecté
+        if_none_match: En-tête If-None-Match du client, s'il y en a un
 
     Returns:
-        DTO de réponse avec l'utilisateur
+        DTO de réponse avec l'utilisateur, ou une réponse 304 vide
 
     Raises:
         HTTPException: Si l'utilisateur n'existe pas
@@ -159,6 +197,13 @@ def get_user(
         utilisateur = use_cases.obtenir_utilisateur(user_id)
 
         assert utilisateur.id is not None
+        etag = _etag_utilisateur(utilisateur)
+        if _etag_correspond(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag}
+            )
+        response.headers["ETag"] = etag
         return UserResponse(
             id=utilisateur.id,
             nom=utilisateur.nom,
@@ -191,24 +236,38 @@ def get_user(
 )
 def list_users(
     use_cases: UserUseCasesDep,
+    response: Response,
     offset: int = Query(0, ge=0, description="Nombre d'utilisateurs à sauter"),
-    limit: int = Query(20, ge=1, le=100, description="Nombre max d'utilisateurs")
+    limit: int = Query(20, ge=1, le=100, description="Nombre max d'utilisateurs"),
+    cursor: Optional[int] = Query(
+        None, ge=0,
+        description="Pagination par curseur (0 pour la première page, ignore offset). "
+                    "Le curseur suivant est renvoyé dans l'en-tête X-Next-Cursor."
+    )
 ) -> List[UserResponse]:
     """
-    Endpoint GET /api/users?offset=0&limit=20
+    Endpoint GET /api/users?offset=0&limit=20 (ou ?cursor=0&limit=20)
 
     Liste les utilisateurs avec pagination.
 
     Args:
-        offset: Nombre d'utilisateurs à sauter
+        offset: Nombre d'utilisateurs à sauter (coût O(offset) en base)
         limit: Nombre maximum d'utilisateurs à retourner
+        cursor: Curseur keyset; si fourni, offset est ignoré
         use_cases: Service métier injecté
 
     Returns:
         Liste de DTOs d'utilisateurs
     """
     try:
-        utilisateurs = use_cases.lister_utilisateurs(offset=offset, limit=limit)
+        if cursor is None:
+            utilisateurs = use_cases.lister_utilisateurs(offset=offset, limit=limit)
+        else:
+            utilisateurs, curseur_suivant = use_cases.lister_utilisateurs_apres(
+                curseur=cursor, limit=limit
+            )
+            if curseur_suivant is not None:
+                response.headers["X-Next-Cursor"] = str(curseur_suivant)
 
         return [
             UserResponse(
@@ -0,0 +1,58 @@
+"""
+Estimation du nombre de lignes d'une table, partagée par les repositories.
+
+Lit les statistiques tenues par la base (ANALYZE) au lieu de compter:
+O(1) au lieu d'un parcours complet de la table. Sans statistiques
+disponibles, on retombe sur un COUNT(*) exact.
+"""
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import DeclarativeBase, Session
+
+
+def approx_row_count(session: Session, model: type[DeclarativeBase]) -> int:
+    """
+    Nombre approximatif de lignes de la table du modèle.
+
+    Précision: celle du dernier ANALYZE (PostgreSQL: pg_class.reltuples,
+    SQLite: sqlite_stat1). Les insertions et suppressions faites depuis ne
+    sont pas vues. Le résultat convient pour afficher un total de pages,
+    pas pour une règle métier.
+
+    Args:
+        session: Session SQLAlchemy
+        model: Modèle ORM dont on estime la table
+
+    Returns:
+        Le nombre estimé de lignes (exact si la base n'a pas de statistiques)
+    """
+    table = model.__table__.name
+    dialect = session.get_bind().dialect.name
+
+    estimate = None
+    if dialect == "postgresql":
+        # reltuples vaut -1 tant que la table n'a jamais été analysée
+        reltuples = session.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:t)"),
+            {"t": table}
+        ).scalar()
+        if reltuples is not None and reltuples >= 0:
+            estimate = int(reltuples)
+    elif dialect == "sqlite":
+        has_stats = session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+        ).first()
+        if has_stats is not None:
+            # stat commence par un nombre de lignes: "N n1 n2 ...". Pour un
+            # index partiel, N ne compte que les lignes indexées: on garde le
+            # maximum, donné par la table elle-même ou un index complet
+            stats = session.execute(
+                text("SELECT stat FROM sqlite_stat1 WHERE tbl = :t"),
+                {"t": table}
+            ).scalars().all()
+            if stats:
+                estimate = max(int(stat.split()[0]) for stat in stats)
+
+    if estimate is None:
+        estimate = session.scalar(select(func.count()).select_from(model))
+
+    return estimate
@@ -4,14 +4,21 @@ IMPLÉMENTE le port secondaire (ProjectRepositoryPort).
 Contient le code technique d'accès aux données.
 Compatible avec SQLite, MySQL, PostgreSQL, etc. grâce à SQLAlchemy.
 """
-from typing import Optional
-from datetime import datetime
+from typing import Collection, Iterator, Optional
+from datetime import date, datetime
 from sqlalchemy.orm import Session, DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import String, Float, Date, Text, Boolean, Integer, DateTime, ForeignKey
+from sqlalchemy import (
+    String, Float, Date, Text, Boolean, Integer, DateTime, ForeignKey, Index,
+    delete, insert, literal, or_, select, update
+)
 
+from src.adapters.secondary.repositories.row_count import approx_row_count
 from src.domain.entities.project import Project
 from src.domain.entities.project_type import ProjectType
-from src.ports.secondary.project_repository import ProjectRepositoryPort
+from src.ports.secondary.project_repository import ConflictFlags, ProjectRepositoryPort
+
+# Nombre de lignes lues à la fois par stream_after
+_STREAM_BATCH_SIZE = 100
 
 
 # Modèle SQLAlchemy (ORM) - couche technique
@@ -66,6 +73,18 @@ class ProjectModel(Base):
     entreprise_id: Mapped[int] = mapped_column(Integer, nullable=False)
     contact_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
+    # Index partiel: ne contient que les templates, donc find_templates
+    # parcourt un index proportionnel au nombre de templates et non à la
+    # table entière (SQLite/PostgreSQL; index complet sur les autres SGBD).
+    __table_args__ = (
+        Index(
+            "idx_projets_templates",
+            "id",
+            sqlite_where=est_template.is_(True),
+            postgresql_where=est_template.is_(True)
+        ),
+    )
+
 
 class SQLAlchemyProjectRepository(ProjectRepositoryPort):
     """
@@ -93,38 +112,42 @@ class SQLAlchemyProjectRepository(ProjectRepositoryPort):
         Conversion: Entité domaine → Modèle ORM → DB
         """
         # Conversion de l'entité domaine vers le modèle ORM
-        project_model = ProjectModel(
-            numero=project.numero,
-            nom=project.nom,
-            description=project.description,
-            date_debut=project.date_debut,
-            date_echeance=project.date_echeance,
-            date_creation=project.date_creation,
-            type=project.type.value,  # Convertir l'enum en string
-            stade=project.stade,
-            commentaire=project.commentaire,
-            heures_planifiees=project.heures_planifiees,
-            heures_reelles=project.heures_reelles,
-            est_template=project.est_template,
-            projet_template_id=project.projet_template_id,
-            responsable_id=project.responsable_id,
-            entreprise_id=project.entreprise_id,
-            contact_id=project.contact_id
-        )
+        project_model = ProjectModel(**self._to_row(project))
 
         # Opération technique de persistance
         self._session.add(project_model)
         self._session.commit()
-        self._session.refresh(project_model)
 
         # Conversion du modèle ORM vers l'entité domaine
         return self._to_domain(project_model)
 
+    def save_many(self, projects: list[Project]) -> list[Project]:
+        """
+        Sauvegarde plusieurs projets: INSERT ... VALUES (...), (...) RETURNING.
+
+        Sans RETURNING multi-lignes (MySQL), l'unité de travail de la session
+        insère les modèles en lot puis les IDs sont relus depuis les modèles.
+        """
+        if not projects:
+            return []
+
+        rows = [self._to_row(project) for project in projects]
+
+        if self._session.get_bind().dialect.insert_executemany_returning:
+            project_models = self._session.scalars(
+                insert(ProjectModel).returning(ProjectModel, sort_by_parameter_order=True),
+                rows
+            ).all()
+        else:
+            project_models = [ProjectModel(**row) for row in rows]
+            self._session.add_all(project_models)
+        self._session.commit()
+
+        return [self._to_domain(pm) for pm in project_models]
+
     def find_by_id(self, project_id: int) -> Optional[Project]:
         """Récupère un projet par ID depuis la base de données."""
-        project_model = self._session.query(ProjectModel).filter(
-            ProjectModel.id == project_id
-        ).first()
+        project_model = self._session.get(ProjectModel, project_id)
 
         if project_model is None:
             return None
@@ -142,124 +165,344 @@ class SQLAlchemyProjectRepository(ProjectRepositoryPort):
         Returns:
             Liste de projets (peut être vide)
         """
-        project_models = (
-            self._session.query(ProjectModel)
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
+        project_models = self._session.scalars(
+            select(ProjectModel).offset(offset).limit(limit)
+        ).all()
         return [self._to_domain(pm) for pm in project_models]
 
-    def update(self, project: Project) -> Project:
+    def approx_count(self) -> int:
+        """Estime le nombre de projets depuis les statistiques de la base."""
+        return approx_row_count(self._session, ProjectModel)
+
+    def stream_after(self, last_id: Optional[int], limit: int) -> Iterator[Project]:
+        """
+        Parcourt les projets d'ID > last_id, par lots (curseur côté serveur).
+
+        yield_per évite de charger tout le résultat en mémoire: les lignes
+        sont converties au fil de l'itération.
+        """
+        stmt = select(ProjectModel).order_by(ProjectModel.id).limit(limit)
+        if last_id is not None:
+            stmt = stmt.where(ProjectModel.id > last_id)
+
+        project_models = self._session.scalars(
+            stmt.execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        for pm in project_models:
+            yield self._to_domain(pm)
+
+    def update(self, project: Project) -> Optional[Project]:
         """
         Met à jour un projet existant dans la base de données.
 
+        Une seule requête UPDATE ... WHERE id=? (RETURNING si le dialecte le
+        supporte): pas de SELECT préalable pour charger le modèle.
+
         Args:
             project: L'entité Project avec les nouvelles valeurs
 
         Returns:
-            Le projet mis à jour
+            Le projet mis à jour, ou None si le projet n'existe pas
+        """
+        return self._update_by_id(
+            project.id,
+            numero=project.numero,
+            nom=project.nom,
+            description=project.description,
+            date_debut=project.date_debut,
+            date_echeance=project.date_echeance,
+            type=project.type.value,
+            stade=project.stade,
+            commentaire=project.commentaire,
+            heures_planifiees=project.heures_planifiees,
+            heures_reelles=project.heures_reelles,
+            est_template=project.est_template,
+            projet_template_id=project.projet_template_id,
+            responsable_id=project.responsable_id,
+            entreprise_id=project.entreprise_id,
+            contact_id=project.contact_id
+            # date_creation ne change JAMAIS
+        )
+
+    def mark_as_template(self, project_id: int) -> Optional[Project]:
+        """Marque un projet comme template (UPDATE ... SET est_template=true)."""
+        return self._update_by_id(project_id, est_template=True)
 
-        Raises:
-            ValueError: Si le projet n'existe pas
+    def _update_by_id(self, project_id: int, **values) -> Optional[Project]:
         """
-        # Récupérer le modèle existant
-        project_model = self._session.query(ProjectModel).filter(
-            ProjectModel.id == project.id
-        ).first()
+        Exécute UPDATE projets SET ... WHERE id=:project_id.
+
+        Utilise RETURNING quand le dialecte le supporte (SQLite, PostgreSQL);
+        sinon (MySQL) se rabat sur rowcount puis relit la ligne.
+
+        Returns:
+            Le projet mis à jour, ou None si aucune ligne ne correspond
+        """
+        stmt = update(ProjectModel).where(ProjectModel.id == project_id).values(**values)
+
+        if self._session.get_bind().dialect.update_returning:
+            project_model = self._session.scalars(stmt.returning(ProjectModel)).first()
+            self._session.commit()
+        else:
+            result = self._session.execute(stmt)
+            self._session.commit()
+            project_model = (
+                self._session.get(ProjectModel, project_id) if result.rowcount == 1 else None
+            )
 
         if project_model is None:
-            raise ValueError(f"Project with id {project.id} not found")
-
-        # Mettre à jour tous les champs
-        project_model.numero = project.numero
-        project_model.nom = project.nom
-        project_model.description = project.description
-        project_model.date_debut = project.date_debut
-        project_model.date_echeance = project.date_echeance
-        project_model.type = project.type.value
-        project_model.stade = project.stade
-        project_model.commentaire = project.commentaire
-        project_model.heures_planifiees = project.heures_planifiees
-        project_model.heures_reelles = project.heures_reelles
-        project_model.est_template = project.est_template
-        project_model.projet_template_id = project.projet_template_id
-        project_model.responsable_id = project.responsable_id
-        project_model.entreprise_id = project.entreprise_id
-        project_model.contact_id = project.contact_id
-        # date_creation ne change JAMAIS
-
-        # Sauvegarder les changements
-        self._session.commit()
-        self._session.refresh(project_model)
+            return None
 
         # Convertir et retourner
         return self._to_domain(project_model)
 
     def exists_by_name(self, name: str) -> bool:
         """Vérifie si un projet avec ce nom existe."""
-        count = self._session.query(ProjectModel).filter(
-            ProjectModel.nom == name
-        ).count()
-        return count > 0
+        # SELECT 1 ... LIMIT 1: s'arrête au premier match de l'index unique
+        row = self._session.execute(
+            select(literal(1)).where(ProjectModel.nom == name).limit(1)
+        ).first()
+        return row is not None
 
     def exists_by_numero(self, numero: str) -> bool:
         """Vérifie si un projet avec ce numéro existe."""
-        count = self._session.query(ProjectModel).filter(
-            ProjectModel.numero == numero
-        ).count()
-        return count > 0
-
-    def delete(self, project_id: int) -> bool:
-        """Supprime un projet de la base de données."""
-        project_model = self._session.query(ProjectModel).filter(
-            ProjectModel.id == project_id
+        # SELECT 1 ... LIMIT 1: s'arrête au premier match de l'index unique
+        row = self._session.execute(
+            select(literal(1)).where(ProjectModel.numero == numero).limit(1)
         ).first()
+        return row is not None
+
+    def find_existing_keys(
+        self,
+        numeros: Collection[str],
+        noms: Collection[str]
+    ) -> tuple[set[str], set[str]]:
+        """
+        SELECT numero, nom FROM projets WHERE numero IN (...) OR nom IN (...)
+        """
+        if not numeros and not noms:
+            return set(), set()
+
+        rows = self._session.execute(
+            select(ProjectModel.numero, ProjectModel.nom).where(
+                or_(ProjectModel.numero.in_(numeros), ProjectModel.nom.in_(noms))
+            )
+        ).all()
+        numeros, noms = set(numeros), set(noms)
+        return (
+            {row.numero for row in rows if row.numero in numeros},
+            {row.nom for row in rows if row.nom in noms}
+        )
+
+    def duplicate(
+        self,
+        project_id: int,
+        numero: str,
+        nom: str,
+        date_debut: date,
+        date_echeance: date,
+        date_creation: datetime
+    ) -> Optional[Project]:
+        """
+        Copie un projet côté base: INSERT INTO projets (...) SELECT ... FROM
+        projets WHERE id=:project_id, sans charger la ligne source.
+        """
+        return self._insert_copy_of(
+            ProjectModel.id == project_id,
+            numero=numero,
+            nom=nom,
+            date_debut=date_debut,
+            date_echeance=date_echeance,
+            heures_reelles=0.0,
+            est_template=False,
+            projet_template_id=None,
+            date_creation=date_creation
+        )
+
+    def create_from_template(
+        self,
+        template_id: int,
+        numero: str,
+        nom: str,
+        date_debut: date,
+        date_echeance: date,
+        responsable_id: int,
+        entreprise_id: int,
+        contact_id: Optional[int],
+        date_creation: datetime
+    ) -> Optional[Project]:
+        """
+        Crée un projet depuis un template en un seul INSERT ... SELECT
+        (WHERE id=:template_id AND est_template).
+        """
+        return self._insert_copy_of(
+            (ProjectModel.id == template_id) & ProjectModel.est_template.is_(True),
+            numero=numero,
+            nom=nom,
+            date_debut=date_debut,
+            date_echeance=date_echeance,
+            heures_reelles=0.0,
+            est_template=False,
+            projet_template_id=template_id,
+            responsable_id=responsable_id,
+            entreprise_id=entreprise_id,
+            contact_id=contact_id,
+            date_creation=date_creation
+        )
+
+    def _insert_copy_of(self, source_filter, **overrides) -> Optional[Project]:
+        """
+        INSERT INTO projets (...) SELECT ... FROM projets WHERE <source_filter>.
+
+        Chaque colonne est recopiée depuis la ligne source, sauf celles de
+        overrides qui sont passées en paramètres. RETURNING renvoie la ligne
+        créée quand le dialecte le supporte; sinon (MySQL) elle est relue
+        via lastrowid.
+
+        Returns:
+            Le projet créé, ou None si aucune ligne source ne correspond
+        """
+        columns = [c for c in ProjectModel.__table__.columns if c.name != "id"]
+        source = select(*[
+            literal(overrides[c.name], c.type) if c.name in overrides else c
+            for c in columns
+        ]).where(source_filter)
+        stmt = insert(ProjectModel).from_select([c.name for c in columns], source)
+
+        if self._session.get_bind().dialect.insert_returning:
+            project_model = self._session.scalars(stmt.returning(ProjectModel)).first()
+            self._session.commit()
+        else:
+            result = self._session.execute(stmt)
+            self._session.commit()
+            project_model = (
+                self._session.get(ProjectModel, result.lastrowid) if result.rowcount == 1 else None
+            )
 
         if project_model is None:
-            return False
+            return None
+
+        return self._to_domain(project_model)
+
+    def check_conflicts(
+        self,
+        numero: Optional[str],
+        nom: Optional[str],
+        exclude_id: Optional[int] = None
+    ) -> ConflictFlags:
+        """
+        Vérifie l'unicité du numéro et du nom en un seul aller-retour.
+
+        SELECT numero, nom FROM projets
+        WHERE (numero = :numero OR nom = :nom) [AND id <> :exclude_id] LIMIT 2
+        """
+        conditions = []
+        if numero is not None:
+            conditions.append(ProjectModel.numero == numero)
+        if nom is not None:
+            conditions.append(ProjectModel.nom == nom)
+        if not conditions:
+            return ConflictFlags()
+
+        stmt = select(ProjectModel.numero, ProjectModel.nom).where(or_(*conditions))
+        if exclude_id is not None:
+            stmt = stmt.where(ProjectModel.id != exclude_id)
+
+        # Au plus deux lignes: une par contrainte unique
+        rows = self._session.execute(stmt.limit(2)).all()
+        return ConflictFlags(
+            numero=numero is not None and any(row.numero == numero for row in rows),
+            nom=nom is not None and any(row.nom == nom for row in rows)
+        )
 
-        self._session.delete(project_model)
+    def delete(self, project_id: int) -> bool:
+        """
+        Supprime un projet de la base de données.
+
+        Un seul DELETE ... WHERE id=?: rowcount indique si le projet existait.
+        """
+        result = self._session.execute(
+            delete(ProjectModel).where(ProjectModel.id == project_id)
+        )
         self._session.commit()
-        return True
+        return result.rowcount == 1
+
+    def get_hours(self, project_id: int) -> Optional[tuple[float, float]]:
+        """SELECT heures_planifiees, heures_reelles FROM projets WHERE id=?"""
+        row = self._session.execute(
+            select(ProjectModel.heures_planifiees, ProjectModel.heures_reelles)
+            .where(ProjectModel.id == project_id)
+        ).first()
 
-    def find_templates(self) -> list[Project]:
-        """Récupère tous les projets templates."""
-        project_models = self._session.query(ProjectModel).filter(
-            ProjectModel.est_template == True
+        if row is None:
+            return None
+
+        return float(row.heures_planifiees), float(row.heures_reelles)
+
+    def find_templates(self, offset: int = 0, limit: int = 20) -> list[Project]:
+        """Récupère les projets templates avec pagination (index partiel)."""
+        project_models = self._session.scalars(
+            select(ProjectModel)
+            .where(ProjectModel.est_template.is_(True))
+            .order_by(ProjectModel.id)
+            .offset(offset)
+            .limit(limit)
         ).all()
 
         return [self._to_domain(pm) for pm in project_models]
 
     def find_by_template_id(self, template_id: int) -> list[Project]:
         """Trouve tous les projets créés depuis un template spécifique."""
-        project_models = self._session.query(ProjectModel).filter(
-            ProjectModel.projet_template_id == template_id
+        project_models = self._session.scalars(
+            select(ProjectModel).where(ProjectModel.projet_template_id == template_id)
         ).all()
 
         return [self._to_domain(pm) for pm in project_models]
 
     def find_by_entreprise(self, entreprise_id: int) -> list[Project]:
         """Trouve tous les projets d'une entreprise."""
-        project_models = self._session.query(ProjectModel).filter(
-            ProjectModel.entreprise_id == entreprise_id
+        project_models = self._session.scalars(
+            select(ProjectModel).where(ProjectModel.entreprise_id == entreprise_id)
         ).all()
 
         return [self._to_domain(pm) for pm in project_models]
 
     def find_by_responsable(self, responsable_id: int) -> list[Project]:
         """Trouve tous les projets d'un responsable."""
-        project_models = self._session.query(ProjectModel).filter(
-            ProjectModel.responsable_id == responsable_id
+        project_models = self._session.scalars(
+            select(ProjectModel).where(ProjectModel.responsable_id == responsable_id)
         ).all()
 
         return [self._to_domain(pm) for pm in project_models]
 
+    def _to_row(self, project: Project) -> dict:
+        """Convertit une entité du domaine en valeurs de colonnes (sans l'ID)."""
+        return {
+            "numero": project.numero,
+            "nom": project.nom,
+            "description": project.description,
+            "date_debut": project.date_debut,
+            "date_echeance": project.date_echeance,
+            "date_creation": project.date_creation,
+            "type": project.type.value,  # Convertir l'enum en string
+            "stade": project.stade,
+            "commentaire": project.commentaire,
+            "heures_planifiees": project.heures_planifiees,
+            "heures_reelles": project.heures_reelles,
+            "est_template": project.est_template,
+            "projet_template_id": project.projet_template_id,
+            "responsable_id": project.responsable_id,
+            "entreprise_id": project.entreprise_id,
+            "contact_id": project.contact_id
+        }
+
     def _to_domain(self, project_model: ProjectModel) -> Project:
         """
         Convertit un modèle ORM en entité du domaine.
 
         IMPORTANT: Cette méthode isole le domaine de la couche technique.
+        Les lignes persistées respectent déjà les invariants: on passe par
+        Project.from_db_row pour ne pas revalider chaque ligne lue.
         """
         # Convertir les types SQLAlchemy Date en datetime.date Python si nécessaire
         date_debut = project_model.date_debut
@@ -270,7 +513,7 @@ class SQLAlchemyProjectRepository(ProjectRepositoryPort):
         if isinstance(date_echeance, datetime):
             date_echeance = date_echeance.date()
 
-        return Project(
+        return Project.from_db_row(
             id=int(project_model.id) if project_model.id is not None else None,
             numero=str(project_model.numero),
             nom=str(project_model.nom),
@@ -278,7 +521,7 @@ class SQLAlchemyProjectRepository(ProjectRepositoryPort):
             date_debut=date_debut,
             date_echeance=date_echeance,
             date_creation=project_model.date_creation,
-            type=ProjectType(project_model.type),  # Convertir string en enum
+            type=ProjectType.from_string(project_model.type),  # Convertir string en enum
             stade=str(project_model.stade) if project_model.stade else None,
             commentaire=str(project_model.commentaire) if project_model.commentaire else None,
             heures_planifiees=float(project_model.heures_planifiees),
@@ -4,14 +4,17 @@ Adapter secondaire: implémentation SQLAlchemy du repository pour Utilisateur.
 Implémente UserRepositoryPort avec SQLAlchemy.
 Compatible: SQLite, MySQL, PostgreSQL, Oracle, etc.
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session, DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import String, Integer, DateTime, Boolean, Enum as SQLEnum
+from sqlalchemy import String, Integer, DateTime, Boolean, Enum as SQLEnum, exists, literal, select
+from sqlalchemy.exc import IntegrityError
 
 from src.domain.entities.user import Utilisateur, RoleUtilisateur
+from src.domain.exceptions import EntityAlreadyExistsError, EntityNotFoundError
 from src.ports.secondary.user_repository import UserRepositoryPort
 from src.adapters.secondary.repositories.sqlalchemy_project_repository import Base
+from src.adapters.secondary.repositories.row_count import approx_row_count
 
 
 class UtilisateurModel(Base):
@@ -52,6 +55,29 @@ class SQLAlchemyUserRepository(UserRepositoryPort):
             db_session: Session SQLAlchemy pour les opérations DB
         """
         self._session = db_session
+        # Références fortes vers les modèles lus ou écrits: l'identity map de
+        # la session étant faible, un modèle non référencé serait relu en base
+        # au prochain session.get (ex: obtenir_utilisateur puis update).
+        # Le repository vit le temps d'une requête, comme la session.
+        self._charges: dict[int, UtilisateurModel] = {}
+
+    def _commit_email_unique(self, email: str) -> None:
+        """
+        Committe la session; un email déjà pris devient une erreur du domaine.
+
+        Le service vérifie l'unicité avant d'écrire, mais un autre processus
+        peut insérer le même email entre-temps: la contrainte UNIQUE tranche.
+
+        Raises:
+            EntityAlreadyExistsError: Si la contrainte d'unicité est violée
+        """
+        try:
+            self._session.commit()
+        except IntegrityError as e:
+            self._session.rollback()
+            raise EntityAlreadyExistsError(
+                f"Un utilisateur avec l'email {email} existe déjà"
+            ) from e
 
     def save(self, user: Utilisateur) -> Utilisateur:
         """
@@ -72,27 +98,26 @@ class SQLAlchemyUserRepository(UserRepositoryPort):
 
         # Opération technique de persistance
         self._session.add(model)
-        self._session.commit()
-        self._session.refresh(model)
+        self._commit_email_unique(user.email)
+        self._charges[model.id] = model
 
         # Conversion du modèle ORM vers l'entité domaine
         return self._to_domain(model)
 
     def find_by_id(self, user_id: int) -> Optional[Utilisateur]:
         """Récupère un utilisateur par ID depuis la base."""
-        model = self._session.query(UtilisateurModel).filter(
-            UtilisateurModel.id == user_id
-        ).first()
+        model = self._session.get(UtilisateurModel, user_id)
 
         if model is None:
             return None
 
+        self._charges[user_id] = model
         return self._to_domain(model)
 
     def find_by_email(self, email: str) -> Optional[Utilisateur]:
         """Récupère un utilisateur par email depuis la base."""
-        model = self._session.query(UtilisateurModel).filter(
-            UtilisateurModel.email == email.lower()
+        model = self._session.scalars(
+            select(UtilisateurModel).where(UtilisateurModel.email == email.lower())
         ).first()
 
         if model is None:
@@ -106,28 +131,62 @@ class SQLAlchemyUserRepository(UserRepositoryPort):
         limit: int = 20
     ) -> List[Utilisateur]:
         """Récupère tous les utilisateurs avec pagination."""
-        models = self._session.query(UtilisateurModel)\
-            .offset(offset)\
-            .limit(limit)\
-            .all()
+        models = self._session.scalars(
+            select(UtilisateurModel).offset(offset).limit(limit)
+        ).all()
 
         return [self._to_domain(model) for model in models]
 
+    def approx_count(self) -> int:
+        """Estime le nombre d'utilisateurs depuis les statistiques de la base."""
+        return approx_row_count(self._session, UtilisateurModel)
+
+    def find_after(
+        self,
+        after_id: Optional[int],
+        limit: int = 20
+    ) -> List[Utilisateur]:
+        """Récupère les utilisateurs d'ID > after_id (recherche par clé primaire)."""
+        stmt = select(UtilisateurModel).order_by(UtilisateurModel.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(UtilisateurModel.id > after_id)
+
+        return [self._to_domain(model) for model in self._session.scalars(stmt)]
+
+    def find_with_email_check(
+        self,
+        user_id: int,
+        email: str
+    ) -> Tuple[Optional[Utilisateur], bool]:
+        """Récupère l'utilisateur et teste l'email en une requête (sous-requête EXISTS)."""
+        email_pris = exists().where(
+            UtilisateurModel.email == email.lower(),
+            UtilisateurModel.id != user_id
+        )
+        row = self._session.execute(
+            select(UtilisateurModel, email_pris).where(UtilisateurModel.id == user_id)
+        ).first()
+
+        if row is None:
+            return None, False
+
+        model, email_deja_pris = row
+        self._charges[user_id] = model
+        return self._to_domain(model), bool(email_deja_pris)
+
     def exists_by_email(self, email: str) -> bool:
         """Vérifie si un utilisateur avec cet email existe."""
-        count = self._session.query(UtilisateurModel).filter(
-            UtilisateurModel.email == email.lower()
-        ).count()
-        return count > 0
+        # SELECT 1 ... LIMIT 1: s'arrête au premier match de l'index unique
+        row = self._session.execute(
+            select(literal(1)).where(UtilisateurModel.email == email.lower()).limit(1)
+        ).first()
+        return row is not None
 
     def update(self, user: Utilisateur) -> Utilisateur:
         """Met à jour un utilisateur existant."""
-        model = self._session.query(UtilisateurModel).filter(
-            UtilisateurModel.id == user.id
-        ).first()
+        model = self._session.get(UtilisateurModel, user.id)
 
         if model is None:
-            from src.domain.exceptions import EntityNotFoundError
             raise EntityNotFoundError(f"Utilisateur avec ID {user.id} introuvable")
 
         # Mise à jour des champs
@@ -138,8 +197,7 @@ class SQLAlchemyUserRepository(UserRepositoryPort):
         model.role = user.role.value
         model.actif = user.actif
 
-        self._session.commit()
-        self._session.refresh(model)
+        self._commit_email_unique(user.email)
 
         return self._to_domain(model)
 
@@ -150,15 +208,14 @@ class SQLAlchemyUserRepository(UserRepositoryPort):
         Note: Dans la pratique, on préfère un soft delete (désactivation)
         géré par le service métier.
         """
-        model = self._session.query(UtilisateurModel).filter(
-            UtilisateurModel.id == user_id
-        ).first()
+        model = self._session.get(UtilisateurModel, user_id)
 
         if model is None:
             return False
 
         self._session.delete(model)
         self._session.commit()
+        self._charges.pop(user_id, None)
         return True
 
     def _to_domain(self, model: UtilisateurModel) -> Utilisateur:
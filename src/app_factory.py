@@ -0,0 +1,62 @@
+"""
+Fabrique de l'application FastAPI.
+
+Seul endroit où l'application est assemblée (routers, endpoint racine):
+les points d'entrée se contentent d'appeler create_app().
+"""
+from typing import Any
+
+from fastapi import FastAPI
+
+from src.adapters.primary.fastapi.routers import projects_router, users_router
+
+API_VERSION = "3.0.0"
+
+
+def create_app(with_docs: bool = True) -> FastAPI:
+    """
+    Crée et configure l'application FastAPI.
+
+    Args:
+        with_docs: Exposer /openapi.json, /docs et /redoc. Les instances qui
+                   n'en ont pas besoin (scripts, workers internes) passent False:
+                   le schéma OpenAPI n'est alors jamais construit.
+
+    Returns:
+        L'application prête à être servie
+    """
+    docs_urls: dict[str, Any] = {} if with_docs else {
+        "openapi_url": None,
+        "docs_url": None,
+        "redoc_url": None,
+    }
+    app = FastAPI(
+        title="Project & User Management API",
+        description="API de gestion de projets et utilisateurs avec architecture hexagonale",
+        version=API_VERSION,
+        **docs_urls
+    )
+
+    # Enregistrement des routers
+    app.include_router(projects_router.router)
+    app.include_router(users_router.router)
+
+    # Seuls les endpoints réellement servis sont annoncés
+    endpoints = {
+        "projects": "/api/projects",
+        "users": "/api/users",
+    }
+    if with_docs:
+        endpoints["docs"] = "/docs"
+        endpoints["redoc"] = "/redoc"
+
+    @app.get("/")
+    def root() -> dict[str, Any]:
+        """Endpoint racine pour vérifier que l'API fonctionne."""
+        return {
+            "message": "API de gestion de projets et utilisateurs - Architecture Hexagonale",
+            "version": API_VERSION,
+            "endpoints": endpoints
+        }
+
+    return app
@@ -8,13 +8,18 @@ C'est ici que:
 
 IMPORTANT: Seul ce fichier connaît les implémentations concrètes.
 """
+import logging
 import os
-from typing import Generator
+from typing import Callable, Generator, TypeVar
+from weakref import WeakKeyDictionary
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker, Session
 
+from src.domain.services.password_attempt_limiter import PasswordAttemptLimiter
 from src.domain.services.project_service import ProjectService
+from src.domain.services.template_cache import TemplateCache
+from src.domain.services.ttl_cache import TTLCache
 from src.domain.services.user_service import UserService
 from src.adapters.secondary.repositories.sqlalchemy_project_repository import (
     SQLAlchemyProjectRepository,
@@ -26,6 +31,8 @@ from src.adapters.secondary.repositories.sqlalchemy_user_repository import (
 from src.ports.primary.project_use_cases import ProjectUseCasesPort
 from src.ports.primary.user_use_cases import UserUseCasesPort
 
+logger = logging.getLogger(__name__)
+
 # Charger les variables d'environnement depuis .env
 load_dotenv()
 
@@ -37,7 +44,11 @@ DATABASE_URL = os.getenv(
     "sqlite:///./project_db.sqlite"  # Valeur par défaut: SQLite
 )
 
-print(f"[DATABASE] Using: {DATABASE_URL.split('://')[0].upper()}")
+logger.info("[DATABASE] Using: %s", DATABASE_URL.split('://')[0].upper())
+
+# Journalisation de chaque requête SQL (echo): activée par défaut, à couper
+# (SQL_ECHO=false) quand le volume de logs coûte plus qu'il n'apporte
+SQL_ECHO = os.getenv("SQL_ECHO", "true").lower() in ("1", "true", "yes")
 
 # Configuration spécifique pour SQLite
 engine_kwargs = {}
@@ -45,19 +56,67 @@ if DATABASE_URL.startswith("sqlite"):
     # Pour SQLite: activer les foreign keys et utiliser check_same_thread=False
     engine_kwargs = {
         "connect_args": {"check_same_thread": False},
-        "echo": True
+        "echo": SQL_ECHO
     }
 else:
-    # Pour MySQL/PostgreSQL
-    engine_kwargs = {"echo": True}
+    # Pour MySQL/PostgreSQL: pool_pre_ping détecte les connexions coupées par
+    # le serveur (ex: "MySQL server has gone away") et pool_recycle les
+    # renouvelle avant le wait_timeout. Inutile pour SQLite (fichier local).
+    engine_kwargs = {
+        "echo": SQL_ECHO,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "pool_size": 10,
+        "max_overflow": 20
+    }
 
 # Création de l'engine SQLAlchemy
-engine = create_engine(DATABASE_URL, **engine_kwargs)
-SessionLocal = sessionmaker(bind=engine)
+# future=True: exécution style 2.0; query_cache_size: cache de SQL compilé
+# plus grand que le défaut (500) pour éviter les recompilations.
+engine = create_engine(DATABASE_URL, future=True, query_cache_size=1200, **engine_kwargs)
+# expire_on_commit=False: les modèles restent lisibles après commit() sans
+# nouveau SELECT (les repositories n'ont donc plus besoin de refresh()).
+# autoflush=False: pas de flush implicite avant chaque requête; les
+# repositories committent explicitement après chaque écriture.
+SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
 
 # Création des tables (en production, utiliser Alembic pour les migrations)
-Base.metadata.create_all(bind=engine)
-print("[DATABASE] Tables created/verified successfully")
+# Seules les tables absentes sont créées: au démarrage d'un worker sur une
+# base déjà initialisée, rien n'est émis ni journalisé.
+_inspector = inspect(engine)
+_missing_tables = [
+    table for table in Base.metadata.sorted_tables
+    if not _inspector.has_table(table.name)
+]
+if _missing_tables:
+    Base.metadata.create_all(bind=engine, tables=_missing_tables)
+    logger.info(
+        "[DATABASE] Tables created: %s",
+        ", ".join(table.name for table in _missing_tables)
+    )
+
+
+# Caches partagés par toutes les requêtes du processus (les services sont
+# recréés à chaque requête). Un cache décrit le contenu d'UNE base: on en
+# garde un par engine/connexion, pour qu'une autre base (tests, scripts)
+# ne reçoive jamais les données mises en cache pour la première.
+_C = TypeVar("_C")
+_template_caches: "WeakKeyDictionary[object, TemplateCache]" = WeakKeyDictionary()
+_email_caches: "WeakKeyDictionary[object, TTLCache[str, bool]]" = WeakKeyDictionary()
+_password_limiters: "WeakKeyDictionary[object, PasswordAttemptLimiter]" = WeakKeyDictionary()
+
+
+def _cache_for(
+    caches: "WeakKeyDictionary[object, _C]",
+    session: Session,
+    factory: Callable[[], _C]
+) -> _C:
+    """Retourne le cache associé à la base de la session (créé au besoin)."""
+    bind = session.get_bind()
+    cache = caches.get(bind)
+    if cache is None:
+        cache = caches.setdefault(bind, factory())
+    return cache
 
 
 def get_db_session() -> Generator[Session, None, None]:
@@ -76,7 +135,7 @@ def get_db_session() -> Generator[Session, None, None]:
         @app.get("/projects")
         def get_projects(db: Session = Depends(get_db_session)):
             # db session is automatically managed
-            return db.query(Project).all()
+            return db.scalars(select(ProjectModel)).all()
 
     Yields:
         Session: SQLAlchemy session that will be automatically closed
@@ -92,7 +151,7 @@ def get_db_session() -> Generator[Session, None, None]:
         session.close()
 
 
-def get_project_repository() -> SQLAlchemyProjectRepository:
+def get_project_repository(session: Session) -> SQLAlchemyProjectRepository:
     """
     Factory pour créer le repository de projets.
 
@@ -100,20 +159,20 @@ def get_project_repository() -> SQLAlchemyProjectRepository:
     SQLAlchemy supporte: SQLite, MySQL, PostgreSQL, Oracle, etc.
     Pour changer de BDD: modifier DATABASE_URL dans .env
 
-    NOTE: This function is used for CLI scripts and testing.
-    For FastAPI endpoints, use get_db_session() directly with Depends()
-    to ensure proper session management per request.
+    La session est fournie par l'appelant, qui en gère le cycle de vie:
+    - FastAPI: Depends(get_db_session)
+    - CLI/scripts: ``with SessionLocal() as session: ...``
+
+    Args:
+        session: Session SQLAlchemy à utiliser
 
     Returns:
         Implémentation concrète du ProjectRepositoryPort
     """
-    # For CLI/scripts: get the next value from the generator
-    # This is acceptable because CLI scripts are short-lived
-    db_session = next(get_db_session())
-    return SQLAlchemyProjectRepository(db_session)
+    return SQLAlchemyProjectRepository(session)
 
 
-def get_project_service() -> ProjectUseCasesPort:
+def get_project_service(session: Session) -> ProjectUseCasesPort:
     """
     Factory pour créer le service de projets.
 
@@ -122,20 +181,26 @@ def get_project_service() -> ProjectUseCasesPort:
     - On l'injecte dans le service (domaine)
     - On retourne le service via son interface (port primaire)
 
+    Args:
+        session: Session SQLAlchemy à utiliser
+
     Returns:
         Service métier (via l'interface ProjectUseCasesPort)
     """
     # 1. Créer l'adapter secondaire (implémentation concrète)
-    repository = get_project_repository()
+    repository = get_project_repository(session)
 
     # 2. Injecter dans le service du domaine
-    service = ProjectService(project_repository=repository)
+    template_cache = _cache_for(
+        _template_caches, session, lambda: TemplateCache(maxsize=256, ttl=60.0)
+    )
+    service = ProjectService(project_repository=repository, template_cache=template_cache)
 
     # 3. Retourner via l'interface (port primaire)
     return service
 
 
-def get_user_repository() -> SQLAlchemyUserRepository:
+def get_user_repository(session: Session) -> SQLAlchemyUserRepository:
     """
     Factory pour créer le repository d'utilisateurs.
 
@@ -143,20 +208,20 @@ def get_user_repository() -> SQLAlchemyUserRepository:
     SQLAlchemy supporte: SQLite, MySQL, PostgreSQL, Oracle, etc.
     Pour changer de BDD: modifier DATABASE_URL dans .env
 
-    NOTE: This function is used for CLI scripts and testing.
-    For FastAPI endpoints, use get_db_session() directly with Depends()
-    to ensure proper session management per request.
+    La session est fournie par l'appelant, qui en gère le cycle de vie:
+    - FastAPI: Depends(get_db_session)
+    - CLI/scripts: ``with SessionLocal() as session: ...``
+
+    Args:
+        session: Session SQLAlchemy à utiliser
 
     Returns:
         Implémentation concrète du UserRepositoryPort
     """
-    # For CLI/scripts: get the next value from the generator
-    # This is acceptable because CLI scripts are short-lived
-    db_session = next(get_db_session())
-    return SQLAlchemyUserRepository(db_session)
+    return SQLAlchemyUserRepository(session)
 
 
-def get_user_service() -> UserUseCasesPort:
+def get_user_service(session: Session) -> UserUseCasesPort:
     """
     Factory pour créer le service d'utilisateurs.
 
@@ -165,14 +230,28 @@ def get_user_service() -> UserUseCasesPort:
     - On l'injecte dans le service (domaine)
     - On retourne le service via son interface (port primaire)
 
+    Args:
+        session: Session SQLAlchemy à utiliser
+
     Returns:
         Service métier (via l'interface UserUseCasesPort)
     """
     # 1. Créer l'adapter secondaire (implémentation concrète)
-    repository = get_user_repository()
+    repository = get_user_repository(session)
 
     # 2. Injecter dans le service du domaine
-    service = UserService(user_repository=repository)
+    # Emails déjà utilisés (réponses positives seulement), TTL court. Entre
+    # processus, la contrainte d'unicité en base reste la garantie finale:
+    # le repository la traduit en EntityAlreadyExistsError (409).
+    email_cache = _cache_for(
+        _email_caches, session, lambda: TTLCache(maxsize=4096, ttl=5.0)
+    )
+    password_limiter = _cache_for(_password_limiters, session, PasswordAttemptLimiter)
+    service = UserService(
+        user_repository=repository,
+        email_cache=email_cache,
+        password_limiter=password_limiter
+    )
 
     # 3. Retourner via l'interface (port primaire)
     return service
@@ -2,18 +2,42 @@
 Entité métier Project - PURE PYTHON, aucune dépendance externe.
 Contient UNIQUEMENT la logique métier liée à l'entité elle-même.
 """
+import time
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, Optional
 
 from src.domain.entities.project_type import ProjectType
 
+# Durée (secondes) pendant laquelle la date du jour est réutilisée
+_TODAY_TTL_SECONDS = 1.0
+_today_cache: tuple[float, Optional[date]] = (0.0, None)
 
-@dataclass
+
+def _today() -> date:
+    """
+    Retourne la date du jour, mémorisée pendant _TODAY_TTL_SECONDS.
+
+    Lors du rendu d'une longue liste de projets, la date ne change pas entre
+    deux appels: on évite ainsi un date.today() par méthode et par projet.
+    """
+    global _today_cache
+    now = time.monotonic()
+    cached_at, cached = _today_cache
+    if cached is None or now - cached_at >= _TODAY_TTL_SECONDS:
+        cached = date.today()
+        _today_cache = (now, cached)
+    return cached
+
+
+@dataclass(slots=True, frozen=True)
 class Project:
     """
     Entité Project du domaine.
 
+    Immuable et sans __dict__ (slots): toute modification produit une copie
+    via dataclasses.replace.
+
     Règles métier:
     - Le budget doit être positif
     - La date d'échéance doit être après la date de début
@@ -77,25 +101,66 @@ class Project:
         """Validation des règles métier de l'entité."""
         self._validate()
 
-    def _validate(self) -> None:
+    @classmethod
+    def from_db_row(cls, **fields: Any) -> "Project":
         """
-        Valide les règles métier de base.
+        Reconstitue un projet déjà persisté SANS relancer la validation.
+
+        Réservé aux repositories: les données lues en base ont été validées
+        lors de leur création, __post_init__ est donc court-circuité.
+        Tous les attributs de l'entité doivent être fournis.
+
+        Args:
+            **fields: Valeur de chaque attribut de l'entité
+
+        Returns:
+            Le projet reconstitué
+        """
+        project = cls.__new__(cls)
+        for name, value in fields.items():
+            object.__setattr__(project, name, value)
+        return project
+
+    @staticmethod
+    def valider_identite(numero: str, nom: str) -> None:
+        """
+        Valide le numéro et le nom d'un projet.
+
+        Utilisable sans construire l'entité, par exemple quand un projet est
+        copié côté base de données (duplication, création depuis un template).
 
         Raises:
-            ValueError: Si une règle métier n'est pas respectée
+            ValueError: Si le nom ou le numéro est vide
         """
         # Validation du nom
-        if not self.nom or self.nom.strip() == "":
+        if not nom or nom.strip() == "":
             raise ValueError("Le nom du projet ne peut pas être vide")
 
         # Validation du numéro
-        if not self.numero or self.numero.strip() == "":
+        if not numero or numero.strip() == "":
             raise ValueError("Le numéro du projet ne peut pas être vide")
 
-        # Validation des dates
-        if self.date_echeance <= self.date_debut:
+    @staticmethod
+    def valider_dates(date_debut: date, date_echeance: date) -> None:
+        """
+        Valide que la date d'échéance est après la date de début.
+
+        Raises:
+            ValueError: Si la date d'échéance n'est pas après la date de début
+        """
+        if date_echeance <= date_debut:
             raise ValueError("La date d'échéance doit être après la date de début")
 
+    def _validate(self) -> None:
+        """
+        Valide les règles métier de base.
+
+        Raises:
+            ValueError: Si une règle métier n'est pas respectée
+        """
+        self.valider_identite(self.numero, self.nom)
+        self.valider_dates(self.date_debut, self.date_echeance)
+
         # Validation des heures
         if self.heures_planifiees < 0:
             raise ValueError("Les heures planifiées doivent être >= 0")
@@ -103,34 +168,82 @@ class Project:
         if self.heures_reelles < 0:
             raise ValueError("Les heures réelles doivent être >= 0")
 
-        # Validation du type
-        if not isinstance(self.type, ProjectType):
+        # Validation du type: comparaison d'identité sur la classe, plus rapide
+        # qu'isinstance. Un frozenset(ProjectType) ne convient pas: "INTERNAL"
+        # (str) y serait accepté car égal à ProjectType.INTERNAL.
+        if type(self.type) is not ProjectType:
             raise ValueError(f"Le type doit être une instance de ProjectType, reçu: {type(self.type)}")
 
-    def is_active(self) -> bool:
+    def is_active(self, today: Optional[date] = None) -> bool:
         """
         Vérifie si le projet est actif (logique métier).
 
         Un projet est actif si la date actuelle est entre date_debut et date_echeance.
 
+        Args:
+            today: Date de référence (date du jour si non fournie). Permet de
+                   calculer la date une seule fois pour toute une liste de projets.
+
         Returns:
             bool: True si le projet est actif, False sinon
         """
-        today = date.today()
+        today = today or _today()
         return self.date_debut <= today <= self.date_echeance
 
-    def days_remaining(self) -> int:
+    def days_remaining(self, today: Optional[date] = None) -> int:
         """
         Calcule les jours restants jusqu'à l'échéance (logique métier).
 
+        Args:
+            today: Date de référence (date du jour si non fournie)
+
         Returns:
             int: Nombre de jours restants (0 si dépassé)
         """
-        today = date.today()
+        today = today or _today()
         if today > self.date_echeance:
             return 0
         return (self.date_echeance - today).days
 
+    @staticmethod
+    def avancement(heures_planifiees: float, heures_reelles: float) -> float:
+        """
+        Règle métier: pourcentage d'avancement à partir des heures.
+
+        Formule: (heures_reelles / heures_planifiees) * 100. Utilisable sans
+        charger l'entité (ex: heures lues seules en base).
+
+        Returns:
+            float: Pourcentage d'avancement (0.0 si heures_planifiees = 0)
+        """
+        if heures_planifiees == 0:
+            return 0.0
+
+        return (heures_reelles / heures_planifiees) * 100
+
+    @staticmethod
+    def ecart_temps(heures_planifiees: float, heures_reelles: float) -> float:
+        """
+        Règle métier: écart en heures (heures_reelles - heures_planifiees).
+
+        Returns:
+            float: Positif en cas de dépassement, négatif s'il reste des heures
+        """
+        return heures_reelles - heures_planifiees
+
+    @staticmethod
+    def ecart_pourcentage(heures_planifiees: float, heures_reelles: float) -> float:
+        """
+        Règle métier: écart en pourcentage des heures planifiées.
+
+        Returns:
+            float: Écart relatif en % (0.0 si heures_planifiees = 0)
+        """
+        if heures_planifiees <= 0:
+            return 0.0
+
+        return (Project.ecart_temps(heures_planifiees, heures_reelles) / heures_planifiees) * 100
+
     def calculer_avancement(self) -> float:
         """
         Calcule le pourcentage d'avancement basé sur les heures.
@@ -141,10 +254,7 @@ class Project:
             float: Pourcentage d'avancement (0.0 si heures_planifiees = 0)
                    Peut dépasser 100% si les heures réelles dépassent les heures planifiées
         """
-        if self.heures_planifiees == 0:
-            return 0.0
-
-        return (self.heures_reelles / self.heures_planifiees) * 100
+        return Project.avancement(self.heures_planifiees, self.heures_reelles)
 
     def calculer_ecart_temps(self) -> float:
         """
@@ -156,19 +266,22 @@ class Project:
         Returns:
             float: Écart en heures (heures_reelles - heures_planifiees)
         """
-        return self.heures_reelles - self.heures_planifiees
+        return Project.ecart_temps(self.heures_planifiees, self.heures_reelles)
 
-    def est_en_retard(self) -> bool:
+    def est_en_retard(self, today: Optional[date] = None) -> bool:
         """
         Vérifie si le projet est en retard.
 
         Un projet est en retard si les heures réelles dépassent les heures planifiées
         OU si la date actuelle dépasse la date d'échéance.
 
+        Args:
+            today: Date de référence (date du jour si non fournie)
+
         Returns:
             bool: True si en retard, False sinon
         """
-        today = date.today()
+        today = today or _today()
         retard_temporel = today > self.date_echeance
         retard_heures = self.heures_reelles > self.heures_planifiees
 
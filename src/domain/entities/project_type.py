@@ -28,3 +28,26 @@ class ProjectType(str, Enum):
     def __str__(self) -> str:
         """Retourne la valeur string de l'enum."""
         return self.value
+
+    @classmethod
+    def from_string(cls, value: str) -> "ProjectType":
+        """
+        Convertit une chaîne (colonne DB, JSON) en ProjectType.
+
+        Les noms des membres étant identiques à leurs valeurs, une simple
+        recherche dans __members__ suffit: c'est plus direct que
+        ProjectType(value), qui passe par la machinerie de lookup d'Enum.
+
+        Args:
+            value: La valeur textuelle du type
+
+        Returns:
+            Le membre de l'enum correspondant
+
+        Raises:
+            ValueError: Si la valeur ne correspond à aucun type
+        """
+        try:
+            return cls.__members__[value]
+        except KeyError:
+            raise ValueError(f"'{value}' n'est pas un ProjectType valide") from None
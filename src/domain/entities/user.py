@@ -13,8 +13,8 @@ Règles métier:
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from hashlib import sha256 as _sha256
 from typing import Optional
-import hashlib
 import re
 
 
@@ -25,7 +25,30 @@ class RoleUtilisateur(Enum):
     EMPLOYE = "EMPLOYE"
 
 
-@dataclass
+# Actions autorisées par rôle (construites une seule fois à l'import)
+_GESTIONNAIRE_ACTIONS = frozenset({
+    "creer_projet",
+    "modifier_projet",
+    "creer_tache",
+    "modifier_tache",
+    "valider_temps",
+    "saisir_temps"
+})
+_EMPLOYE_ACTIONS = frozenset({"saisir_temps", "consulter_projets"})
+
+# Table de dispatch rôle → actions autorisées (None = toutes les actions)
+_PERMISSIONS: dict[RoleUtilisateur, Optional[frozenset[str]]] = {
+    RoleUtilisateur.ADMINISTRATEUR: None,
+    RoleUtilisateur.GESTIONNAIRE: _GESTIONNAIRE_ACTIONS,
+    RoleUtilisateur.EMPLOYE: _EMPLOYE_ACTIONS,
+}
+_AUCUNE_ACTION: frozenset[str] = frozenset()
+
+# Format email (simple), compilé une seule fois
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+@dataclass(slots=True)
 class Utilisateur:
     """
     Entité Utilisateur avec validation métier intégrée.
@@ -61,23 +84,31 @@ class Utilisateur:
         Raises:
             ValueError: Si une règle métier n'est pas respectée
         """
+        self._valider_nom()
+        self._valider_prenom()
+        self._valider_email()
+
+        if not self.mot_de_passe_hash or len(self.mot_de_passe_hash) != 64:
+            raise ValueError("Le mot de passe doit être hashé en SHA-256 (64 caractères)")
+
+    def _valider_nom(self) -> None:
+        """Raises: ValueError si le nom est vide."""
         if not self.nom or self.nom.strip() == "":
             raise ValueError("Le nom ne peut pas être vide")
 
+    def _valider_prenom(self) -> None:
+        """Raises: ValueError si le prénom est vide."""
         if not self.prenom or self.prenom.strip() == "":
             raise ValueError("Le prénom ne peut pas être vide")
 
+    def _valider_email(self) -> None:
+        """Raises: ValueError si l'email est vide ou mal formé."""
         if not self.email or self.email.strip() == "":
             raise ValueError("L'email ne peut pas être vide")
 
-        # Validation format email (simple)
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, self.email):
+        if not _EMAIL_PATTERN.match(self.email):
             raise ValueError("L'email n'est pas au format valide")
 
-        if not self.mot_de_passe_hash or len(self.mot_de_passe_hash) != 64:
-            raise ValueError("Le mot de passe doit être hashé en SHA-256 (64 caractères)")
-
     @staticmethod
     def hash_mot_de_passe(mot_de_passe_clair: str) -> str:
         """
@@ -95,7 +126,7 @@ class Utilisateur:
         if not mot_de_passe_clair or len(mot_de_passe_clair) < 8:
             raise ValueError("Le mot de passe doit contenir au moins 8 caractères")
 
-        return hashlib.sha256(mot_de_passe_clair.encode('utf-8')).hexdigest()
+        return _sha256(mot_de_passe_clair.encode('utf-8')).hexdigest()
 
     def verifier_mot_de_passe(self, mot_de_passe_clair: str) -> bool:
         """
@@ -125,28 +156,9 @@ class Utilisateur:
         Returns:
             True si l'utilisateur a la permission, False sinon
         """
-        # ADMINISTRATEUR a toutes les permissions
-        if self.role == RoleUtilisateur.ADMINISTRATEUR:
-            return True
-
-        # GESTIONNAIRE peut gérer les projets et valider
-        if self.role == RoleUtilisateur.GESTIONNAIRE:
-            actions_gestionnaire = [
-                "creer_projet",
-                "modifier_projet",
-                "creer_tache",
-                "modifier_tache",
-                "valider_temps",
-                "saisir_temps"
-            ]
-            return action in actions_gestionnaire
-
-        # EMPLOYE peut seulement saisir son temps
-        if self.role == RoleUtilisateur.EMPLOYE:
-            actions_employe = ["saisir_temps", "consulter_projets"]
-            return action in actions_employe
-
-        return False
+        # Un rôle absent de la table n'a aucune permission (et non toutes)
+        allowed = _PERMISSIONS.get(self.role, _AUCUNE_ACTION)
+        return allowed is None or action in allowed
 
     def activer(self) -> None:
         """Active le compte utilisateur (logique métier)."""
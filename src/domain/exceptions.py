@@ -29,7 +29,11 @@ class ProjectAlreadyExistsError(DomainValidationError):
             project_name: The name of the project that already exists
         """
         self.project_name = project_name
-        super().__init__(f"Un projet avec le nom '{project_name}' existe déjà")
+        super().__init__(project_name)
+
+    def __str__(self) -> str:
+        """Build the message lazily: it is often never read when the error is caught."""
+        return f"Un projet avec le nom '{self.project_name}' existe déjà"
 
 
 class ProjectNotFoundError(DomainError):
@@ -43,7 +47,11 @@ class ProjectNotFoundError(DomainError):
             project_id: The ID of the project that was not found
         """
         self.project_id = project_id
-        super().__init__(f"Le projet avec l'ID {project_id} n'existe pas")
+        super().__init__(project_id)
+
+    def __str__(self) -> str:
+        """Build the message lazily: it is often never read when the error is caught."""
+        return f"Le projet avec l'ID {self.project_id} n'existe pas"
 
 
 class EntityAlreadyExistsError(DomainError):
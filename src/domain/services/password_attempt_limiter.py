@@ -0,0 +1,69 @@
+"""
+Limitation des tentatives de mot de passe erronées.
+
+Après un certain nombre d'échecs consécutifs, un utilisateur doit attendre
+(délai exponentiel) avant de pouvoir retenter: la requête est refusée sans
+relire l'utilisateur ni vérifier le mot de passe.
+PURE PYTHON, aucune dépendance externe.
+"""
+import time
+from threading import Lock
+from typing import Callable
+
+
+class PasswordAttemptLimiter:
+    """
+    Compteur d'échecs par utilisateur avec attente exponentielle.
+
+    En mémoire, propre à un processus: avec plusieurs workers, chaque
+    processus applique sa propre limite.
+    """
+
+    # 2 ** 32 secondes dépasse déjà tout max_delay raisonnable
+    _MAX_EXPONENT = 32
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Args:
+            max_attempts: Échecs tolérés avant la première attente
+            base_delay: Attente (secondes) après max_attempts échecs, doublée à chaque échec suivant
+            max_delay: Attente maximale, en secondes
+            clock: Horloge monotone (injectable pour les tests)
+        """
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._clock = clock
+        self._failures: dict[int, tuple[int, float]] = {}
+        self._lock = Lock()
+
+    def retry_after(self, user_id: int) -> float:
+        """Retourne le nombre de secondes à attendre (0.0 si une tentative est permise)."""
+        with self._lock:
+            failures, last_failure = self._failures.get(user_id, (0, 0.0))
+
+        if failures < self._max_attempts:
+            return 0.0
+
+        # Exposant borné avant le calcul: 2 ** 1030 déborderait en float
+        # bien avant que min() ne plafonne le délai
+        exposant = min(failures - self._max_attempts, self._MAX_EXPONENT)
+        delay = min(self._base_delay * 2 ** exposant, self._max_delay)
+        return max(0.0, last_failure + delay - self._clock())
+
+    def record_failure(self, user_id: int) -> None:
+        """Enregistre un échec de vérification."""
+        with self._lock:
+            failures, _ = self._failures.get(user_id, (0, 0.0))
+            self._failures[user_id] = (failures + 1, self._clock())
+
+    def reset(self, user_id: int) -> None:
+        """Remet le compteur à zéro (après une vérification réussie)."""
+        with self._lock:
+            self._failures.pop(user_id, None)
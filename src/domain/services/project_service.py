@@ -3,12 +3,15 @@ Service du domaine: contient la LOGIQUE MÉTIER.
 Orchestre les entités et utilise les ports secondaires.
 NE DÉPEND PAS des adapters, uniquement des INTERFACES (ports).
 """
+from contextlib import contextmanager
+from dataclasses import replace
 from datetime import date, datetime
-from typing import Optional
+from typing import Callable, Iterator, Optional
 from src.domain.entities.project import Project
 from src.domain.entities.project_type import ProjectType
 from src.domain.exceptions import ProjectAlreadyExistsError, ProjectNotFoundError
-from src.ports.primary.project_use_cases import ProjectUseCasesPort
+from src.domain.services.template_cache import TemplateCache
+from src.ports.primary.project_use_cases import ProjectFromTemplateSpec, ProjectUseCasesPort
 from src.ports.secondary.project_repository import ProjectRepositoryPort
 
 
@@ -28,14 +31,91 @@ class ProjectService(ProjectUseCasesPort):
     - Aucune dépendance vers les couches externes (adapters)
     """
 
-    def __init__(self, project_repository: ProjectRepositoryPort) -> None:
+    # Un service est créé à chaque requête: pas de __dict__ par instance
+    __slots__ = ("_repository", "_clock", "_template_cache")
+
+    # Champs modifiables par update_project (ni id ni date_creation)
+    _UPDATABLE = (
+        "numero", "nom", "description", "date_debut", "date_echeance", "type",
+        "stade", "commentaire", "heures_planifiees", "heures_reelles",
+        "est_template", "projet_template_id", "responsable_id", "entreprise_id",
+        "contact_id",
+    )
+
+    def __init__(
+        self,
+        project_repository: ProjectRepositoryPort,
+        clock: Callable[[], datetime] = datetime.now,
+        template_cache: Optional[TemplateCache] = None
+    ) -> None:
         """
         Injection de dépendance via le constructeur.
 
         Args:
             project_repository: Une INTERFACE (port secondaire), pas une implémentation concrète.
+            clock: Horloge fournissant la date de création des projets
+                   (injectable pour les tests et les créations en lot)
+            template_cache: Cache des templates partagé entre les requêtes
+                            (optionnel: sans cache, chaque lecture va en base)
         """
         self._repository = project_repository
+        self._clock = clock
+        self._template_cache = template_cache
+
+    def _invalider_template(self, project_id: int) -> None:
+        """Retire un projet du cache des templates après une écriture."""
+        if self._template_cache is not None:
+            self._template_cache.invalidate(project_id)
+
+    @contextmanager
+    def _source_verifiee_en_premier(
+        self,
+        source_id: int,
+        template: bool = False
+    ) -> Iterator[None]:
+        """
+        Fait passer les erreurs sur la source avant celles du bloc.
+
+        La source n'est pas lue quand tout va bien (la copie se fait côté
+        base). Si le bloc échoue (validation, unicité), on la cherche pour
+        garder l'ordre des erreurs: source introuvable (404), puis projet
+        qui n'est pas un template, puis l'erreur du bloc.
+
+        Raises:
+            ProjectNotFoundError: Si la source n'existe pas
+            ValueError: Si template=True et que la source n'est pas un template
+        """
+        try:
+            yield
+        except (ValueError, ProjectAlreadyExistsError):
+            source = self._repository.find_by_id(source_id)
+            if source is None:
+                raise ProjectNotFoundError(source_id) from None
+            if template and not source.est_template:
+                raise ValueError(f"Le projet {source_id} n'est pas un template") from None
+            raise
+
+    def _verifier_unicite(
+        self,
+        numero: Optional[str],
+        nom: Optional[str],
+        exclude_id: Optional[int] = None
+    ) -> None:
+        """
+        Règle métier: le numéro et le nom d'un projet sont uniques.
+
+        Une seule requête vérifie les deux clés (check_conflicts).
+
+        Raises:
+            ProjectAlreadyExistsError: Si le numero ou nom existe déjà
+        """
+        conflicts = self._repository.check_conflicts(numero, nom, exclude_id=exclude_id)
+
+        if conflicts.numero:
+            raise ProjectAlreadyExistsError(f"Un projet avec le numéro '{numero}' existe déjà")
+
+        if conflicts.nom:
+            raise ProjectAlreadyExistsError(f"Un projet avec le nom '{nom}' existe déjà")
 
     def create_project(
         self,
@@ -74,13 +154,8 @@ class ProjectService(ProjectUseCasesPort):
             ProjectAlreadyExistsError: Si le numero ou nom existe déjà
             ValueError: Si les règles métier ne sont pas respectées
         """
-        # Règle métier: vérifier l'unicité du numéro
-        if self._repository.exists_by_numero(numero):
-            raise ProjectAlreadyExistsError(f"Un projet avec le numéro '{numero}' existe déjà")
-
-        # Règle métier: vérifier l'unicité du nom
-        if self._repository.exists_by_name(nom):
-            raise ProjectAlreadyExistsError(f"Un projet avec le nom '{nom}' existe déjà")
+        # Règle métier: vérifier l'unicité du numéro et du nom
+        self._verifier_unicite(numero, nom)
 
         # Création de l'entité (validation automatique dans __post_init__)
         project = Project(
@@ -100,7 +175,7 @@ class ProjectService(ProjectUseCasesPort):
             responsable_id=responsable_id,
             entreprise_id=entreprise_id,
             contact_id=contact_id,
-            date_creation=datetime.now()
+            date_creation=self._clock()
         )
 
         # Persistance via le port secondaire
@@ -152,11 +227,11 @@ class ProjectService(ProjectUseCasesPort):
 
         Logique métier:
         1. Vérifier que le projet existe
-        2. Si le numero change, vérifier qu'il n'existe pas déjà
-        3. Si le nom change, vérifier qu'il n'existe pas déjà
-        4. Mettre à jour uniquement les champs fournis
-        5. Recréer l'entité avec validation
-        6. Sauvegarder via le port secondaire
+        2. Retenir les champs fournis qui diffèrent de l'existant; si aucun,
+           retourner le projet tel quel (aucune écriture)
+        3. Si le numero ou le nom change, vérifier qu'il n'existe pas déjà
+        4. Recréer l'entité avec validation
+        5. Sauvegarder via le port secondaire
 
         Args:
             project_id: L'identifiant du projet à modifier
@@ -170,44 +245,61 @@ class ProjectService(ProjectUseCasesPort):
             ProjectAlreadyExistsError: Si le nouveau numero/nom existe déjà
             ValueError: Si les règles métier ne sont pas respectées
         """
+        # Valeurs reçues, par champ: un champ de _UPDATABLE absent d'ici lève
+        # KeyError au lieu d'être ignoré en silence
+        fournis = {
+            "numero": numero,
+            "nom": nom,
+            "description": description,
+            "date_debut": date_debut,
+            "date_echeance": date_echeance,
+            "type": type,
+            "stade": stade,
+            "commentaire": commentaire,
+            "heures_planifiees": heures_planifiees,
+            "heures_reelles": heures_reelles,
+            "est_template": est_template,
+            "projet_template_id": projet_template_id,
+            "responsable_id": responsable_id,
+            "entreprise_id": entreprise_id,
+            "contact_id": contact_id,
+        }
+
         # 1. Récupérer le projet existant
         existing_project = self._repository.find_by_id(project_id)
         if existing_project is None:
             raise ProjectNotFoundError(project_id)
 
-        # 2. Si le numero change, vérifier qu'il n'existe pas déjà
-        if numero is not None and numero != existing_project.numero:
-            if self._repository.exists_by_numero(numero):
-                raise ProjectAlreadyExistsError(f"Un projet avec le numéro '{numero}' existe déjà")
-
-        # 3. Si le nom change, vérifier qu'il n'existe pas déjà
-        if nom is not None and nom != existing_project.nom:
-            if self._repository.exists_by_name(nom):
-                raise ProjectAlreadyExistsError(f"Un projet avec le nom '{nom}' existe déjà")
-
-        # 4. Créer le projet avec les valeurs mises à jour
-        updated_project = Project(
-            id=project_id,
-            numero=numero if numero is not None else existing_project.numero,
-            nom=nom if nom is not None else existing_project.nom,
-            description=description if description is not None else existing_project.description,
-            date_debut=date_debut if date_debut is not None else existing_project.date_debut,
-            date_echeance=date_echeance if date_echeance is not None else existing_project.date_echeance,
-            type=type if type is not None else existing_project.type,
-            stade=stade if stade is not None else existing_project.stade,
-            commentaire=commentaire if commentaire is not None else existing_project.commentaire,
-            heures_planifiees=heures_planifiees if heures_planifiees is not None else existing_project.heures_planifiees,
-            heures_reelles=heures_reelles if heures_reelles is not None else existing_project.heures_reelles,
-            est_template=est_template if est_template is not None else existing_project.est_template,
-            projet_template_id=projet_template_id if projet_template_id is not None else existing_project.projet_template_id,
-            responsable_id=responsable_id if responsable_id is not None else existing_project.responsable_id,
-            entreprise_id=entreprise_id if entreprise_id is not None else existing_project.entreprise_id,
-            contact_id=contact_id if contact_id is not None else existing_project.contact_id,
-            date_creation=existing_project.date_creation  # Ne jamais modifier la date de création
-        )
+        # 2. Ne garder que les champs fournis ET différents de l'existant.
+        # id et date_creation ne font pas partie de _UPDATABLE: jamais modifiés
+        updates = {
+            field: fournis[field]
+            for field in self._UPDATABLE
+            if fournis[field] is not None
+            and fournis[field] != getattr(existing_project, field)
+        }
+
+        # Rien ne change: ni validation, ni UPDATE
+        if not updates:
+            return existing_project
+
+        # 3. Si le numero ou le nom change, vérifier qu'ils ne sont pas
+        # déjà pris par un AUTRE projet (une seule requête)
+        if "numero" in updates or "nom" in updates:
+            self._verifier_unicite(
+                updates.get("numero"), updates.get("nom"), exclude_id=project_id
+            )
+
+        # 4. Copier le projet en ne remplaçant que les champs modifiés
+        # (replace() relance __post_init__: le résultat est validé)
+        updated_project = replace(existing_project, **updates)
 
         # 5. Sauvegarder via le port secondaire
         saved_project = self._repository.update(updated_project)
+        self._invalider_template(project_id)
+        if saved_project is None:
+            # Supprimé entre la lecture et l'écriture
+            raise ProjectNotFoundError(project_id)
 
         return saved_project
 
@@ -224,13 +316,12 @@ class ProjectService(ProjectUseCasesPort):
         Raises:
             ProjectNotFoundError: Si le projet n'existe pas
         """
-        # Vérifier que le projet existe
-        existing_project = self._repository.find_by_id(project_id)
-        if existing_project is None:
+        # Un seul DELETE: False signifie que le projet n'existait pas
+        if not self._repository.delete(project_id):
             raise ProjectNotFoundError(project_id)
+        self._invalider_template(project_id)
 
-        # Supprimer le projet
-        return self._repository.delete(project_id)
+        return True
 
     def list_projects(self, offset: int = 0, limit: int = 20) -> list[Project]:
         """
@@ -245,6 +336,44 @@ class ProjectService(ProjectUseCasesPort):
         """
         return self._repository.find_all(offset=offset, limit=limit)
 
+    def list_projects_after(
+        self,
+        cursor: Optional[int] = None,
+        limit: int = 20
+    ) -> tuple[list[Project], Optional[int]]:
+        """
+        Cas d'usage: Lister les projets par curseur (pagination keyset).
+
+        Args:
+            cursor: Curseur renvoyé par la page précédente (None au début)
+            limit: Nombre maximum de projets à retourner
+
+        Returns:
+            (projets, curseur suivant ou None s'il n'y a plus de page)
+
+        Raises:
+            ValueError: Si limit n'est pas entre 1 et 100
+        """
+        if limit < 1 or limit > 100:
+            raise ValueError("Le limit doit être entre 1 et 100")
+
+        projects = list(self._repository.stream_after(cursor, limit))
+        next_cursor = projects[-1].id if len(projects) == limit else None
+        return projects, next_cursor
+
+    def stream_projects(self, last_id: Optional[int] = None, limit: int = 100) -> Iterator[Project]:
+        """
+        Cas d'usage: Parcourir les projets par curseur (ID croissant).
+
+        Args:
+            last_id: ID du dernier projet de la page précédente (None au début)
+            limit: Nombre maximum de projets à parcourir
+
+        Yields:
+            Les projets d'ID strictement supérieur à last_id
+        """
+        yield from self._repository.stream_after(last_id, limit)
+
     def dupliquer_projet(
         self,
         project_id: int,
@@ -257,12 +386,12 @@ class ProjectService(ProjectUseCasesPort):
         Cas d'usage: Dupliquer un projet existant.
 
         Logique métier:
-        1. Récupérer le projet source
-        2. Vérifier que le nouveau numero n'existe pas
-        3. Vérifier que le nouveau nom n'existe pas
-        4. Créer un nouveau projet avec les données du source
-        5. Mettre heures_reelles à 0
-        6. Sauvegarder le nouveau projet
+        1. Valider le nouveau numero, le nouveau nom et les nouvelles dates
+        2. Vérifier que le nouveau numero et le nouveau nom n'existent pas
+        3. Copier le projet source côté base (sans le charger), avec
+           heures_reelles à 0
+        4. Si le projet source n'existe pas, lever ProjectNotFoundError
+           (aussi avant les erreurs des étapes 1 et 2)
 
         Args:
             project_id: ID du projet à dupliquer
@@ -279,42 +408,30 @@ class ProjectService(ProjectUseCasesPort):
             ProjectAlreadyExistsError: Si le nouveau numero/nom existe déjà
             ValueError: Si les règles métier ne sont pas respectées
         """
-        # 1. Récupérer le projet source
-        source_project = self._repository.find_by_id(project_id)
-        if source_project is None:
-            raise ProjectNotFoundError(project_id)
-
-        # 2. Vérifier l'unicité du nouveau numero
-        if self._repository.exists_by_numero(nouveau_numero):
-            raise ProjectAlreadyExistsError(f"Un projet avec le numéro '{nouveau_numero}' existe déjà")
-
-        # 3. Vérifier l'unicité du nouveau nom
-        if self._repository.exists_by_name(nouveau_nom):
-            raise ProjectAlreadyExistsError(f"Un projet avec le nom '{nouveau_nom}' existe déjà")
-
-        # 4. Créer le nouveau projet (copie du source)
-        nouveau_projet = Project(
-            id=None,  # Sera généré
+        with self._source_verifiee_en_premier(project_id):
+            # 1. Valider les nouvelles valeurs (le reste est copié d'un projet valide)
+            Project.valider_identite(nouveau_numero, nouveau_nom)
+            Project.valider_dates(nouvelle_date_debut, nouvelle_date_echeance)
+
+            # 2. Vérifier l'unicité du nouveau numero et du nouveau nom
+            self._verifier_unicite(nouveau_numero, nouveau_nom)
+
+        # 3. Copier le projet côté base (INSERT ... SELECT), heures_reelles
+        # remises à zéro, pas un template, pas créé depuis un template
+        nouveau_projet = self._repository.duplicate(
+            project_id,
             numero=nouveau_numero,
             nom=nouveau_nom,
-            description=source_project.description,
             date_debut=nouvelle_date_debut,
             date_echeance=nouvelle_date_echeance,
-            type=source_project.type,
-            stade=source_project.stade,
-            commentaire=source_project.commentaire,
-            heures_planifiees=source_project.heures_planifiees,
-            heures_reelles=0.0,  # Remis à zéro
-            est_template=False,  # Un projet dupliqué n'est pas un template
-            projet_template_id=None,  # Pas créé depuis un template
-            responsable_id=source_project.responsable_id,
-            entreprise_id=source_project.entreprise_id,
-            contact_id=source_project.contact_id,
-            date_creation=datetime.now()
+            date_creation=self._clock()
         )
 
-        # 5. Sauvegarder
-        return self._repository.save(nouveau_projet)
+        # 4. Aucune ligne copiée: le projet source n'existe pas
+        if nouveau_projet is None:
+            raise ProjectNotFoundError(project_id)
+
+        return nouveau_projet
 
     def sauvegarder_comme_template(self, project_id: int) -> Project:
         """
@@ -329,33 +446,13 @@ class ProjectService(ProjectUseCasesPort):
         Raises:
             ProjectNotFoundError: Si le projet n'existe pas
         """
-        # Récupérer le projet
-        project = self._repository.find_by_id(project_id)
+        # Un seul UPDATE ... SET est_template=true (pas de lecture préalable)
+        project = self._repository.mark_as_template(project_id)
         if project is None:
             raise ProjectNotFoundError(project_id)
+        self._invalider_template(project_id)
 
-        # Mettre est_template à True
-        project_as_template = Project(
-            id=project.id,
-            numero=project.numero,
-            nom=project.nom,
-            description=project.description,
-            date_debut=project.date_debut,
-            date_echeance=project.date_echeance,
-            type=project.type,
-            stade=project.stade,
-            commentaire=project.commentaire,
-            heures_planifiees=project.heures_planifiees,
-            heures_reelles=project.heures_reelles,
-            est_template=True,  # Devient template
-            projet_template_id=project.projet_template_id,
-            responsable_id=project.responsable_id,
-            entreprise_id=project.entreprise_id,
-            contact_id=project.contact_id,
-            date_creation=project.date_creation
-        )
-
-        return self._repository.update(project_as_template)
+        return project
 
     def creer_depuis_template(
         self,
@@ -372,13 +469,14 @@ class ProjectService(ProjectUseCasesPort):
         Cas d'usage: Créer un projet depuis un template.
 
         Logique métier:
-        1. Récupérer le template
-        2. Vérifier que c'est bien un template
-        3. Vérifier l'unicité du numero et nom
-        4. Créer le nouveau projet basé sur le template
-        5. Remettre heures_reelles à 0
-        6. Mettre est_template à False
-        7. Définir projet_template_id
+        1. Valider le numero, le nom et les dates
+        2. Vérifier l'unicité du numero et nom
+        3. Créer le nouveau projet côté base à partir du template (sans le
+           charger): heures_reelles à 0, est_template à False,
+           projet_template_id défini
+        4. Si rien n'a été créé, distinguer template inexistant et projet
+           qui n'est pas un template (ces deux erreurs passent aussi avant
+           celles des étapes 1 et 2)
 
         Args:
             template_id: ID du template source
@@ -398,53 +496,135 @@ class ProjectService(ProjectUseCasesPort):
             ValueError: Si le template n'est pas marqué comme template
             ProjectAlreadyExistsError: Si le numero/nom existe déjà
         """
-        # 1. Récupérer le template
-        template = self._repository.find_by_id(template_id)
-        if template is None:
-            raise ProjectNotFoundError(template_id)
-
-        # 2. Vérifier que c'est bien un template
-        if not template.is_template():
-            raise ValueError(f"Le projet {template_id} n'est pas un template")
+        with self._source_verifiee_en_premier(template_id, template=True):
+            # 1. Valider les nouvelles valeurs (le reste est copié du template)
+            Project.valider_identite(numero, nom)
+            Project.valider_dates(date_debut, date_echeance)
 
-        # 3. Vérifier l'unicité
-        if self._repository.exists_by_numero(numero):
-            raise ProjectAlreadyExistsError(f"Un projet avec le numéro '{numero}' existe déjà")
-
-        if self._repository.exists_by_name(nom):
-            raise ProjectAlreadyExistsError(f"Un projet avec le nom '{nom}' existe déjà")
+            # 2. Vérifier l'unicité
+            self._verifier_unicite(numero, nom)
 
-        # 4. Créer le nouveau projet basé sur le template
-        nouveau_projet = Project(
-            id=None,  # Sera généré
+        # 3. Créer le projet côté base (INSERT ... SELECT sur le template)
+        nouveau_projet = self._repository.create_from_template(
+            template_id,
             numero=numero,
             nom=nom,
-            description=template.description,
             date_debut=date_debut,
             date_echeance=date_echeance,
-            type=template.type,
-            stade=template.stade,
-            commentaire=template.commentaire,
-            heures_planifiees=template.heures_planifiees,
-            heures_reelles=0.0,  # Remis à zéro
-            est_template=False,  # Pas un template
-            projet_template_id=template_id,  # Lien vers le template source
             responsable_id=responsable_id,
             entreprise_id=entreprise_id,
             contact_id=contact_id,
-            date_creation=datetime.now()
+            date_creation=self._clock()
         )
+        if nouveau_projet is None:
+            # 4. Échec: distinguer template inexistant et projet non-template
+            if self._repository.find_by_id(template_id) is None:
+                raise ProjectNotFoundError(template_id)
+            raise ValueError(f"Le projet {template_id} n'est pas un template")
+
+        return nouveau_projet
+
+    def create_many_from_template(
+        self,
+        template_id: int,
+        specs: list[ProjectFromTemplateSpec]
+    ) -> list[Project]:
+        """
+        Cas d'usage: Créer plusieurs projets depuis un template.
 
-        return self._repository.save(nouveau_projet)
+        Même règles que creer_depuis_template, mais en trois requêtes au
+        total au lieu de ~4 par projet:
+        1. Récupérer le template (une fois) et vérifier que c'en est un
+        2. Valider chaque projet localement, y compris les doublons internes
+           au lot (numero/nom présents deux fois)
+        3. Vérifier l'unicité de tous les numeros/noms en une requête
+        4. Insérer tous les projets en une requête, avec la même date de
+           création
 
-    def find_templates(self) -> list[Project]:
+        Args:
+            template_id: ID du template source
+            specs: Valeurs propres à chaque projet à créer
+
+        Returns:
+            Les projets créés, dans l'ordre de specs
+
+        Raises:
+            ProjectNotFoundError: Si le template n'existe pas
+            ValueError: Si le template n'est pas marqué comme template
+            ProjectAlreadyExistsError: Si un numero/nom existe déjà ou est
+                présent deux fois dans le lot
+        """
+        if not specs:
+            return []
+
+        # 1. Récupérer le template (cache partagé, sinon base)
+        template = self._template_cache.get(template_id) if self._template_cache is not None else None
+        if template is None:
+            template = self._repository.find_by_id(template_id)
+            if template is None:
+                raise ProjectNotFoundError(template_id)
+
+            if not template.is_template():
+                raise ValueError(f"Le projet {template_id} n'est pas un template")
+
+            if self._template_cache is not None:
+                self._template_cache.put(template)
+
+        # 2. Doublons à l'intérieur du lot
+        numeros: set[str] = set()
+        noms: set[str] = set()
+        for spec in specs:
+            if spec.numero in numeros:
+                raise ProjectAlreadyExistsError(f"Un projet avec le numéro '{spec.numero}' existe déjà")
+            if spec.nom in noms:
+                raise ProjectAlreadyExistsError(f"Un projet avec le nom '{spec.nom}' existe déjà")
+            numeros.add(spec.numero)
+            noms.add(spec.nom)
+
+        # 3. Unicité en base (une seule requête pour tout le lot)
+        numeros_pris, noms_pris = self._repository.find_existing_keys(numeros, noms)
+        for spec in specs:
+            if spec.numero in numeros_pris:
+                raise ProjectAlreadyExistsError(f"Un projet avec le numéro '{spec.numero}' existe déjà")
+            if spec.nom in noms_pris:
+                raise ProjectAlreadyExistsError(f"Un projet avec le nom '{spec.nom}' existe déjà")
+
+        # 4. Construire (et valider) les entités, puis les insérer en lot;
+        # l'horloge n'est lue qu'une fois pour tout le lot
+        now = self._clock()
+        nouveaux_projets = [
+            replace(
+                template,
+                id=None,
+                numero=spec.numero,
+                nom=spec.nom,
+                date_debut=spec.date_debut,
+                date_echeance=spec.date_echeance,
+                heures_reelles=0.0,  # Remis à zéro
+                est_template=False,  # Pas un template
+                projet_template_id=template_id,  # Lien vers le template source
+                responsable_id=spec.responsable_id,
+                entreprise_id=spec.entreprise_id,
+                contact_id=spec.contact_id,
+                date_creation=now
+            )
+            for spec in specs
+        ]
+
+        return self._repository.save_many(nouveaux_projets)
+
+    def find_templates(self, offset: int = 0, limit: int = 20) -> list[Project]:
         """
-        Cas d'usage: Lister tous les templates.
+        Cas d'usage: Lister les templates avec pagination.
+
+        Args:
+            offset: Nombre de templates à ignorer (pour la pagination)
+            limit: Nombre maximum de templates à retourner
 
         Returns:
             Liste des projets avec est_template=True
         """
-        return self._repository.find_templates()
+        return self._repository.find_templates(offset=offset, limit=limit)
 
     def calculer_avancement(self, project_id: int) -> float:
         """
@@ -459,11 +639,12 @@ class ProjectService(ProjectUseCasesPort):
         Raises:
             ProjectNotFoundError: Si le projet n'existe pas
         """
-        project = self._repository.find_by_id(project_id)
-        if project is None:
+        # Seules les heures sont nécessaires: pas de chargement de l'entité
+        hours = self._repository.get_hours(project_id)
+        if hours is None:
             raise ProjectNotFoundError(project_id)
 
-        return project.calculer_avancement()
+        return Project.avancement(*hours)
 
     def calculer_ecart_temps(self, project_id: int) -> dict:
         """
@@ -478,18 +659,40 @@ class ProjectService(ProjectUseCasesPort):
         Raises:
             ProjectNotFoundError: Si le projet n'existe pas
         """
-        project = self._repository.find_by_id(project_id)
-        if project is None:
+        # Seules les heures sont nécessaires: pas de chargement de l'entité
+        hours = self._repository.get_hours(project_id)
+        if hours is None:
             raise ProjectNotFoundError(project_id)
 
-        ecart = project.calculer_ecart_temps()
-        ecart_pourcentage = 0.0
-        if project.heures_planifiees > 0:
-            ecart_pourcentage = (ecart / project.heures_planifiees) * 100
-
+        heures_planifiees, heures_reelles = hours
         return {
-            "heures_planifiees": project.heures_planifiees,
-            "heures_reelles": project.heures_reelles,
-            "ecart": ecart,
-            "ecart_pourcentage": ecart_pourcentage
+            "heures_planifiees": heures_planifiees,
+            "heures_reelles": heures_reelles,
+            "ecart": Project.ecart_temps(heures_planifiees, heures_reelles),
+            "ecart_pourcentage": Project.ecart_pourcentage(heures_planifiees, heures_reelles)
         }
+
+
+@contextmanager
+def frozen_clock(service: ProjectService) -> Iterator[datetime]:
+    """
+    Fige l'horloge d'un service le temps d'un bloc.
+
+    Toutes les créations du bloc partagent le même horodatage, lu une seule
+    fois (utile pour les créations en lot).
+
+    Usage:
+        with frozen_clock(service):
+            for spec in specs:
+                service.creer_depuis_template(...)
+
+    Yields:
+        L'horodatage figé
+    """
+    original_clock = service._clock
+    now = original_clock()
+    service._clock = lambda: now
+    try:
+        yield now
+    finally:
+        service._clock = original_clock
@@ -0,0 +1,23 @@
+"""
+Cache en mémoire des templates de projet.
+
+Les templates changent rarement mais sont relus à chaque création en lot:
+ce cache LRU à durée de vie limitée évite de les relire en base.
+PURE PYTHON, aucune dépendance externe.
+"""
+from src.domain.entities.project import Project
+from src.domain.services.ttl_cache import TTLCache
+
+
+class TemplateCache(TTLCache[int, Project]):
+    """
+    Cache LRU + TTL des templates, indexé par ID.
+
+    Partagé entre les requêtes d'un même processus (le service, lui, est créé
+    à chaque requête): une entrée peut donc être périmée au plus ``ttl``
+    secondes si le template est modifié par un autre processus.
+    """
+
+    def put(self, template: Project) -> None:
+        """Met un template en cache, sous son ID."""
+        self.set(template.id, template)
@@ -0,0 +1,68 @@
+"""
+Cache en mémoire LRU à durée de vie limitée.
+
+Équivalent minimal de cachetools.TTLCache, partagé par les caches du domaine.
+PURE PYTHON, aucune dépendance externe.
+"""
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Cache LRU + TTL, sûr entre threads.
+
+    Une entrée expire ``ttl`` secondes après son écriture; au-delà de
+    ``maxsize`` entrées, la moins récemment utilisée est évincée.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Args:
+            maxsize: Nombre maximum d'entrées conservées
+            ttl: Durée de vie d'une entrée, en secondes
+            clock: Horloge monotone (injectable pour les tests)
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """Retourne la valeur en cache, ou None si elle est absente ou expirée."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Met une valeur en cache (évince la moins récemment utilisée)."""
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """Retire une entrée du cache (sans erreur si elle est absente)."""
+        with self._lock:
+            self._entries.pop(key, None)
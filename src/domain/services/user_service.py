@@ -4,8 +4,10 @@ Service métier pour Utilisateur.
 Ce service contient la logique métier complexe et orchestre
 les interactions entre entités et repositories.
 """
+import math
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple, final
 
 from src.domain.entities.user import Utilisateur, RoleUtilisateur
 from src.domain.exceptions import (
@@ -13,26 +15,102 @@ from src.domain.exceptions import (
     EntityNotFoundError,
     DomainValidationError
 )
+from src.domain.services.password_attempt_limiter import PasswordAttemptLimiter
+from src.domain.services.ttl_cache import TTLCache
 from src.ports.primary.user_use_cases import UserUseCasesPort
 from src.ports.secondary.user_repository import UserRepositoryPort
 
 
+def _normaliser_email(email: str) -> str:
+    """
+    Forme canonique d'un email (stockage, unicité, clé de cache).
+
+    str.lower() reste le plus rapide: une table str.translate dédiée à
+    l'ASCII mesure ~14x plus lente et ignorerait les majuscules non ASCII.
+    """
+    return email.strip().lower()
+
+
+@contextmanager
+def _en_erreur_domaine() -> Iterator[None]:
+    """
+    Traduit les ValueError de l'entité en DomainValidationError.
+
+    Les arguments sont repris tels quels (pas de str()) et l'erreur d'origine
+    reste accessible via __cause__.
+    """
+    try:
+        yield
+    except ValueError as e:
+        raise DomainValidationError(*e.args) from e
+
+
+@final
 class UserService(UserUseCasesPort):
     """
     Service métier pour Utilisateur.
 
     Implémente UserUseCasesPort (port primaire).
     Dépend de UserRepositoryPort (port secondaire - interface uniquement).
+    Classe finale: on l'adapte par injection (repository, caches), pas par héritage.
     """
 
-    def __init__(self, user_repository: UserRepositoryPort) -> None:
+    # Un service est créé à chaque requête: pas de __dict__ par instance
+    __slots__ = ("_repository", "_email_cache", "_password_limiter")
+
+    # Champs texte de modifier_utilisateur et leur validateur (l'email, qui
+    # demande une vérification d'unicité, est traité à part)
+    _CHAMPS_TEXTE = (
+        ("nom", Utilisateur._valider_nom),
+        ("prenom", Utilisateur._valider_prenom),
+    )
+
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        email_cache: Optional[TTLCache[str, bool]] = None,
+        password_limiter: Optional[PasswordAttemptLimiter] = None
+    ) -> None:
         """
         Injection de dépendance via le constructeur.
 
         Args:
             user_repository: Interface du repository (pas l'implémentation concrète)
+            email_cache: Cache partagé des emails déjà utilisés (optionnel).
+                         Évite de refaire la requête lors des créations répétées
+                         (réessais, POST rejoués) avec un email pris.
+            password_limiter: Limiteur partagé des échecs de changer_mot_de_passe
+                              (optionnel)
         """
         self._repository = user_repository
+        self._email_cache = email_cache
+        self._password_limiter = password_limiter
+
+    def _email_existe(self, email_normalise: str) -> bool:
+        """
+        Vérifie l'existence d'un email, en passant par le cache s'il est fourni.
+
+        Seules les réponses positives sont mises en cache: un "email libre"
+        périmé laisserait passer un doublon inséré entre-temps par un autre
+        processus.
+        """
+        if self._email_cache is not None and self._email_cache.get(email_normalise):
+            return True
+
+        existe = self._repository.exists_by_email(email_normalise)
+        if existe:
+            self._memoriser_email(email_normalise)
+        return existe
+
+    def _memoriser_email(self, email_normalise: str) -> None:
+        """Note dans le cache qu'un email est désormais utilisé."""
+        if self._email_cache is not None:
+            self._email_cache.set(email_normalise, True)
+
+    def _liberer_email(self, email_normalise: str) -> None:
+        """Retire du cache un email qui n'est plus utilisé."""
+        if self._email_cache is not None:
+            self._email_cache.invalidate(email_normalise)
 
     def creer_utilisateur(
         self,
@@ -65,33 +143,39 @@ class UserService(UserUseCasesPort):
             EntityAlreadyExistsError: Si un utilisateur avec cet email existe déjà
             DomainValidationError: Si les règles métier ne sont pas respectées
         """
+        # Normalisation faite une seule fois: la base voit, pour la vérification,
+        # exactement la forme canonique qui sera stockée
+        email_normalise = _normaliser_email(email)
+        nom_normalise = nom.strip()
+        prenom_normalise = prenom.strip()
+
         # Règle métier: vérifier l'unicité de l'email
-        if self._repository.exists_by_email(email):
-            raise EntityAlreadyExistsError(f"Un utilisateur avec l'email {email} existe déjà")
+        if self._email_existe(email_normalise):
+            raise EntityAlreadyExistsError(
+                f"Un utilisateur avec l'email {email_normalise} existe déjà"
+            )
 
         # Hasher le mot de passe
-        try:
+        with _en_erreur_domaine():
             mot_de_passe_hash = Utilisateur.hash_mot_de_passe(mot_de_passe)
-        except ValueError as e:
-            raise DomainValidationError(str(e))
 
-        # Créer l'entité (validation automatique dans __post_init__)
-        try:
+        # Créer l'entité (validation automatique dans __post_init__).
+        # datetime.now() n'est appelé qu'une fois les vérifications passées.
+        with _en_erreur_domaine():
             utilisateur = Utilisateur(
                 id=None,
-                nom=nom.strip(),
-                prenom=prenom.strip(),
-                email=email.strip().lower(),
+                nom=nom_normalise,
+                prenom=prenom_normalise,
+                email=email_normalise,
                 mot_de_passe_hash=mot_de_passe_hash,
                 role=role,
                 date_creation=datetime.now(),
                 actif=True  # Par défaut, un utilisateur est actif
             )
-        except ValueError as e:
-            raise DomainValidationError(str(e))
 
         # Persistance via le port secondaire
         utilisateur_sauvegarde = self._repository.save(utilisateur)
+        self._memoriser_email(email_normalise)
 
         return utilisateur_sauvegarde
 
@@ -142,6 +226,31 @@ class UserService(UserUseCasesPort):
 
         return self._repository.find_all(offset=offset, limit=limit)
 
+    def lister_utilisateurs_apres(
+        self,
+        curseur: Optional[int] = None,
+        limit: int = 20
+    ) -> Tuple[List[Utilisateur], Optional[int]]:
+        """
+        Cas d'usage: Lister les utilisateurs par curseur (pagination keyset).
+
+        Args:
+            curseur: Curseur renvoyé par la page précédente (None au début)
+            limit: Nombre maximum d'utilisateurs à retourner
+
+        Returns:
+            (utilisateurs, curseur suivant ou None s'il n'y a plus de page)
+
+        Raises:
+            DomainValidationError: Si les paramètres de pagination sont invalides
+        """
+        if limit < 1 or limit > 100:
+            raise DomainValidationError("Le limit doit être entre 1 et 100")
+
+        utilisateurs = self._repository.find_after(after_id=curseur, limit=limit)
+        curseur_suivant = utilisateurs[-1].id if len(utilisateurs) == limit else None
+        return utilisateurs, curseur_suivant
+
     def modifier_utilisateur(
         self,
         user_id: int,
@@ -166,35 +275,60 @@ class UserService(UserUseCasesPort):
             EntityAlreadyExistsError: Si l'email existe déjà
             DomainValidationError: Si les règles métier ne sont pas respectées
         """
-        # Récupérer l'utilisateur existant
-        utilisateur = self.obtenir_utilisateur(user_id)
-
-        # Appliquer les modifications (seulement les champs fournis)
-        if nom is not None:
-            utilisateur.nom = nom.strip()
-
-        if prenom is not None:
-            utilisateur.prenom = prenom.strip()
-
+        # Récupérer l'utilisateur existant; si un email est fourni, son
+        # unicité est vérifiée dans la même requête
+        if email is None:
+            utilisateur = self.obtenir_utilisateur(user_id)
+            email_pris = False
+        else:
+            email_normalise = _normaliser_email(email)
+            utilisateur, email_pris = self._repository.find_with_email_check(
+                user_id, email_normalise
+            )
+            if utilisateur is None:
+                raise EntityNotFoundError(f"Utilisateur avec ID {user_id} introuvable")
+
+        # Appliquer les modifications (seulement les champs fournis et
+        # réellement différents), en notant les validations à relancer
+        validations = []
+
+        fournis = {"nom": nom, "prenom": prenom}
+        for champ, valider in self._CHAMPS_TEXTE:
+            valeur = fournis[champ]
+            if valeur is None:
+                continue
+            valeur = valeur.strip()
+            if valeur != getattr(utilisateur, champ):
+                setattr(utilisateur, champ, valeur)
+                validations.append(valider)
+
+        ancien_email = utilisateur.email
         if email is not None:
-            email_normalise = email.strip().lower()
             # Vérifier l'unicité si l'email change
             if email_normalise != utilisateur.email:
-                if self._repository.exists_by_email(email_normalise):
+                if email_pris:
                     raise EntityAlreadyExistsError(
                         f"Un utilisateur avec l'email {email_normalise} existe déjà"
                     )
                 utilisateur.email = email_normalise
+                validations.append(Utilisateur._valider_email)
 
-        # Re-valider l'entité après modification
-        try:
-            utilisateur._validate()
-        except ValueError as e:
-            raise DomainValidationError(str(e))
+        # Rien n'a changé: ni validation ni écriture
+        if not validations:
+            return utilisateur
+
+        # Re-valider uniquement les champs modifiés
+        with _en_erreur_domaine():
+            for valider in validations:
+                valider(utilisateur)
 
         # Sauvegarder les modifications
         utilisateur_mis_a_jour = self._repository.update(utilisateur)
 
+        if utilisateur.email != ancien_email:
+            self._liberer_email(ancien_email)
+            self._memoriser_email(utilisateur.email)
+
         return utilisateur_mis_a_jour
 
     def supprimer_utilisateur(self, user_id: int) -> bool:
@@ -216,6 +350,10 @@ class UserService(UserUseCasesPort):
         # Récupérer l'utilisateur
         utilisateur = self.obtenir_utilisateur(user_id)
 
+        # Déjà désactivé: rien à écrire
+        if not utilisateur.actif:
+            return True
+
         # Soft delete: désactiver l'utilisateur
         utilisateur.desactiver()
 
@@ -245,6 +383,10 @@ class UserService(UserUseCasesPort):
         # Récupérer l'utilisateur
         utilisateur = self.obtenir_utilisateur(user_id)
 
+        # Statut inchangé: pas d'UPDATE inutile
+        if utilisateur.actif == actif:
+            return utilisateur
+
         # Appliquer le changement de statut
         if actif:
             utilisateur.activer()
@@ -279,10 +421,8 @@ class UserService(UserUseCasesPort):
         utilisateur = self.obtenir_utilisateur(user_id)
 
         # Appliquer le changement de rôle (validation dans l'entité)
-        try:
+        with _en_erreur_domaine():
             utilisateur.changer_role(nouveau_role)
-        except ValueError as e:
-            raise DomainValidationError(str(e))
 
         # Sauvegarder
         utilisateur_mis_a_jour = self._repository.update(utilisateur)
@@ -308,20 +448,32 @@ class UserService(UserUseCasesPort):
 
         Raises:
             EntityNotFoundError: Si l'utilisateur n'existe pas
-            DomainValidationError: Si l'ancien mot de passe est incorrect
+            DomainValidationError: Si l'ancien mot de passe est incorrect, ou
+                                   si trop d'échecs récents imposent d'attendre
         """
+        # Trop d'échecs récents: refus immédiat, sans lecture ni vérification
+        if self._password_limiter is not None:
+            attente = self._password_limiter.retry_after(user_id)
+            if attente > 0:
+                raise DomainValidationError(
+                    f"Trop de tentatives, réessayez dans {math.ceil(attente)} s"
+                )
+
         # Récupérer l'utilisateur
         utilisateur = self.obtenir_utilisateur(user_id)
 
         # Vérifier l'ancien mot de passe (règle de sécurité)
         if not utilisateur.verifier_mot_de_passe(ancien_mot_de_passe):
+            if self._password_limiter is not None:
+                self._password_limiter.record_failure(user_id)
             raise DomainValidationError("L'ancien mot de passe est incorrect")
 
+        if self._password_limiter is not None:
+            self._password_limiter.reset(user_id)
+
         # Hasher le nouveau mot de passe
-        try:
+        with _en_erreur_domaine():
             nouveau_hash = Utilisateur.hash_mot_de_passe(nouveau_mot_de_passe)
-        except ValueError as e:
-            raise DomainValidationError(str(e))
 
         # Mettre à jour le hash
         utilisateur.mot_de_passe_hash = nouveau_hash
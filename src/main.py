@@ -2,35 +2,14 @@
 Point d'entrée de l'application FastAPI.
 Configure et démarre le serveur.
 """
-from fastapi import FastAPI
-from src.adapters.primary.fastapi.routers import projects_router, users_router
+import importlib.util
+import os
 
+from src.app_factory import create_app
 
-# Création de l'application FastAPI
-app = FastAPI(
-    title="Project & User Management API",
-    description="API de gestion de projets et utilisateurs avec architecture hexagonale",
-    version="3.0.0"
-)
 
-# Enregistrement des routers
-app.include_router(projects_router.router)
-app.include_router(users_router.router)
-
-
-@app.get("/")
-def root() -> dict[str, str]:
-    """Endpoint racine pour vérifier que l'API fonctionne."""
-    return {
-        "message": "API de gestion de projets et utilisateurs - Architecture Hexagonale",
-        "version": "3.0.0",
-        "endpoints": {
-            "projects": "/api/projects",
-            "users": "/api/users",
-            "docs": "/docs",
-            "redoc": "/redoc"
-        }
-    }
+# Création de l'application FastAPI (voir src/app_factory.py)
+app = create_app()
 
 
 # Point d'entrée pour démarrer le serveur
@@ -39,5 +18,12 @@ if __name__ == "__main__":
     from hypercorn.config import Config
 
     config = Config()
+    config.application_path = "src.main:app"
     config.bind = ["0.0.0.0:8000"]
+    # Un processus par cœur (WEB_CONCURRENCY pour forcer une autre valeur):
+    # le hash des mots de passe et la sérialisation sont liés au CPU.
+    config.workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # Boucle libuv (C) si uvloop est installé (indisponible sous Windows)
+    if importlib.util.find_spec("uvloop") is not None:
+        config.worker_class = "uvloop"
     hypercorn.run.run(config)
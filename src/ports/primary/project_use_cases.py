@@ -3,27 +3,49 @@ Port primaire: interface des cas d'usage.
 Définit le CONTRAT que le domaine expose vers l'extérieur.
 Les adapters primaires dépendent de CETTE INTERFACE.
 """
-from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Optional
+from typing import Iterator, Optional, Protocol, runtime_checkable
 from src.domain.entities.project import Project
 from src.domain.entities.project_type import ProjectType
 
 
-class ProjectUseCasesPort(ABC):
+@dataclass(slots=True, frozen=True)
+class ProjectFromTemplateSpec:
+    """
+    Valeurs propres à un projet créé en lot depuis un template.
+
+    Les autres attributs sont repris du template (voir creer_depuis_template).
+    """
+    numero: str
+    nom: str
+    date_debut: date
+    date_echeance: date
+    responsable_id: int
+    entreprise_id: int
+    contact_id: Optional[int] = None
+
+
+@runtime_checkable
+class ProjectUseCasesPort(Protocol):
     """
     Interface des cas d'usage pour les projets.
 
     Cette interface définit les opérations métier que le domaine
     expose aux adapters primaires (API, CLI, etc.).
 
+    Protocol (contrat structurel): les services en héritent explicitement,
+    les vérifications de conformité sont faites par le type checker.
+
     Type Safety:
     - Toutes les méthodes ont des annotations de type complètes
     - Utilise Optional pour les paramètres optionnels
     - Utilise datetime.date pour les dates (pas de types ambigus)
     """
 
-    @abstractmethod
+    # Aucun attribut d'instance: les services peuvent déclarer leurs __slots__
+    __slots__ = ()
+
     def create_project(
         self,
         numero: str,
@@ -69,9 +91,8 @@ class ProjectUseCasesPort(ABC):
             ProjectAlreadyExistsError: Si le numero ou nom existe déjà
             ValueError: Si les règles métier ne sont pas respectées
         """
-        pass
+        ...
 
-    @abstractmethod
     def get_project(self, project_id: int) -> Project:
         """
         Récupère un projet par son ID.
@@ -85,9 +106,8 @@ class ProjectUseCasesPort(ABC):
         Raises:
             ProjectNotFoundError: Si le projet n'existe pas
         """
-        pass
+        ...
 
-    @abstractmethod
     def update_project(
         self,
         project_id: int,
@@ -122,9 +142,8 @@ class ProjectUseCasesPort(ABC):
             ProjectAlreadyExistsError: Si le nouveau numero/nom existe déjà
             ValueError: Si les règles métier ne sont pas respectées
         """
-        pass
+        ...
 
-    @abstractmethod
     def delete_project(self, project_id: int) -> bool:
         """
         Supprime un projet.
@@ -138,13 +157,15 @@ class ProjectUseCasesPort(ABC):
         Raises:
             ProjectNotFoundError: Si le projet n'existe pas
         """
-        pass
+        ...
 
-    @abstractmethod
     def list_projects(self, offset: int = 0, limit: int = 20) -> list[Project]:
         """
         Liste les projets avec pagination.
 
+        Coût en O(offset) côté base: préférer list_projects_after pour
+        parcourir de nombreuses pages.
+
         Args:
             offset: Nombre de projets à ignorer (pour la pagination)
             limit: Nombre maximum de projets à retourner
@@ -152,9 +173,45 @@ class ProjectUseCasesPort(ABC):
         Returns:
             Liste de projets (peut être vide)
         """
-        pass
+        ...
+
+    def list_projects_after(
+        self,
+        cursor: Optional[int] = None,
+        limit: int = 20
+    ) -> tuple[list[Project], Optional[int]]:
+        """
+        Liste les projets par curseur (pagination keyset, triée par ID).
+
+        Args:
+            cursor: Curseur renvoyé par la page précédente (None au début)
+            limit: Nombre maximum de projets à retourner
+
+        Returns:
+            (projets, curseur suivant) - le curseur suivant vaut None
+            quand il n'y a plus de page
+
+        Raises:
+            ValueError: Si limit n'est pas entre 1 et 100
+        """
+        ...
+
+    def stream_projects(self, last_id: Optional[int] = None, limit: int = 100) -> Iterator[Project]:
+        """
+        Parcourt les projets par ordre d'ID (pagination par curseur).
+
+        Pour les exports et les pages lointaines: le coût ne croît pas avec
+        la position, et les projets sont produits au fil de la lecture.
+
+        Args:
+            last_id: ID du dernier projet de la page précédente (None au début)
+            limit: Nombre maximum de projets à parcourir
+
+        Yields:
+            Les projets d'ID strictement supérieur à last_id
+        """
+        ...
 
-    @abstractmethod
     def dupliquer_projet(
         self,
         project_id: int,
@@ -188,9 +245,8 @@ class ProjectUseCasesPort(ABC):
             ProjectAlreadyExistsError: Si le nouveau numero/nom existe déjà
             ValueError: Si les règles métier ne sont pas respectées
         """
-        pass
+        ...
 
-    @abstractmethod
     def sauvegarder_comme_template(self, project_id: int) -> Project:
         """
         Transforme un projet existant en template.
@@ -206,9 +262,8 @@ class ProjectUseCasesPort(ABC):
         Raises:
             ProjectNotFoundError: Si le projet n'existe pas
         """
-        pass
+        ...
 
-    @abstractmethod
     def creer_depuis_template(
         self,
         template_id: int,
@@ -249,19 +304,46 @@ class ProjectUseCasesPort(ABC):
             ValueError: Si le template n'est pas marqué comme template
             ProjectAlreadyExistsError: Si le numero/nom existe déjà
         """
-        pass
+        ...
+
+    def create_many_from_template(
+        self,
+        template_id: int,
+        specs: list[ProjectFromTemplateSpec]
+    ) -> list[Project]:
+        """
+        Crée plusieurs projets depuis un même template, en un nombre constant
+        de requêtes quel que soit le nombre de projets.
+
+        Args:
+            template_id: ID du template source
+            specs: Valeurs propres à chaque projet à créer
+
+        Returns:
+            Les projets créés, dans l'ordre de specs
+
+        Raises:
+            ProjectNotFoundError: Si le template n'existe pas
+            ValueError: Si le template n'est pas marqué comme template, ou
+                si les valeurs d'un projet ne respectent pas les règles métier
+            ProjectAlreadyExistsError: Si un numero/nom existe déjà ou est
+                présent deux fois dans le lot
+        """
+        ...
 
-    @abstractmethod
-    def find_templates(self) -> list[Project]:
+    def find_templates(self, offset: int = 0, limit: int = 20) -> list[Project]:
         """
-        Liste tous les projets templates.
+        Liste les projets templates avec pagination.
+
+        Args:
+            offset: Nombre de templates à ignorer (pour la pagination)
+            limit: Nombre maximum de templates à retourner
 
         Returns:
             Liste des projets avec est_template=True
         """
-        pass
+        ...
 
-    @abstractmethod
     def calculer_avancement(self, project_id: int) -> float:
         """
         Calcule le pourcentage d'avancement d'un projet.
@@ -275,9 +357,8 @@ class ProjectUseCasesPort(ABC):
         Raises:
             ProjectNotFoundError: Si le projet n'existe pas
         """
-        pass
+        ...
 
-    @abstractmethod
     def calculer_ecart_temps(self, project_id: int) -> dict:
         """
         Calcule l'écart entre heures planifiées et réelles.
@@ -295,4 +376,4 @@ class ProjectUseCasesPort(ABC):
         Raises:
             ProjectNotFoundError: Si le projet n'existe pas
         """
-        pass
+        ...
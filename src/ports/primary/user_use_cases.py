@@ -4,20 +4,25 @@ Port primaire: interface des cas d'usage pour Utilisateur.
 Ce port définit le CONTRAT que le domaine expose vers l'extérieur.
 Les adapters primaires (API, CLI) dépendent de cette interface.
 """
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Protocol, Tuple, runtime_checkable
 from src.domain.entities.user import Utilisateur, RoleUtilisateur
 
 
-class UserUseCasesPort(ABC):
+@runtime_checkable
+class UserUseCasesPort(Protocol):
     """
     Interface des cas d'usage pour Utilisateur.
 
     Cette interface définit les opérations métier que le domaine
     expose aux adapters primaires.
+
+    Protocol (contrat structurel): les services en héritent explicitement,
+    les vérifications de conformité sont faites par le type checker.
     """
 
-    @abstractmethod
+    # Aucun attribut d'instance: les services peuvent déclarer leurs __slots__
+    __slots__ = ()
+
     def creer_utilisateur(
         self,
         nom: str,
@@ -43,9 +48,8 @@ class UserUseCasesPort(ABC):
             EntityAlreadyExistsError: Si un utilisateur avec cet email existe déjà
             DomainValidationError: Si les règles métier ne sont pas respectées
         """
-        pass
+        ...
 
-    @abstractmethod
     def obtenir_utilisateur(self, user_id: int) -> Utilisateur:
         """
         Récupère un utilisateur par son ID.
@@ -59,9 +63,8 @@ class UserUseCasesPort(ABC):
         Raises:
             EntityNotFoundError: Si l'utilisateur n'existe pas
         """
-        pass
+        ...
 
-    @abstractmethod
     def lister_utilisateurs(
         self,
         offset: int = 0,
@@ -70,6 +73,9 @@ class UserUseCasesPort(ABC):
         """
         Liste les utilisateurs avec pagination.
 
+        Coût en O(offset) côté base: préférer lister_utilisateurs_apres
+        pour parcourir de nombreuses pages.
+
         Args:
             offset: Nombre d'utilisateurs à sauter
             limit: Nombre maximum d'utilisateurs à retourner
@@ -77,9 +83,26 @@ class UserUseCasesPort(ABC):
         Returns:
             Liste des utilisateurs
         """
-        pass
+        ...
+
+    def lister_utilisateurs_apres(
+        self,
+        curseur: Optional[int] = None,
+        limit: int = 20
+    ) -> Tuple[List[Utilisateur], Optional[int]]:
+        """
+        Liste les utilisateurs par curseur (pagination keyset, triée par ID).
+
+        Args:
+            curseur: Curseur renvoyé par la page précédente (None au début)
+            limit: Nombre maximum d'utilisateurs à retourner
+
+        Returns:
+            (utilisateurs, curseur suivant) - le curseur suivant vaut None
+            quand il n'y a plus de page
+        """
+        ...
 
-    @abstractmethod
     def modifier_utilisateur(
         self,
         user_id: int,
@@ -104,9 +127,8 @@ class UserUseCasesPort(ABC):
             EntityAlreadyExistsError: Si l'email existe déjà
             DomainValidationError: Si les règles métier ne sont pas respectées
         """
-        pass
+        ...
 
-    @abstractmethod
     def supprimer_utilisateur(self, user_id: int) -> bool:
         """
         Supprime un utilisateur (soft delete - désactivation).
@@ -120,9 +142,8 @@ class UserUseCasesPort(ABC):
         Raises:
             EntityNotFoundError: Si l'utilisateur n'existe pas
         """
-        pass
+        ...
 
-    @abstractmethod
     def activer_desactiver_utilisateur(
         self,
         user_id: int,
@@ -141,9 +162,8 @@ class UserUseCasesPort(ABC):
         Raises:
             EntityNotFoundError: Si l'utilisateur n'existe pas
         """
-        pass
+        ...
 
-    @abstractmethod
     def changer_role(
         self,
         user_id: int,
@@ -163,9 +183,8 @@ class UserUseCasesPort(ABC):
             EntityNotFoundError: Si l'utilisateur n'existe pas
             DomainValidationError: Si le changement de rôle n'est pas autorisé
         """
-        pass
+        ...
 
-    @abstractmethod
     def changer_mot_de_passe(
         self,
         user_id: int,
@@ -187,4 +206,4 @@ class UserUseCasesPort(ABC):
             EntityNotFoundError: Si l'utilisateur n'existe pas
             DomainValidationError: Si l'ancien mot de passe est incorrect
         """
-        pass
+        ...
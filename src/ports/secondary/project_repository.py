@@ -4,12 +4,27 @@ Port secondaire: interface du repository pour Project.
 Ce port définit le CONTRAT de persistance que le domaine attend.
 Le domaine dépend de cette INTERFACE, pas de l'implémentation.
 """
-from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Collection, Iterator, Optional, Protocol, runtime_checkable
 from src.domain.entities.project import Project
 
 
-class ProjectRepositoryPort(ABC):
+@dataclass(slots=True, frozen=True)
+class ConflictFlags:
+    """
+    Résultat de ProjectRepositoryPort.check_conflicts.
+
+    Attributes:
+        numero: True si un autre projet utilise déjà ce numéro
+        nom: True si un autre projet utilise déjà ce nom
+    """
+    numero: bool = False
+    nom: bool = False
+
+
+@runtime_checkable
+class ProjectRepositoryPort(Protocol):
     """
     Interface du repository pour Project.
 
@@ -19,9 +34,11 @@ class ProjectRepositoryPort(ABC):
 
     IMPORTANT: Le repository travaille UNIQUEMENT avec des entités du domaine,
     jamais avec des modèles ORM ou DTOs.
+
+    Protocol (contrat structurel): les repositories en héritent explicitement,
+    les vérifications de conformité sont faites par le type checker.
     """
 
-    @abstractmethod
     def save(self, project: Project) -> Project:
         """
         Sauvegarde un projet et retourne le projet avec son ID.
@@ -35,9 +52,20 @@ class ProjectRepositoryPort(ABC):
         Raises:
             RepositoryError: Si la sauvegarde échoue
         """
-        pass
+        ...
+
+    def save_many(self, projects: list[Project]) -> list[Project]:
+        """
+        Sauvegarde plusieurs nouveaux projets en une seule opération.
+
+        Args:
+            projects: Les projets à sauvegarder (ID à None)
+
+        Returns:
+            Les projets sauvegardés avec leur ID, dans le même ordre
+        """
+        ...
 
-    @abstractmethod
     def find_by_id(self, project_id: int) -> Optional[Project]:
         """
         Récupère un projet par son ID.
@@ -48,13 +76,15 @@ class ProjectRepositoryPort(ABC):
         Returns:
             Le projet trouvé ou None si non trouvé
         """
-        pass
+        ...
 
-    @abstractmethod
     def find_all(self, offset: int = 0, limit: int = 20) -> list[Project]:
         """
         Récupère tous les projets avec pagination.
 
+        Coût en O(offset): la base lit puis ignore les lignes sautées.
+        Préférer stream_after pour les pages lointaines.
+
         Args:
             offset: Nombre de projets à sauter
             limit: Nombre maximum de projets à retourner
@@ -62,9 +92,37 @@ class ProjectRepositoryPort(ABC):
         Returns:
             Liste des projets (peut être vide)
         """
-        pass
+        ...
+
+    def approx_count(self) -> int:
+        """
+        Nombre approximatif de projets (pour afficher un total de pages).
+
+        Peut s'appuyer sur les statistiques de la base plutôt que sur un
+        COUNT(*) complet: la valeur peut être en retard sur les dernières
+        écritures et ne doit pas servir de règle métier.
+
+        Returns:
+            Le nombre estimé de projets
+        """
+        ...
+
+    def stream_after(self, last_id: Optional[int], limit: int) -> Iterator[Project]:
+        """
+        Parcourt les projets par ordre d'ID croissant (pagination par curseur).
+
+        Contrairement à find_all, le coût ne dépend pas de la position dans
+        la liste: la base repart directement de last_id via la clé primaire.
+
+        Args:
+            last_id: ID du dernier projet déjà lu (None pour commencer au début)
+            limit: Nombre maximum de projets à parcourir
+
+        Yields:
+            Les projets d'ID strictement supérieur à last_id
+        """
+        ...
 
-    @abstractmethod
     def exists_by_name(self, name: str) -> bool:
         """
         Vérifie si un projet avec ce nom existe.
@@ -74,10 +132,13 @@ class ProjectRepositoryPort(ABC):
 
         Returns:
             True si un projet avec ce nom existe, False sinon
+
+        Note:
+            Les implémentations SQL doivent utiliser ``SELECT 1 ... LIMIT 1``
+            sur l'index unique, pas ``COUNT(*)`` ni le chargement de la ligne.
         """
-        pass
+        ...
 
-    @abstractmethod
     def exists_by_numero(self, numero: str) -> bool:
         """
         Vérifie si un projet avec ce numéro existe.
@@ -87,10 +148,114 @@ class ProjectRepositoryPort(ABC):
 
         Returns:
             True si un projet avec ce numéro existe, False sinon
+
+        Note:
+            Les implémentations SQL doivent utiliser ``SELECT 1 ... LIMIT 1``
+            sur l'index unique, pas ``COUNT(*)`` ni le chargement de la ligne.
+        """
+        ...
+
+    def find_existing_keys(
+        self,
+        numeros: Collection[str],
+        noms: Collection[str]
+    ) -> tuple[set[str], set[str]]:
+        """
+        Vérifie en une seule requête quels numéros et noms sont déjà pris.
+
+        Args:
+            numeros: Les numéros à vérifier
+            noms: Les noms à vérifier
+
+        Returns:
+            Tuple (numéros déjà pris, noms déjà pris)
+        """
+        ...
+
+    def duplicate(
+        self,
+        project_id: int,
+        numero: str,
+        nom: str,
+        date_debut: date,
+        date_echeance: date,
+        date_creation: datetime
+    ) -> Optional[Project]:
         """
-        pass
+        Crée une copie d'un projet sans charger le projet source.
+
+        La copie reprend les données du source, avec le numéro, le nom et
+        les dates fournis; heures_reelles=0, est_template=False et
+        projet_template_id=None.
+
+        Args:
+            project_id: ID du projet source
+            numero: Numéro de la copie
+            nom: Nom de la copie
+            date_debut: Date de début de la copie
+            date_echeance: Date d'échéance de la copie
+            date_creation: Date de création de la copie
+
+        Returns:
+            Le projet créé, ou None si le projet source n'existe pas
+        """
+        ...
+
+    def create_from_template(
+        self,
+        template_id: int,
+        numero: str,
+        nom: str,
+        date_debut: date,
+        date_echeance: date,
+        responsable_id: int,
+        entreprise_id: int,
+        contact_id: Optional[int],
+        date_creation: datetime
+    ) -> Optional[Project]:
+        """
+        Crée un projet depuis un template sans charger le template.
+
+        Le projet reprend les données du template, avec les valeurs fournies;
+        heures_reelles=0, est_template=False et projet_template_id=template_id.
+
+        Args:
+            template_id: ID du template source
+            numero: Numéro du nouveau projet
+            nom: Nom du nouveau projet
+            date_debut: Date de début
+            date_echeance: Date d'échéance
+            responsable_id: ID du responsable
+            entreprise_id: ID de l'entreprise
+            contact_id: ID du contact (optionnel)
+            date_creation: Date de création
+
+        Returns:
+            Le projet créé, ou None si template_id n'existe pas ou n'est pas
+            un template
+        """
+        ...
+
+    def check_conflicts(
+        self,
+        numero: Optional[str],
+        nom: Optional[str],
+        exclude_id: Optional[int] = None
+    ) -> ConflictFlags:
+        """
+        Vérifie en une seule requête si le numéro et/ou le nom sont déjà pris.
+
+        Args:
+            numero: Le numéro à vérifier (None pour ne pas le vérifier)
+            nom: Le nom à vérifier (None pour ne pas le vérifier)
+            exclude_id: ID d'un projet à ignorer (le projet en cours de
+                modification)
+
+        Returns:
+            Les clés uniques qui entrent en conflit
+        """
+        ...
 
-    @abstractmethod
     def delete(self, project_id: int) -> bool:
         """
         Supprime un projet.
@@ -104,10 +269,9 @@ class ProjectRepositoryPort(ABC):
         Raises:
             RepositoryError: Si la suppression échoue
         """
-        pass
+        ...
 
-    @abstractmethod
-    def update(self, project: Project) -> Project:
+    def update(self, project: Project) -> Optional[Project]:
         """
         Met à jour un projet existant.
 
@@ -115,25 +279,51 @@ class ProjectRepositoryPort(ABC):
             project: Le projet avec les nouvelles valeurs (ID requis)
 
         Returns:
-            Le projet mis à jour
+            Le projet mis à jour, ou None si le projet n'existe pas
 
         Raises:
             RepositoryError: Si la mise à jour échoue
-            ValueError: Si le projet n'existe pas
         """
-        pass
+        ...
 
-    @abstractmethod
-    def find_templates(self) -> list[Project]:
+    def mark_as_template(self, project_id: int) -> Optional[Project]:
         """
-        Récupère tous les projets qui sont des templates.
+        Marque un projet comme template (est_template=True).
+
+        Args:
+            project_id: L'identifiant du projet
+
+        Returns:
+            Le projet mis à jour, ou None si le projet n'existe pas
+        """
+        ...
+
+    def get_hours(self, project_id: int) -> Optional[tuple[float, float]]:
+        """
+        Récupère uniquement les heures d'un projet (sans charger l'entité).
+
+        Args:
+            project_id: L'identifiant du projet
+
+        Returns:
+            Tuple (heures_planifiees, heures_reelles), ou None si le projet
+            n'existe pas
+        """
+        ...
+
+    def find_templates(self, offset: int = 0, limit: int = 20) -> list[Project]:
+        """
+        Récupère les projets qui sont des templates, triés par ID.
+
+        Args:
+            offset: Nombre de templates à sauter
+            limit: Nombre maximum de templates à retourner
 
         Returns:
             Liste des projets avec est_template=True
         """
-        pass
+        ...
 
-    @abstractmethod
     def find_by_template_id(self, template_id: int) -> list[Project]:
         """
         Trouve tous les projets créés depuis un template spécifique.
@@ -144,9 +334,8 @@ class ProjectRepositoryPort(ABC):
         Returns:
             Liste des projets avec projet_template_id=template_id
         """
-        pass
+        ...
 
-    @abstractmethod
     def find_by_entreprise(self, entreprise_id: int) -> list[Project]:
         """
         Trouve tous les projets d'une entreprise.
@@ -157,9 +346,8 @@ class ProjectRepositoryPort(ABC):
         Returns:
             Liste des projets de cette entreprise
         """
-        pass
+        ...
 
-    @abstractmethod
     def find_by_responsable(self, responsable_id: int) -> list[Project]:
         """
         Trouve tous les projets d'un responsable.
@@ -170,4 +358,4 @@ class ProjectRepositoryPort(ABC):
         Returns:
             Liste des projets de ce responsable
         """
-        pass
+        ...
@@ -4,20 +4,22 @@ Port secondaire: interface du repository pour Utilisateur.
 Ce port définit le CONTRAT de persistance que le domaine attend.
 Le domaine dépend de cette INTERFACE, pas de l'implémentation.
 """
-from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple, Protocol, runtime_checkable
 from src.domain.entities.user import Utilisateur
 
 
-class UserRepositoryPort(ABC):
+@runtime_checkable
+class UserRepositoryPort(Protocol):
     """
     Interface du repository pour Utilisateur.
 
     Cette interface définit les opérations de persistance nécessaires
     pour le domaine, sans se soucier de l'implémentation technique.
+
+    Protocol (contrat structurel): les repositories en héritent explicitement,
+    les vérifications de conformité sont faites par le type checker.
     """
 
-    @abstractmethod
     def save(self, user: Utilisateur) -> Utilisateur:
         """
         Sauvegarde un utilisateur et retourne l'utilisateur avec son ID.
@@ -29,11 +31,11 @@ class UserRepositoryPort(ABC):
             L'utilisateur sauvegardé avec son ID généré
 
         Raises:
+            EntityAlreadyExistsError: Si l'email est déjà utilisé
             RepositoryError: Si la sauvegarde échoue
         """
-        pass
+        ...
 
-    @abstractmethod
     def find_by_id(self, user_id: int) -> Optional[Utilisateur]:
         """
         Récupère un utilisateur par son ID.
@@ -44,9 +46,8 @@ class UserRepositoryPort(ABC):
         Returns:
             L'utilisateur trouvé ou None
         """
-        pass
+        ...
 
-    @abstractmethod
     def find_by_email(self, email: str) -> Optional[Utilisateur]:
         """
         Récupère un utilisateur par son email.
@@ -57,9 +58,8 @@ class UserRepositoryPort(ABC):
         Returns:
             L'utilisateur trouvé ou None
         """
-        pass
+        ...
 
-    @abstractmethod
     def find_all(
         self,
         offset: int = 0,
@@ -68,6 +68,9 @@ class UserRepositoryPort(ABC):
         """
         Récupère tous les utilisateurs avec pagination.
 
+        Coût en O(offset): la base lit puis ignore les lignes sautées.
+        Préférer find_after pour les pages lointaines.
+
         Args:
             offset: Nombre d'utilisateurs à sauter
             limit: Nombre maximum d'utilisateurs à retourner
@@ -75,9 +78,59 @@ class UserRepositoryPort(ABC):
         Returns:
             Liste des utilisateurs
         """
-        pass
+        ...
+
+    def approx_count(self) -> int:
+        """
+        Nombre approximatif de utilisateurs (pour afficher un total de pages).
+
+        Peut s'appuyer sur les statistiques de la base plutôt que sur un
+        COUNT(*) complet: la valeur peut être en retard sur les dernières
+        écritures et ne doit pas servir de règle métier.
+
+        Returns:
+            Le nombre estimé de utilisateurs
+        """
+        ...
+
+    def find_after(
+        self,
+        after_id: Optional[int],
+        limit: int = 20
+    ) -> List[Utilisateur]:
+        """
+        Récupère les utilisateurs d'ID > after_id, triés par ID (keyset).
+
+        Coût en O(limit) quelle que soit la profondeur de la page.
+
+        Args:
+            after_id: ID du dernier utilisateur déjà lu (None pour le début)
+            limit: Nombre maximum d'utilisateurs à retourner
+
+        Returns:
+            Liste des utilisateurs
+        """
+        ...
+
+    def find_with_email_check(
+        self,
+        user_id: int,
+        email: str
+    ) -> Tuple[Optional[Utilisateur], bool]:
+        """
+        Récupère un utilisateur ET vérifie si un AUTRE utilisateur a cet email.
+
+        Une seule requête au lieu de find_by_id + exists_by_email.
+
+        Args:
+            user_id: L'identifiant de l'utilisateur
+            email: L'email (normalisé) à vérifier
+
+        Returns:
+            (utilisateur ou None, True si l'email est pris par un autre utilisateur)
+        """
+        ...
 
-    @abstractmethod
     def exists_by_email(self, email: str) -> bool:
         """
         Vérifie si un utilisateur avec cet email existe.
@@ -88,9 +141,8 @@ class UserRepositoryPort(ABC):
         Returns:
             True si l'utilisateur existe, False sinon
         """
-        pass
+        ...
 
-    @abstractmethod
     def update(self, user: Utilisateur) -> Utilisateur:
         """
         Met à jour un utilisateur existant.
@@ -103,10 +155,10 @@ class UserRepositoryPort(ABC):
 
         Raises:
             EntityNotFoundError: Si l'utilisateur n'existe pas
+            EntityAlreadyExistsError: Si le nouvel email est déjà utilisé
         """
-        pass
+        ...
 
-    @abstractmethod
     def delete(self, user_id: int) -> bool:
         """
         Supprime un utilisateur (ou le désactive selon la logique métier).
@@ -117,4 +169,4 @@ class UserRepositoryPort(ABC):
         Returns:
             True si la suppression a réussi, False sinon
         """
-        pass
+        ...
@@ -7,75 +7,100 @@ This file contains reusable fixtures for:
 - Test data factories
 - E2E testing with isolated databases
 """
+import os
 import pytest
 from datetime import date, timedelta
+from types import MappingProxyType
 from unittest.mock import Mock
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert
 from sqlalchemy.orm import sessionmaker, Session
-from fastapi.testclient import TestClient
-from typing import Generator
+from sqlalchemy.pool import StaticPool
+from typing import TYPE_CHECKING, Generator
 
 from src.domain.entities.project import Project
 from src.domain.entities.project_type import ProjectType
 from src.ports.secondary.project_repository import ProjectRepositoryPort
+from tests.factories import FROZEN_NOW, build_project
+from tests.fakes.in_memory_project_repository import InMemoryProjectRepository
 from src.adapters.secondary.repositories.sqlalchemy_project_repository import (
     ProjectModel,
     Base,
 )
 
+# Read by src.di_container when the app is first imported: no SQL echo in tests
+os.environ.setdefault("SQL_ECHO", "false")
+
+if TYPE_CHECKING:
+    # Imported lazily in the client fixture: unit tests don't pay for FastAPI/httpx
+    from fastapi.testclient import TestClient
+
 
 # ============================================================================
 # DATABASE FIXTURES
 # ============================================================================
 
 
-@pytest.fixture(scope="function")
-def test_engine():
+def _create_memory_engine():
     """
-    Create an in-memory SQLite engine for testing.
+    Create an in-memory SQLite engine with the schema, for a whole test session.
 
-    Scope: function - Creates a fresh database for each test.
-    This ensures complete test isolation.
+    StaticPool keeps a single connection, so the :memory: database
+    survives across connect() calls. That connection serves every test:
+    its prepared-statement cache is sized for the whole suite (SQLAlchemy's
+    own compiled cache is already per engine).
 
     Returns:
         SQLAlchemy Engine configured with SQLite in-memory database
     """
     engine = create_engine(
         "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
+        connect_args={"check_same_thread": False, "cached_statements": 256},
+        poolclass=StaticPool,
         echo=False,  # Set to True for SQL debugging
     )
 
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+    # pysqlite emits BEGIN itself, lazily, which breaks SAVEPOINTs: let
+    # SQLAlchemy drive the transactions instead (documented pysqlite recipe)
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
 
-    yield engine
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
-    # Cleanup: Drop all tables after test
-    Base.metadata.drop_all(bind=engine)
-    engine.dispose()
+    # Create all tables (once per test session)
+    Base.metadata.create_all(bind=engine)
+    return engine
 
 
-@pytest.fixture(scope="function")
-def db_session(test_engine):
+def _dispose_memory_engine(engine) -> None:
     """
-    Create a database session with automatic rollback.
+    Release the connection at the end of the test session.
 
-    This fixture:
-    1. Creates a new session for each test
-    2. Automatically rolls back changes after the test
-    3. Ensures test isolation
+    No drop_all: the :memory: database disappears with its connection.
+    """
+    engine.dispose()
 
-    Args:
-        test_engine: The in-memory SQLite engine
 
-    Returns:
-        SQLAlchemy Session that will be automatically rolled back
+def _rolled_back_session(engine) -> Generator[Session, None, None]:
     """
-    connection = test_engine.connect()
+    Yield a session whose work is rolled back after the test.
+
+    1. Opens an outer transaction on the shared connection
+    2. Joins the session to it through a SAVEPOINT: session.commit()
+       releases the SAVEPOINT and a new one is started automatically
+    3. Rolls back the outer transaction after the test (test isolation)
+    """
+    connection = engine.connect()
     transaction = connection.begin()
 
-    SessionLocal = sessionmaker(bind=connection)
+    SessionLocal = sessionmaker(
+        bind=connection,
+        expire_on_commit=False,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
     session = SessionLocal()
 
     yield session
@@ -86,6 +111,36 @@ def db_session(test_engine):
     connection.close()
 
 
+@pytest.fixture(scope="session")
+def test_engine():
+    """
+    Create an in-memory SQLite engine for testing.
+
+    Scope: session - The schema is created once for the whole test run.
+    Isolation between tests is provided by db_session (rolled back SAVEPOINT).
+
+    Returns:
+        SQLAlchemy Engine configured with SQLite in-memory database
+    """
+    engine = _create_memory_engine()
+    yield engine
+    _dispose_memory_engine(engine)
+
+
+@pytest.fixture(scope="function")
+def db_session(test_engine):
+    """
+    Create a database session with automatic rollback.
+
+    Args:
+        test_engine: The in-memory SQLite engine
+
+    Returns:
+        SQLAlchemy Session that will be automatically rolled back
+    """
+    yield from _rolled_back_session(test_engine)
+
+
 # ============================================================================
 # MOCK FIXTURES
 # ============================================================================
@@ -106,21 +161,39 @@ def mock_repository():
     return mock
 
 
+@pytest.fixture
+def fake_repository():
+    """
+    Create an in-memory ProjectRepositoryPort for unit testing.
+
+    Prefer it to mock_repository when a test only needs a working
+    repository (save then read back...) rather than call assertions:
+    real methods over a dict, much cheaper than Mock attribute lookups.
+
+    Returns:
+        InMemoryProjectRepository: An empty in-memory repository
+    """
+    return InMemoryProjectRepository()
+
+
 # ============================================================================
 # TEST DATA FACTORIES
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_project_data():
     """
     Provide sample project data for tests.
 
+    Scope: session - Built once and shared, hence read-only. Tests needing
+    different values build their own dict: {**sample_project_data, ...}.
+
     Returns:
-        dict: Valid project data that can be used to create Project entities
+        MappingProxyType: Valid project data that can be used to create Project entities
     """
     today = date.today()
-    return {
+    return MappingProxyType({
         "numero": "PROJ-001",
         "nom": "Test Project",
         "description": "A test project description",
@@ -136,79 +209,72 @@ def sample_project_data():
         "responsable_id": 1,
         "entreprise_id": 1,
         "contact_id": None,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_project(sample_project_data):
     """
     Create a sample Project entity for tests.
 
+    Scope: session - Project is frozen, the instance can be shared;
+    use dataclasses.replace() to derive a variant.
+
     Args:
         sample_project_data: Dictionary with project data
 
     Returns:
         Project: A valid Project entity with id=None
     """
-    from datetime import datetime
     return Project(
         id=None,
-        date_creation=datetime.now(),
+        date_creation=FROZEN_NOW,
         **sample_project_data
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_project_with_id(sample_project_data):
     """
     Create a sample Project entity with an ID (simulating a saved project).
 
+    Scope: session - Project is frozen, the instance can be shared.
+
     Args:
         sample_project_data: Dictionary with project data
 
     Returns:
         Project: A valid Project entity with id=1
     """
-    from datetime import datetime
     return Project(
         id=1,
-        date_creation=datetime.now(),
+        date_creation=FROZEN_NOW,
         **sample_project_data
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_projects():
     """
     Create multiple project entities for testing list operations.
 
+    Scope: session - The projects are frozen; the list itself must not be modified.
+
     Returns:
         list[Project]: List of three different Project entities
     """
-    from datetime import datetime
     today = date.today()
 
-    projects = [
-        Project(
+    return [
+        build_project(
             id=1,
             numero="PROJ-ALPHA",
             nom="Project Alpha",
             description="First test project",
-            date_debut=today,
-            date_echeance=today + timedelta(days=365),
-            type=ProjectType.INTERNAL,
-            stade="En cours",
             commentaire="Alpha comment",
-            heures_planifiees=100.0,
             heures_reelles=20.0,
-            est_template=False,
-            projet_template_id=None,
-            responsable_id=1,
-            entreprise_id=1,
-            contact_id=None,
-            date_creation=datetime.now(),
         ),
-        Project(
+        build_project(
             id=2,
             numero="PROJ-BETA",
             nom="Project Beta",
@@ -219,15 +285,11 @@ def multiple_projects():
             stade="Planifié",
             commentaire="Beta comment",
             heures_planifiees=200.0,
-            heures_reelles=0.0,
-            est_template=False,
-            projet_template_id=None,
             responsable_id=2,
             entreprise_id=2,
             contact_id=1,
-            date_creation=datetime.now(),
         ),
-        Project(
+        build_project(
             id=3,
             numero="PROJ-GAMMA",
             nom="Project Gamma",
@@ -239,16 +301,54 @@ def multiple_projects():
             commentaire="Gamma comment",
             heures_planifiees=150.0,
             heures_reelles=180.0,
-            est_template=False,
-            projet_template_id=None,
-            responsable_id=1,
-            entreprise_id=1,
-            contact_id=None,
-            date_creation=datetime.now(),
         ),
     ]
 
-    return projects
+
+@pytest.fixture(scope="session")
+def project_payload():
+    """
+    Provide the fields shared by the POST /api/projects bodies of E2E tests.
+
+    Scope: session - Built once and read-only; use make_project_payload
+    to get a body with the test's own numero, nom and overrides.
+
+    Returns:
+        MappingProxyType: JSON-ready project fields (dates as ISO strings)
+    """
+    today = date.today()
+    return MappingProxyType({
+        "description": "A test project description",
+        "date_debut": today.isoformat(),
+        "date_echeance": (today + timedelta(days=30)).isoformat(),
+        "type": "INTERNAL",
+        "stade": "En cours",
+        "commentaire": None,
+        "heures_planifiees": 100.0,
+        "heures_reelles": 0.0,
+        "est_template": False,
+        "projet_template_id": None,
+        "responsable_id": 1,
+        "entreprise_id": 1,
+        "contact_id": None,
+    })
+
+
+@pytest.fixture
+def make_project_payload(project_payload):
+    """
+    Factory fixture building a POST /api/projects body.
+
+    Args:
+        project_payload: The shared project fields
+
+    Returns:
+        Callable taking the fields to set or override, returning a new dict
+    """
+    def _make_project_payload(**overrides) -> dict:
+        return {**project_payload, **overrides}
+
+    return _make_project_payload
 
 
 # ============================================================================
@@ -256,6 +356,38 @@ def multiple_projects():
 # ============================================================================
 
 
+def _project_row(project_data: dict) -> dict:
+    """
+    Complete a project dict so it can be inserted as a ProjectModel row.
+
+    Adds date_creation (FROZEN_NOW) if missing and converts a ProjectType enum to its value.
+    """
+    row = dict(project_data)
+    row.setdefault("date_creation", FROZEN_NOW)
+
+    # Convert ProjectType enum to string if necessary
+    project_type = row.get("type")
+    if isinstance(project_type, ProjectType):
+        row["type"] = project_type.value
+
+    return row
+
+
+def _insert_projects(session: Session, projects_data: list[dict]) -> list[ProjectModel]:
+    """
+    Insert the projects with one multi-row INSERT ... RETURNING, then commit.
+
+    Returns:
+        list[ProjectModel]: The created project models, in the given order
+    """
+    project_models = session.scalars(
+        insert(ProjectModel).returning(ProjectModel, sort_by_parameter_order=True),
+        [_project_row(data) for data in projects_data]
+    ).all()
+    session.commit()
+    return list(project_models)
+
+
 @pytest.fixture
 def create_project_in_db(db_session):
     """
@@ -278,58 +410,66 @@ def create_project_in_db(db_session):
             project_data: Dictionary with project fields
 
         Returns:
-            ProjectModel: The created project model
+            ProjectModel: The created project model (its ID is set by the flush)
         """
-        from datetime import datetime
-        # Add date_creation if not provided
-        if "date_creation" not in project_data:
-            project_data = {**project_data, "date_creation": datetime.now()}
-
-        # Convert ProjectType enum to string if necessary
-        if "type" in project_data and isinstance(project_data["type"], ProjectType):
-            project_data = {**project_data, "type": project_data["type"].value}
-
-        project_model = ProjectModel(**project_data)
+        project_model = ProjectModel(**_project_row(project_data))
         db_session.add(project_model)
         db_session.commit()
-        db_session.refresh(project_model)
         return project_model
 
     return _create_project
 
 
+@pytest.fixture
+def create_projects_in_db(db_session):
+    """
+    Factory fixture to seed several projects with a single INSERT.
+
+    One multi-row INSERT ... RETURNING instead of one add/commit per
+    project: no per-row unit-of-work flush.
+
+    Args:
+        db_session: The test database session
+
+    Returns:
+        Callable that creates the ProjectModels, in the given order
+    """
+    def _create_projects(projects_data: list[dict]) -> list[ProjectModel]:
+        """
+        Create projects in the database.
+
+        Args:
+            projects_data: One dictionary of project fields per project
+
+        Returns:
+            list[ProjectModel]: The created project models, with their IDs
+        """
+        return _insert_projects(db_session, projects_data)
+
+    return _create_projects
+
+
 # ============================================================================
 # E2E TESTING FIXTURES (Isolated Database)
 # ============================================================================
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def isolated_db_engine():
     """
-    Create an isolated in-memory database engine for E2E tests.
+    Create an in-memory database engine for E2E tests.
 
-    This ensures complete isolation between E2E tests by creating
-    a fresh database for each test function.
+    Kept apart from test_engine so E2E tests never see integration data.
 
-    Scope: function - New database per test for complete isolation
+    Scope: session - The schema is created once; isolated_db_session
+    rolls each test back, so E2E tests stay isolated from each other.
 
     Returns:
-        SQLAlchemy Engine with isolated in-memory database
+        SQLAlchemy Engine with an in-memory database
     """
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        echo=False,
-    )
-
-    # Create all tables in the isolated database
-    Base.metadata.create_all(bind=engine)
-
+    engine = _create_memory_engine()
     yield engine
-
-    # Cleanup
-    Base.metadata.drop_all(bind=engine)
-    engine.dispose()
+    _dispose_memory_engine(engine)
 
 
 @pytest.fixture(scope="function")
@@ -337,47 +477,84 @@ def isolated_db_session(isolated_db_engine) -> Generator[Session, None, None]:
     """
     Create an isolated database session for E2E tests.
 
-    This session is connected to an isolated in-memory database,
-    ensuring no cross-contamination between tests.
+    Everything the test writes (including commits made by the API) is
+    rolled back afterwards, ensuring no cross-contamination between tests.
 
     Args:
-        isolated_db_engine: The isolated database engine
+        isolated_db_engine: The E2E database engine
 
     Yields:
-        SQLAlchemy Session connected to isolated database
+        SQLAlchemy Session connected to the E2E database
     """
-    connection = isolated_db_engine.connect()
-    transaction = connection.begin()
+    yield from _rolled_back_session(isolated_db_engine)
 
-    SessionLocal = sessionmaker(bind=connection)
-    session = SessionLocal()
 
-    yield session
+@pytest.fixture
+def seed_projects(isolated_db_session):
+    """
+    Factory fixture to seed projects in the E2E database, bypassing HTTP.
 
-    # Cleanup
-    session.close()
-    transaction.rollback()
-    connection.close()
+    For tests whose subject is a read endpoint: one INSERT instead of a
+    POST (validation, routing, commit) per project. The rows are rolled
+    back with the rest of the test.
+
+    Args:
+        isolated_db_session: The isolated E2E database session
+
+    Returns:
+        Callable that creates the ProjectModels, in the given order
+    """
+    def _seed_projects(projects_data: list[dict]) -> list[ProjectModel]:
+        """
+        Create projects in the E2E database.
+
+        Args:
+            projects_data: One dictionary of project fields per project
+
+        Returns:
+            list[ProjectModel]: The created project models, with their IDs
+        """
+        return _insert_projects(isolated_db_session, projects_data)
+
+    return _seed_projects
+
+
+@pytest.fixture(scope="session")
+def shared_client() -> Generator["TestClient", None, None]:
+    """
+    Create the FastAPI TestClient once for the whole test session.
+
+    The client (and the app lifespan) is entered a single time; each test
+    plugs its own database in through the client fixture.
+
+    Yields:
+        TestClient: FastAPI test client bound to src.main.app
+    """
+    from fastapi.testclient import TestClient
+    from src.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(isolated_db_session) -> TestClient:
+def client(shared_client, isolated_db_session) -> Generator["TestClient", None, None]:
     """
-    Create a FastAPI TestClient with isolated database for E2E tests.
+    Provide the shared FastAPI TestClient wired to an isolated database.
 
     This fixture:
-    1. Creates a fresh isolated database for the test
-    2. Patches the DI container to use the isolated DB
-    3. Provides a TestClient for making HTTP requests
-    4. Automatically cleans up after the test
+    1. Overrides the get_db_session dependency to use the isolated session
+    2. Yields the session-wide TestClient for making HTTP requests
+    3. Removes the override after the test (the session is rolled back)
 
     IMPORTANT: This fixture ensures E2E tests are completely isolated
     from each other and don't share database state.
 
     Args:
+        shared_client: The session-wide TestClient
         isolated_db_session: The isolated database session
 
-    Returns:
+    Yields:
         TestClient: FastAPI test client with isolated database
 
     Example:
@@ -385,24 +562,20 @@ def client(isolated_db_session) -> TestClient:
             response = client.post("/api/projects", json={...})
             assert response.status_code == 201
     """
-    from unittest.mock import patch
-    from src.main import app
+    from src.di_container import get_db_session
 
-    # We need to patch the get_db_session function in di_container
-    # to return our isolated session instead of creating a new one
+    # Override the get_db_session dependency so every request uses
+    # our isolated session instead of creating a new one
     def override_get_db_session() -> Generator[Session, None, None]:
         """Override function that returns the isolated test session."""
-        try:
-            yield isolated_db_session
-        finally:
-            pass  # Cleanup is handled by the isolated_db_session fixture
+        yield isolated_db_session  # Cleanup is handled by the isolated_db_session fixture
 
-    # Patch the DI container's get_db_session function
-    with patch('src.di_container.get_db_session', override_get_db_session):
-        # Create the test client with the patched dependency
-        test_client = TestClient(app)
-
-        yield test_client
+    app = shared_client.app
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    try:
+        yield shared_client
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
 
 
 # ============================================================================
@@ -410,29 +583,16 @@ def client(isolated_db_session) -> TestClient:
 # ============================================================================
 
 
-def pytest_configure(config):
+def pytest_collection_modifyitems(config, items):
     """
-    Configure pytest with custom markers.
+    Mark each test after the directory it lives in (unit, integration, e2e).
 
-    This allows categorizing tests:
-    - unit: Unit tests (fast, no external dependencies)
-    - integration: Integration tests (with database)
-    - e2e: End-to-end tests (full API tests)
-    - flaky: Tests that are known to be flaky
-    - slow: Tests that take longer to run
+    Allows a fast loop such as ``pytest -m "not e2e"``. Each pytest-xdist
+    worker is its own process, hence its own :memory: databases: the suite
+    can run with ``pytest -n auto --dist=loadfile`` without extra setup.
     """
-    config.addinivalue_line(
-        "markers", "unit: marks tests as unit tests (fast, isolated)"
-    )
-    config.addinivalue_line(
-        "markers", "integration: marks tests as integration tests (with database)"
-    )
-    config.addinivalue_line(
-        "markers", "e2e: marks tests as end-to-end tests (full stack)"
-    )
-    config.addinivalue_line(
-        "markers", "flaky: marks tests as flaky (may fail intermittently)"
-    )
-    config.addinivalue_line(
-        "markers", "slow: marks tests as slow (take more than 1 second)"
-    )
+    for item in items:
+        parts = item.path.parts
+        for marker in ("unit", "integration", "e2e"):
+            if marker in parts:
+                item.add_marker(getattr(pytest.mark, marker))
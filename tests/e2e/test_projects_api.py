@@ -4,48 +4,21 @@ End-to-end tests for the FastAPI application.
 Tests complete user workflows through the HTTP API.
 Uses TestClient to simulate HTTP requests without running the actual server.
 """
-import pytest
-from fastapi.testclient import TestClient
 from datetime import date, timedelta
 
-from src.main import app
-
-
-@pytest.fixture
-def client():
-    """Create a TestClient for the FastAPI app."""
-    import uuid
-    # Generate unique test ID for this test session to avoid name collisions
-    test_id = str(uuid.uuid4())[:8]
-    client = TestClient(app)
-    client.test_id = test_id
-    return client
-
 
 class TestCreateProjectEndpoint:
     """Test suite for POST /api/projects endpoint."""
 
-    def test_create_project_success(self, client):
+    def test_create_project_success(self, client, make_project_payload):
         """Test successful project creation returns 201 with complete data."""
         # Arrange
-        today = date.today()
-        project_data = {
-            "numero": f"PROJ-API-{client.test_id}",
-            "nom": f"Test API Project {client.test_id}",
-            "description": "A project created via API",
-            "date_debut": today.isoformat(),
-            "date_echeance": (today + timedelta(days=30)).isoformat(),
-            "type": "INTERNE",
-            "stade": "En cours",
-            "commentaire": "Test comment",
-            "heures_planifiees": 100.0,
-            "heures_reelles": 0.0,
-            "est_template": False,
-            "projet_template_id": None,
-            "responsable_id": 1,
-            "entreprise_id": 1,
-            "contact_id": None
-        }
+        project_data = make_project_payload(
+            numero="PROJ-API",
+            nom="Test API Project",
+            description="A project created via API",
+            commentaire="Test comment"
+        )
 
         # Act
         response = client.post("/api/projects", json=project_data)
@@ -54,7 +27,7 @@ class TestCreateProjectEndpoint:
         assert response.status_code == 201
         data = response.json()
         assert data["id"] is not None
-        assert f"Test API Project {client.test_id}" in data["nom"]
+        assert data["nom"] == "Test API Project"
         assert data["description"] == "A project created via API"
         assert data["heures_planifiees"] == 100.0
         assert data["responsable_id"] == 1
@@ -65,95 +38,57 @@ class TestCreateProjectEndpoint:
         assert "ecart_temps" in data
         assert "est_en_retard" in data
 
-    def test_create_project_duplicate_numero_returns_409(self, client):
+    def test_create_project_duplicate_numero_returns_409(self, client, make_project_payload):
         """Test that creating a project with duplicate numero returns 409 Conflict."""
         # Arrange
-        today = date.today()
-        project_data = {
-            "numero": f"PROJ-DUP-NUM-{client.test_id}",
-            "nom": f"Duplicate Numero Project {client.test_id}",
-            "description": "First project",
-            "date_debut": today.isoformat(),
-            "date_echeance": (today + timedelta(days=30)).isoformat(),
-            "type": "INTERNE",
-            "stade": "En cours",
-            "commentaire": None,
-            "heures_planifiees": 100.0,
-            "heures_reelles": 0.0,
-            "est_template": False,
-            "projet_template_id": None,
-            "responsable_id": 1,
-            "entreprise_id": 1,
-            "contact_id": None
-        }
+        project_data = make_project_payload(
+            numero="PROJ-DUP-NUM",
+            nom="Duplicate Numero Project",
+            description="First project"
+        )
 
         # Create first project
         response1 = client.post("/api/projects", json=project_data)
         assert response1.status_code == 201
 
         # Act - Try to create duplicate numero (different name)
-        project_data["nom"] = f"Different Name {client.test_id}"
+        project_data["nom"] = "Different Name"
         response2 = client.post("/api/projects", json=project_data)
 
         # Assert
         assert response2.status_code == 409
         assert "numéro" in response2.json()["detail"]
 
-    def test_create_project_duplicate_name_returns_409(self, client):
+    def test_create_project_duplicate_name_returns_409(self, client, make_project_payload):
         """Test that creating a project with duplicate name returns 409 Conflict."""
         # Arrange
-        today = date.today()
-        project_data = {
-            "numero": f"PROJ-DUP-NOM-1-{client.test_id}",
-            "nom": f"Duplicate Name Project {client.test_id}",
-            "description": "First project",
-            "date_debut": today.isoformat(),
-            "date_echeance": (today + timedelta(days=30)).isoformat(),
-            "type": "INTERNE",
-            "stade": "En cours",
-            "commentaire": None,
-            "heures_planifiees": 100.0,
-            "heures_reelles": 0.0,
-            "est_template": False,
-            "projet_template_id": None,
-            "responsable_id": 1,
-            "entreprise_id": 1,
-            "contact_id": None
-        }
+        project_data = make_project_payload(
+            numero="PROJ-DUP-NOM-1",
+            nom="Duplicate Name Project",
+            description="First project"
+        )
 
         # Create first project
         response1 = client.post("/api/projects", json=project_data)
         assert response1.status_code == 201
 
         # Act - Try to create duplicate name (different numero)
-        project_data["numero"] = f"PROJ-DUP-NOM-2-{client.test_id}"
+        project_data["numero"] = "PROJ-DUP-NOM-2"
         response2 = client.post("/api/projects", json=project_data)
 
         # Assert
         assert response2.status_code == 409
         assert "nom" in response2.json()["detail"]
 
-    def test_create_project_invalid_heures_returns_422(self, client):
+    def test_create_project_invalid_heures_returns_422(self, client, make_project_payload):
         """Test that negative heures_planifiees returns 422 validation error."""
         # Arrange
-        today = date.today()
-        project_data = {
-            "numero": f"PROJ-INV-HEURES-{client.test_id}",
-            "nom": "Invalid Heures Project",
-            "description": "Has negative heures",
-            "date_debut": today.isoformat(),
-            "date_echeance": (today + timedelta(days=30)).isoformat(),
-            "type": "INTERNE",
-            "stade": "En cours",
-            "commentaire": None,
-            "heures_planifiees": -50.0,
-            "heures_reelles": 0.0,
-            "est_template": False,
-            "projet_template_id": None,
-            "responsable_id": 1,
-            "entreprise_id": 1,
-            "contact_id": None
-        }
+        project_data = make_project_payload(
+            numero="PROJ-INV-HEURES",
+            nom="Invalid Heures Project",
+            description="Has negative heures",
+            heures_planifiees=-50.0
+        )
 
         # Act
         response = client.post("/api/projects", json=project_data)
@@ -163,61 +98,40 @@ class TestCreateProjectEndpoint:
         errors = response.json()["detail"]
         assert any("heures" in str(error).lower() for error in errors)
 
-    def test_create_project_invalid_dates_returns_422(self, client):
+    def test_create_project_invalid_dates_returns_422(self, client, make_project_payload):
         """Test that date_echeance before date_debut returns 422."""
         # Arrange
         today = date.today()
-        project_data = {
-            "numero": f"PROJ-INV-DATES-{client.test_id}",
-            "nom": "Invalid Dates Project",
-            "description": "Has invalid dates",
-            "date_debut": today.isoformat(),
-            "date_echeance": (today - timedelta(days=10)).isoformat(),
-            "type": "INTERNE",
-            "stade": "En cours",
-            "commentaire": None,
-            "heures_planifiees": 100.0,
-            "heures_reelles": 0.0,
-            "est_template": False,
-            "projet_template_id": None,
-            "responsable_id": 1,
-            "entreprise_id": 1,
-            "contact_id": None
-        }
+        project_data = make_project_payload(
+            numero="PROJ-INV-DATES",
+            nom="Invalid Dates Project",
+            description="Has invalid dates",
+            date_echeance=(today - timedelta(days=10)).isoformat()
+        )
 
         # Act
         response = client.post("/api/projects", json=project_data)
 
         # Assert
         assert response.status_code == 422
-        errors = response.json()["detail"]
-        assert any("date" in str(error).lower() for error in errors)
+        # Rejected by the domain (not by the schema): detail is its message
+        assert "date" in response.json()["detail"].lower()
 
 
 class TestGetProjectEndpoint:
     """Test suite for GET /api/projects/{id} endpoint."""
 
-    def test_get_project_success(self, client):
+    def test_get_project_success(self, client, make_project_payload):
         """Test successful project retrieval returns 200 with data."""
         # Arrange - Create a project first
-        today = date.today()
-        project_data = {
-            "numero": f"PROJ-RETRIEVE-{client.test_id}",
-            "nom": f"Project to Retrieve {client.test_id}",
-            "description": "Will be retrieved",
-            "date_debut": today.isoformat(),
-            "date_echeance": (today + timedelta(days=30)).isoformat(),
-            "type": "INTERNE",
-            "stade": "En cours",
-            "commentaire": "Retrieve me",
-            "heures_planifiees": 150.0,
-            "heures_reelles": 50.0,
-            "est_template": False,
-            "projet_template_id": None,
-            "responsable_id": 1,
-            "entreprise_id": 1,
-            "contact_id": None
-        }
+        project_data = make_project_payload(
+            numero="PROJ-RETRIEVE",
+            nom="Project to Retrieve",
+            description="Will be retrieved",
+            commentaire="Retrieve me",
+            heures_planifiees=150.0,
+            heures_reelles=50.0
+        )
         create_response = client.post("/api/projects", json=project_data)
         assert create_response.status_code == 201
         project_id = create_response.json()["id"]
@@ -229,7 +143,7 @@ class TestGetProjectEndpoint:
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == project_id
-        assert f"Project to Retrieve {client.test_id}" in data["nom"]
+        assert data["nom"] == "Project to Retrieve"
         assert data["is_active"] is True
         assert data["days_remaining"] >= 0
         assert data["avancement"] > 0  # Should have some progress since heures_reelles > 0
@@ -271,7 +185,8 @@ class TestAPIDocumentation:
 
         # Assert
         assert response.status_code == 200
-        assert "swagger" in response.text.lower() or "<!doctype html>" in response.text.lower()
+        assert response.headers["content-type"].startswith("text/html")
+        assert "swagger-ui" in response.text
 
     def test_redoc_accessible(self, client):
         """Test that ReDoc documentation is accessible."""
@@ -280,4 +195,5 @@ class TestAPIDocumentation:
 
         # Assert
         assert response.status_code == 200
-        assert "redoc" in response.text.lower() or "<!doctype html>" in response.text.lower()
+        assert response.headers["content-type"].startswith("text/html")
+        assert "redoc" in response.text
@@ -3,55 +3,54 @@ E2E tests for complete CRUD operations on the API.
 
 Tests the UPDATE, DELETE, and LIST endpoints.
 """
-import pytest
-import uuid
 from datetime import date, timedelta
 from fastapi.testclient import TestClient
 
-from src.main import app
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def unique_name():
-    """Generate a unique project name for each test."""
-    return f"Project-{uuid.uuid4().hex[:8]}"
+from src.domain.entities.project_type import ProjectType
+
+
+def _project_rows(label: str, count: int) -> list[dict]:
+    """Field values of count projects named Project-<label>-1 to Project-<label>-<count>."""
+    today = date.today()
+    return [
+        {
+            "numero": f"PROJ-{label.upper()}-{i}",
+            "nom": f"Project-{label}-{i}",
+            "description": f"Description {i}",
+            "date_debut": today,
+            "date_echeance": today + timedelta(days=365),
+            "type": ProjectType.INTERNAL,
+            "stade": "En cours",
+            "commentaire": None,
+            "heures_planifiees": 100.0,
+            "heures_reelles": 0.0,
+            "est_template": False,
+            "projet_template_id": None,
+            "responsable_id": 1,
+            "entreprise_id": 1,
+            "contact_id": None,
+        }
+        for i in range(1, count + 1)
+    ]
 
 
 class TestUpdateProjectEndpoint:
     """Test suite for PUT /api/projects/{id} endpoint."""
 
-    def test_update_project_nom_success(self, client: TestClient, unique_name: str):
+    def test_update_project_nom_success(self, client: TestClient, make_project_payload):
         """Test updating only the project nom."""
         # Arrange: Create a project first
-        today = date.today()
-        original_name = f"{unique_name}-original"
-        updated_name = f"{unique_name}-updated"
+        original_name = "Project-original"
+        updated_name = "Project-updated"
 
         create_response = client.post(
             "/api/projects",
-            json={
-                "numero": f"PROJ-UPD-NOM-{uuid.uuid4().hex[:8]}",
-                "nom": original_name,
-                "description": "Test project",
-                "date_debut": str(today),
-                "date_echeance": str(today + timedelta(days=365)),
-                "type": "INTERNE",
-                "stade": "En cours",
-                "commentaire": "Original comment",
-                "heures_planifiees": 100.0,
-                "heures_reelles": 0.0,
-                "est_template": False,
-                "projet_template_id": None,
-                "responsable_id": 1,
-                "entreprise_id": 1,
-                "contact_id": None
-            }
+            json=make_project_payload(
+                numero="PROJ-UPD-NOM",
+                nom=original_name,
+                description="Test project",
+                commentaire="Original comment"
+            )
         )
         assert create_response.status_code == 201
         project_id = create_response.json()["id"]
@@ -69,31 +68,19 @@ class TestUpdateProjectEndpoint:
         assert data["description"] == "Test project"  # Unchanged
         assert data["heures_planifiees"] == 100.0  # Unchanged
 
-    def test_update_project_multiple_fields(self, client: TestClient, unique_name: str):
+    def test_update_project_multiple_fields(self, client: TestClient, make_project_payload):
         """Test updating multiple fields at once."""
         # Arrange: Create a project
-        today = date.today()
-        name = f"{unique_name}-multi"
+        name = "Project-multi"
 
         create_response = client.post(
             "/api/projects",
-            json={
-                "numero": f"PROJ-UPD-MULTI-{uuid.uuid4().hex[:8]}",
-                "nom": name,
-                "description": "Original description",
-                "date_debut": str(today),
-                "date_echeance": str(today + timedelta(days=365)),
-                "type": "INTERNE",
-                "stade": "En cours",
-                "commentaire": "Original comment",
-                "heures_planifiees": 100.0,
-                "heures_reelles": 0.0,
-                "est_template": False,
-                "projet_template_id": None,
-                "responsable_id": 1,
-                "entreprise_id": 1,
-                "contact_id": None
-            }
+            json=make_project_payload(
+                numero="PROJ-UPD-MULTI",
+                nom=name,
+                description="Original description",
+                commentaire="Original comment"
+            )
         )
         assert create_response.status_code == 201
         project_id = create_response.json()["id"]
@@ -130,53 +117,28 @@ class TestUpdateProjectEndpoint:
         assert response.status_code == 404
         assert "99999" in response.json()["detail"]
 
-    def test_update_project_duplicate_name_returns_409(self, client: TestClient, unique_name: str):
+    def test_update_project_duplicate_name_returns_409(self, client: TestClient, make_project_payload):
         """Test updating to an existing name returns 409 Conflict."""
         # Arrange: Create two projects
-        today = date.today()
-        name_a = f"{unique_name}-A"
-        name_b = f"{unique_name}-B"
+        name_a = "Project-A"
+        name_b = "Project-B"
 
         client.post(
             "/api/projects",
-            json={
-                "numero": f"PROJ-UPD-DUP-A-{uuid.uuid4().hex[:8]}",
-                "nom": name_a,
-                "description": "First project",
-                "date_debut": str(today),
-                "date_echeance": str(today + timedelta(days=365)),
-                "type": "INTERNE",
-                "stade": "En cours",
-                "commentaire": None,
-                "heures_planifiees": 100.0,
-                "heures_reelles": 0.0,
-                "est_template": False,
-                "projet_template_id": None,
-                "responsable_id": 1,
-                "entreprise_id": 1,
-                "contact_id": None
-            }
+            json=make_project_payload(
+                numero="PROJ-UPD-DUP-A",
+                nom=name_a,
+                description="First project"
+            )
         )
 
         create_response = client.post(
             "/api/projects",
-            json={
-                "numero": f"PROJ-UPD-DUP-B-{uuid.uuid4().hex[:8]}",
-                "nom": name_b,
-                "description": "Second project",
-                "date_debut": str(today),
-                "date_echeance": str(today + timedelta(days=365)),
-                "type": "INTERNE",
-                "stade": "En cours",
-                "commentaire": None,
-                "heures_planifiees": 100.0,
-                "heures_reelles": 0.0,
-                "est_template": False,
-                "projet_template_id": None,
-                "responsable_id": 1,
-                "entreprise_id": 1,
-                "contact_id": None
-            }
+            json=make_project_payload(
+                numero="PROJ-UPD-DUP-B",
+                nom=name_b,
+                description="Second project"
+            )
         )
         project_b_id = create_response.json()["id"]
 
@@ -190,31 +152,18 @@ class TestUpdateProjectEndpoint:
         assert response.status_code == 409
         assert name_a in response.json()["detail"]
 
-    def test_update_project_invalid_heures_returns_422(self, client: TestClient, unique_name: str):
+    def test_update_project_invalid_heures_returns_422(self, client: TestClient, make_project_payload):
         """Test updating with invalid heures_planifiees returns 422."""
         # Arrange: Create a project
-        today = date.today()
-        name = f"{unique_name}-heures"
+        name = "Project-heures"
 
         create_response = client.post(
             "/api/projects",
-            json={
-                "numero": f"PROJ-UPD-HEURES-{uuid.uuid4().hex[:8]}",
-                "nom": name,
-                "description": "Test",
-                "date_debut": str(today),
-                "date_echeance": str(today + timedelta(days=365)),
-                "type": "INTERNE",
-                "stade": "En cours",
-                "commentaire": None,
-                "heures_planifiees": 100.0,
-                "heures_reelles": 0.0,
-                "est_template": False,
-                "projet_template_id": None,
-                "responsable_id": 1,
-                "entreprise_id": 1,
-                "contact_id": None
-            }
+            json=make_project_payload(
+                numero="PROJ-UPD-HEURES",
+                nom=name,
+                description="Test"
+            )
         )
         project_id = create_response.json()["id"]
 
@@ -231,29 +180,16 @@ class TestUpdateProjectEndpoint:
 class TestDeleteProjectEndpoint:
     """Test suite for DELETE /api/projects/{id} endpoint."""
 
-    def test_delete_project_success(self, client: TestClient):
+    def test_delete_project_success(self, client: TestClient, make_project_payload):
         """Test successfully deleting a project."""
         # Arrange: Create a project
-        today = date.today()
         create_response = client.post(
             "/api/projects",
-            json={
-                "numero": f"PROJ-DEL-{uuid.uuid4().hex[:8]}",
-                "nom": "Project to Delete",
-                "description": "Will be deleted",
-                "date_debut": str(today),
-                "date_echeance": str(today + timedelta(days=365)),
-                "type": "INTERNE",
-                "stade": "En cours",
-                "commentaire": None,
-                "heures_planifiees": 100.0,
-                "heures_reelles": 0.0,
-                "est_template": False,
-                "projet_template_id": None,
-                "responsable_id": 1,
-                "entreprise_id": 1,
-                "contact_id": None
-            }
+            json=make_project_payload(
+                numero="PROJ-DEL",
+                nom="Project to Delete",
+                description="Will be deleted"
+            )
         )
         assert create_response.status_code == 201
         project_id = create_response.json()["id"]
@@ -282,86 +218,31 @@ class TestListProjectsEndpoint:
     """Test suite for GET /api/projects endpoint (list with pagination)."""
 
     def test_list_projects_empty(self, client: TestClient):
-        """Test listing projects - may not be empty due to other tests."""
+        """Test listing projects on an empty database returns an empty list."""
         # Act
         response = client.get("/api/projects")
 
         # Assert
         assert response.status_code == 200
-        assert isinstance(response.json(), list)  # Should be a list (may be empty or not)
+        assert response.json() == []
 
-    def test_list_projects_returns_all_projects(self, client: TestClient, unique_name: str):
+    def test_list_projects_returns_all_projects(self, client: TestClient, seed_projects):
         """Test listing all projects."""
-        # Arrange: Get current count first
-        initial_response = client.get("/api/projects")
-        initial_count = len(initial_response.json())
-
-        # Create 3 projects with unique names
-        today = date.today()
-        created_names = []
-        for i in range(3):
-            name = f"{unique_name}-list-{i+1}"
-            created_names.append(name)
-            response = client.post(
-                "/api/projects",
-                json={
-                    "numero": f"PROJ-LIST-{uuid.uuid4().hex[:8]}",
-                    "nom": name,
-                    "description": f"Description {i+1}",
-                    "date_debut": str(today),
-                    "date_echeance": str(today + timedelta(days=365)),
-                    "type": "INTERNE",
-                    "stade": "En cours",
-                    "commentaire": None,
-                    "heures_planifiees": 100.0 * (i + 1),
-                    "heures_reelles": 0.0,
-                    "est_template": False,
-                    "projet_template_id": None,
-                    "responsable_id": 1,
-                    "entreprise_id": 1,
-                    "contact_id": None
-                }
-            )
-            assert response.status_code == 201
+        # Arrange
+        created_names = [p.nom for p in seed_projects(_project_rows("list", 3))]
 
-        # Act: Get all projects (with high limit to ensure we get our new ones)
-        response = client.get("/api/projects?limit=100")
+        # Act
+        response = client.get("/api/projects")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data) >= initial_count + 3  # At least the initial + 3 we created
-        # Check that our created projects are in the list
-        response_names = [p["nom"] for p in data]
-        for name in created_names:
-            assert name in response_names
+        assert [p["nom"] for p in data] == created_names
 
-    def test_list_projects_pagination_limit(self, client: TestClient, unique_name: str):
+    def test_list_projects_pagination_limit(self, client: TestClient, seed_projects):
         """Test pagination with limit parameter."""
-        # Arrange: Create 5 projects with unique names
-        today = date.today()
-        for i in range(5):
-            response = client.post(
-                "/api/projects",
-                json={
-                    "numero": f"PROJ-LIMIT-{uuid.uuid4().hex[:8]}",
-                    "nom": f"{unique_name}-limit-{i+1}",
-                    "description": f"Description {i+1}",
-                    "date_debut": str(today),
-                    "date_echeance": str(today + timedelta(days=365)),
-                    "type": "INTERNE",
-                    "stade": "En cours",
-                    "commentaire": None,
-                    "heures_planifiees": 100.0,
-                    "heures_reelles": 0.0,
-                    "est_template": False,
-                    "projet_template_id": None,
-                    "responsable_id": 1,
-                    "entreprise_id": 1,
-                    "contact_id": None
-                }
-            )
-            assert response.status_code == 201
+        # Arrange
+        seed_projects(_project_rows("limit", 5))
 
         # Act: Request only 2 projects
         response = client.get("/api/projects?limit=2")
@@ -371,83 +252,28 @@ class TestListProjectsEndpoint:
         data = response.json()
         assert len(data) == 2  # Should limit to 2
 
-    def test_list_projects_pagination_offset(self, client: TestClient, unique_name: str):
+    def test_list_projects_pagination_offset(self, client: TestClient, seed_projects):
         """Test pagination with offset parameter."""
-        # Arrange: Get current count
-        initial_response = client.get("/api/projects")
-        initial_count = len(initial_response.json())
-
-        # Create 3 new projects with unique names
-        today = date.today()
-        for i in range(3):
-            response = client.post(
-                "/api/projects",
-                json={
-                    "numero": f"PROJ-OFFSET-{uuid.uuid4().hex[:8]}",
-                    "nom": f"{unique_name}-offset-{i+1}",
-                    "description": f"Description {i+1}",
-                    "date_debut": str(today),
-                    "date_echeance": str(today + timedelta(days=365)),
-                    "type": "INTERNE",
-                    "stade": "En cours",
-                    "commentaire": None,
-                    "heures_planifiees": 100.0,
-                    "heures_reelles": 0.0,
-                    "est_template": False,
-                    "projet_template_id": None,
-                    "responsable_id": 1,
-                    "entreprise_id": 1,
-                    "contact_id": None
-                }
-            )
-            assert response.status_code == 201
+        # Arrange
+        seed_projects(_project_rows("offset", 3))
 
-        # Act: Skip first N projects
-        response = client.get(f"/api/projects?offset={initial_count + 2}")
+        # Act: Skip the first 2 projects
+        response = client.get("/api/projects?offset=2")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data) >= 1  # Should get at least the last project we created
+        assert [p["nom"] for p in data] == ["Project-offset-3"]
 
-    def test_list_projects_pagination_offset_and_limit(self, client: TestClient, unique_name: str):
+    def test_list_projects_pagination_offset_and_limit(self, client: TestClient, seed_projects):
         """Test pagination with both offset and limit."""
-        # Arrange: Get current count
-        initial_response = client.get("/api/projects")
-        initial_count = len(initial_response.json())
-
-        # Create 5 projects with unique names
-        today = date.today()
-        created_names = []
-        for i in range(5):
-            name = f"{unique_name}-both-{i+1}"
-            created_names.append(name)
-            response = client.post(
-                "/api/projects",
-                json={
-                    "numero": f"PROJ-BOTH-{uuid.uuid4().hex[:8]}",
-                    "nom": name,
-                    "description": f"Description {i+1}",
-                    "date_debut": str(today),
-                    "date_echeance": str(today + timedelta(days=365)),
-                    "type": "INTERNE",
-                    "stade": "En cours",
-                    "commentaire": None,
-                    "heures_planifiees": 100.0,
-                    "heures_reelles": 0.0,
-                    "est_template": False,
-                    "projet_template_id": None,
-                    "responsable_id": 1,
-                    "entreprise_id": 1,
-                    "contact_id": None
-                }
-            )
-            assert response.status_code == 201
+        # Arrange
+        created_names = [p.nom for p in seed_projects(_project_rows("both", 5))]
 
-        # Act: Skip first (initial_count + 1), get 2
-        response = client.get(f"/api/projects?offset={initial_count + 1}&limit=2")
+        # Act: Skip the first project, get 2
+        response = client.get("/api/projects?offset=1&limit=2")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 2  # Should get exactly 2 projects
+        assert [p["nom"] for p in data] == created_names[1:3]
@@ -2,56 +2,9 @@
 Tests end-to-end pour l'API Utilisateurs.
 
 Ces tests vérifient le fonctionnement complet de l'API via HTTP.
+Le client (fixture client du conftest) utilise une base en mémoire dont
+chaque test est annulé par rollback.
 """
-import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
-from src.main import app
-from src.di_container import get_db_session
-from src.adapters.secondary.repositories.sqlalchemy_project_repository import Base
-
-
-# Fixture pour la base de données de test
-@pytest.fixture(scope="function", autouse=False)
-def test_db():
-    """Créer une base de données de test en mémoire ISOLÉE pour chaque test."""
-    # Créer un nouveau moteur avec un nom unique pour forcer l'isolation
-    import uuid
-    db_name = f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
-    engine = create_engine(
-        f"sqlite:///{db_name}",
-        connect_args={"check_same_thread": False, "uri": True}
-    )
-
-    # Créer toutes les tables dans cette base isolée
-    Base.metadata.create_all(engine)
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-    def override_get_db():
-        """Override de la session DB pour les tests."""
-        session = TestingSessionLocal()
-        try:
-            yield session
-        finally:
-            session.close()
-
-    # Override de la dépendance FastAPI
-    app.dependency_overrides[get_db_session] = override_get_db
-
-    yield engine
-
-    # Cleanup complet après le test
-    app.dependency_overrides.clear()
-    Base.metadata.drop_all(bind=engine)
-    engine.dispose()
-
-
-@pytest.fixture
-def client(test_db):
-    """Client de test FastAPI avec base de données isolée."""
-    return TestClient(app)
 
 
 def test_create_user_success(client):
@@ -147,6 +100,31 @@ def test_get_user_success(client):
     assert data["email"] == "jean.dupont@example.com"
 
 
+def test_get_user_etag_returns_304_until_modified(client):
+    """GET /api/users/{id} avec If-None-Match doit retourner 304 tant que rien ne change."""
+    create_response = client.post("/api/users", json={
+        "nom": "Dupont",
+        "prenom": "Jean",
+        "email": "jean.dupont@example.com",
+        "mot_de_passe": "Password123!",
+        "role": "EMPLOYE"
+    })
+    user_id = create_response.json()["id"]
+
+    etag = client.get(f"/api/users/{user_id}").headers["ETag"]
+    response = client.get(f"/api/users/{user_id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+    client.put(f"/api/users/{user_id}", json={"nom": "Durand"})
+    response = client.get(f"/api/users/{user_id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["nom"] == "Durand"
+    assert response.headers["ETag"] != etag
+
+
 def test_get_user_not_found_returns_404(client):
     """GET /api/users/{id} avec un ID inexistant doit retourner 404."""
     response = client.get("/api/users/999")
@@ -199,6 +177,29 @@ def test_list_users_with_pagination(client):
     assert len(response2.json()) == 2
 
 
+def test_list_users_with_cursor(client):
+    """GET /api/users?cursor= doit paginer par curseur via X-Next-Cursor."""
+    for i in range(3):
+        client.post("/api/users", json={
+            "nom": f"User{i}",
+            "prenom": "Test",
+            "email": f"user{i}@example.com",
+            "mot_de_passe": "Password123!",
+            "role": "EMPLOYE"
+        })
+
+    # Première page: curseur 0
+    response1 = client.get("/api/users?cursor=0&limit=2")
+    assert response1.status_code == 200
+    assert [u["nom"] for u in response1.json()] == ["User0", "User1"]
+    next_cursor = response1.headers["X-Next-Cursor"]
+
+    # Dernière page: plus de curseur suivant
+    response2 = client.get(f"/api/users?cursor={next_cursor}&limit=2")
+    assert [u["nom"] for u in response2.json()] == ["User2"]
+    assert "X-Next-Cursor" not in response2.headers
+
+
 def test_update_user_success(client):
     """PUT /api/users/{id} doit mettre à jour l'utilisateur."""
     # Créer un utilisateur
@@ -0,0 +1,65 @@
+"""
+Test data builders for domain entities.
+
+Defaults live in one place; tests only spell out the fields they care
+about. Dependency-free equivalent of a factory_boy Factory.build().
+"""
+from datetime import date, datetime, timedelta
+from itertools import count
+
+from src.domain.entities.project import Project
+from src.domain.entities.project_type import ProjectType
+
+# Fixed creation timestamp: deterministic, and no clock read per build
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Sequence shared by every build: numero and nom stay unique within a run
+_sequence = count(1)
+
+
+def build_project(**overrides) -> Project:
+    """
+    Build a valid Project (not persisted), with unique numero and nom.
+
+    Args:
+        **overrides: Project fields to set instead of the defaults
+
+    Returns:
+        Project: A valid Project entity (id=None unless overridden)
+    """
+    n = next(_sequence)
+    today = date.today()
+    fields = {
+        "id": None,
+        "numero": f"PROJ-{n:05d}",
+        "nom": f"Project {n:05d}",
+        "description": "A test project description",
+        "date_debut": today,
+        "date_echeance": today + timedelta(days=365),
+        "type": ProjectType.INTERNAL,
+        "stade": "En cours",
+        "commentaire": None,
+        "heures_planifiees": 100.0,
+        "heures_reelles": 0.0,
+        "est_template": False,
+        "projet_template_id": None,
+        "responsable_id": 1,
+        "entreprise_id": 1,
+        "contact_id": None,
+        "date_creation": FROZEN_NOW,
+    }
+    return Project(**{**fields, **overrides})
+
+
+def build_projects(size: int, **overrides) -> list[Project]:
+    """
+    Build several valid Projects sharing the same overrides.
+
+    Args:
+        size: Number of projects to build
+        **overrides: Project fields set on every project
+
+    Returns:
+        list[Project]: The projects, each with its own numero and nom
+    """
+    return [build_project(**overrides) for _ in range(size)]
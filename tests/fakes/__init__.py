@@ -0,0 +1,5 @@
+"""
+Test doubles.
+In-memory fakes of the secondary ports, and a controllable clock,
+for domain service tests.
+"""
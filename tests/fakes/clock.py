@@ -0,0 +1,13 @@
+"""
+Controllable monotonic clock for time-dependent domain services.
+"""
+
+
+class FakeClock:
+    """Monotonic clock driven by the test: advance it with clock.now += seconds."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
@@ -0,0 +1,183 @@
+"""
+In-memory fake of ProjectRepositoryPort for domain service tests.
+
+Plain dict storage and real Python methods: much cheaper per call than a
+Mock(spec=ProjectRepositoryPort), and the results stay consistent between
+calls (a saved project can be found, updated, deleted...).
+
+Tests that need call assertions can wrap a method:
+    repository.save = MagicMock(wraps=repository.save)
+"""
+from dataclasses import replace
+from datetime import date, datetime
+from itertools import count
+from typing import Collection, Iterator, Optional
+
+from src.domain.entities.project import Project
+from src.ports.secondary.project_repository import ConflictFlags, ProjectRepositoryPort
+
+
+class InMemoryProjectRepository(ProjectRepositoryPort):
+    """ProjectRepositoryPort backed by a dict, projects ordered by ID."""
+
+    def __init__(self) -> None:
+        self._by_id: dict[int, Project] = {}
+        self._next_id = count(1)
+
+    def save(self, project: Project) -> Project:
+        """Assign the next ID and store the project."""
+        saved = replace(project, id=next(self._next_id))
+        self._by_id[saved.id] = saved
+        return saved
+
+    def save_many(self, projects: list[Project]) -> list[Project]:
+        """Save each project, keeping the input order."""
+        return [self.save(project) for project in projects]
+
+    def find_by_id(self, project_id: int) -> Optional[Project]:
+        """Dict lookup by ID."""
+        return self._by_id.get(project_id)
+
+    def find_all(self, offset: int = 0, limit: int = 20) -> list[Project]:
+        """Slice of the projects ordered by ID."""
+        return list(self._by_id.values())[offset:offset + limit]
+
+    def approx_count(self) -> int:
+        """Exact count: nothing to estimate in memory."""
+        return len(self._by_id)
+
+    def stream_after(self, last_id: Optional[int], limit: int) -> Iterator[Project]:
+        """Yield up to limit projects with an ID greater than last_id."""
+        projects = (p for p in self._by_id.values() if last_id is None or p.id > last_id)
+        for _, project in zip(range(limit), projects):
+            yield project
+
+    def exists_by_name(self, name: str) -> bool:
+        """True if a stored project has this name."""
+        return any(p.nom == name for p in self._by_id.values())
+
+    def exists_by_numero(self, numero: str) -> bool:
+        """True if a stored project has this numero."""
+        return any(p.numero == numero for p in self._by_id.values())
+
+    def find_existing_keys(
+        self,
+        numeros: Collection[str],
+        noms: Collection[str]
+    ) -> tuple[set[str], set[str]]:
+        """Return the given numeros and noms already taken."""
+        return (
+            {p.numero for p in self._by_id.values() if p.numero in numeros},
+            {p.nom for p in self._by_id.values() if p.nom in noms}
+        )
+
+    def duplicate(
+        self,
+        project_id: int,
+        numero: str,
+        nom: str,
+        date_debut: date,
+        date_echeance: date,
+        date_creation: datetime
+    ) -> Optional[Project]:
+        """Copy the source project with the given overrides."""
+        source = self._by_id.get(project_id)
+        if source is None:
+            return None
+        return self.save(replace(
+            source,
+            numero=numero,
+            nom=nom,
+            date_debut=date_debut,
+            date_echeance=date_echeance,
+            heures_reelles=0.0,
+            est_template=False,
+            projet_template_id=None,
+            date_creation=date_creation
+        ))
+
+    def create_from_template(
+        self,
+        template_id: int,
+        numero: str,
+        nom: str,
+        date_debut: date,
+        date_echeance: date,
+        responsable_id: int,
+        entreprise_id: int,
+        contact_id: Optional[int],
+        date_creation: datetime
+    ) -> Optional[Project]:
+        """Copy the template with the given values; None if it is not a template."""
+        template = self._by_id.get(template_id)
+        if template is None or not template.est_template:
+            return None
+        return self.save(replace(
+            template,
+            numero=numero,
+            nom=nom,
+            date_debut=date_debut,
+            date_echeance=date_echeance,
+            heures_reelles=0.0,
+            est_template=False,
+            projet_template_id=template_id,
+            responsable_id=responsable_id,
+            entreprise_id=entreprise_id,
+            contact_id=contact_id,
+            date_creation=date_creation
+        ))
+
+    def check_conflicts(
+        self,
+        numero: Optional[str],
+        nom: Optional[str],
+        exclude_id: Optional[int] = None
+    ) -> ConflictFlags:
+        """Report which of numero and nom another project already uses."""
+        others = [p for p in self._by_id.values() if p.id != exclude_id]
+        return ConflictFlags(
+            numero=numero is not None and any(p.numero == numero for p in others),
+            nom=nom is not None and any(p.nom == nom for p in others)
+        )
+
+    def delete(self, project_id: int) -> bool:
+        """Remove the project; False if it did not exist."""
+        return self._by_id.pop(project_id, None) is not None
+
+    def update(self, project: Project) -> Optional[Project]:
+        """Replace the stored project; None if it does not exist."""
+        if project.id not in self._by_id:
+            return None
+        self._by_id[project.id] = project
+        return project
+
+    def mark_as_template(self, project_id: int) -> Optional[Project]:
+        """Set est_template=True on the stored project."""
+        project = self._by_id.get(project_id)
+        if project is None:
+            return None
+        return self.update(replace(project, est_template=True))
+
+    def get_hours(self, project_id: int) -> Optional[tuple[float, float]]:
+        """Return (heures_planifiees, heures_reelles)."""
+        project = self._by_id.get(project_id)
+        if project is None:
+            return None
+        return project.heures_planifiees, project.heures_reelles
+
+    def find_templates(self, offset: int = 0, limit: int = 20) -> list[Project]:
+        """Slice of the templates ordered by ID."""
+        templates = [p for p in self._by_id.values() if p.est_template]
+        return templates[offset:offset + limit]
+
+    def find_by_template_id(self, template_id: int) -> list[Project]:
+        """Projects created from the given template."""
+        return [p for p in self._by_id.values() if p.projet_template_id == template_id]
+
+    def find_by_entreprise(self, entreprise_id: int) -> list[Project]:
+        """Projects of the given entreprise."""
+        return [p for p in self._by_id.values() if p.entreprise_id == entreprise_id]
+
+    def find_by_responsable(self, responsable_id: int) -> list[Project]:
+        """Projects of the given responsable."""
+        return [p for p in self._by_id.values() if p.responsable_id == responsable_id]
@@ -5,7 +5,9 @@ Tests the repository implementation with a real database (SQLite in-memory).
 These tests verify that the repository correctly interacts with the database.
 """
 import pytest
+from dataclasses import replace
 from datetime import date, datetime, timedelta
+from sqlalchemy import text
 
 from src.adapters.secondary.repositories.sqlalchemy_project_repository import (
     SQLAlchemyProjectRepository,
@@ -13,6 +15,7 @@ from src.adapters.secondary.repositories.sqlalchemy_project_repository import (
 )
 from src.domain.entities.project import Project
 from src.domain.entities.project_type import ProjectType
+from tests.factories import build_projects
 
 
 class TestRepositorySave:
@@ -65,6 +68,44 @@ class TestRepositorySave:
         assert project_model.numero == sample_project.numero
 
 
+class TestRepositorySaveMany:
+    """Test suite for repository save_many / find_existing_keys operations."""
+
+    def test_save_many_inserts_all_projects_in_order(self, db_session, sample_project_data):
+        """Test that save_many() returns the saved projects with IDs, in order."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        projects = [
+            Project(id=None, date_creation=datetime.now(), **{
+                **sample_project_data, "numero": f"PROJ-M{i}", "nom": f"Many {i}"
+            })
+            for i in range(3)
+        ]
+
+        # Act
+        saved = repository.save_many(projects)
+
+        # Assert
+        assert [p.nom for p in saved] == ["Many 0", "Many 1", "Many 2"]
+        assert all(p.id is not None for p in saved)
+        assert len(repository.find_all()) == 3
+
+    def test_find_existing_keys_returns_taken_values(self, db_session, create_project_in_db, sample_project_data):
+        """Test that find_existing_keys() reports taken numeros and noms separately."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        create_project_in_db(sample_project_data)
+
+        # Act
+        numeros, noms = repository.find_existing_keys(
+            [sample_project_data["numero"], "PROJ-FREE"], ["Free name"]
+        )
+
+        # Assert
+        assert numeros == {sample_project_data["numero"]}
+        assert noms == set()
+
+
 class TestRepositoryFindById:
     """Test suite for repository find_by_id operations."""
 
@@ -152,6 +193,40 @@ class TestRepositoryExistsByNumero:
         assert exists is False
 
 
+class TestRepositoryCheckConflicts:
+    """Test suite for repository check_conflicts operations."""
+
+    def test_check_conflicts_reports_each_taken_key(self, db_session, create_project_in_db, sample_project_data):
+        """Test that check_conflicts() flags the numero and the nom independently."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        create_project_in_db(sample_project_data)
+
+        # Act
+        both = repository.check_conflicts(sample_project_data["numero"], sample_project_data["nom"])
+        numero_only = repository.check_conflicts(sample_project_data["numero"], "Autre nom")
+        none = repository.check_conflicts("PROJ-NONEXISTENT", "Autre nom")
+
+        # Assert
+        assert (both.numero, both.nom) == (True, True)
+        assert (numero_only.numero, numero_only.nom) == (True, False)
+        assert (none.numero, none.nom) == (False, False)
+
+    def test_check_conflicts_ignores_excluded_project(self, db_session, create_project_in_db, sample_project_data):
+        """Test that check_conflicts() ignores the project being updated."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        project_model = create_project_in_db(sample_project_data)
+
+        # Act
+        conflicts = repository.check_conflicts(
+            sample_project_data["numero"], sample_project_data["nom"], exclude_id=project_model.id
+        )
+
+        # Assert
+        assert (conflicts.numero, conflicts.nom) == (False, False)
+
+
 class TestRepositoryFindAll:
     """Test suite for repository find_all operations."""
 
@@ -219,15 +294,15 @@ class TestRepositoryFindAll:
         assert any(p.nom == "Project Alpha" for p in projects)
         assert any(p.nom == "Project Beta" for p in projects)
 
-    def test_find_all_with_pagination(self, db_session, create_project_in_db):
+    def test_find_all_with_pagination(self, db_session, create_projects_in_db):
         """Test that find_all() respects offset and limit parameters."""
         # Arrange
         repository = SQLAlchemyProjectRepository(db_session)
         today = date.today()
 
         # Create 5 projects
-        for i in range(5):
-            project_data = {
+        create_projects_in_db([
+            {
                 "numero": f"PROJ-{i:03d}",
                 "nom": f"Project {i}",
                 "description": f"Description {i}",
@@ -244,7 +319,8 @@ class TestRepositoryFindAll:
                 "entreprise_id": 1,
                 "contact_id": None,
             }
-            create_project_in_db(project_data)
+            for i in range(5)
+        ])
 
         # Act
         projects_page1 = repository.find_all(offset=0, limit=2)
@@ -255,6 +331,84 @@ class TestRepositoryFindAll:
         assert len(projects_page2) == 2
 
 
+class TestRepositoryApproxCount:
+    """Test suite for repository approx_count."""
+
+    def test_approx_count_is_exact_without_statistics(self, db_session, create_projects_in_db, sample_project_data):
+        """Test that approx_count() falls back to COUNT(*) before any ANALYZE."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        create_projects_in_db([
+            {**sample_project_data, "numero": f"PROJ-{i:03d}", "nom": f"Project {i}"}
+            for i in range(3)
+        ])
+
+        # Act & Assert
+        assert repository.approx_count() == 3
+
+    def test_approx_count_reads_analyze_statistics(self, db_session, create_projects_in_db, sample_project_data):
+        """Test that approx_count() returns the row count recorded by ANALYZE."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        create_projects_in_db([
+            {**sample_project_data, "numero": f"PROJ-{i:03d}", "nom": f"Project {i}"}
+            for i in range(3)
+        ])
+        db_session.execute(text("ANALYZE"))
+        create_projects_in_db([{**sample_project_data, "numero": "PROJ-NEW", "nom": "New"}])
+
+        # Act & Assert: the row inserted after ANALYZE is not seen
+        assert repository.approx_count() == 3
+
+
+    def test_approx_count_ignores_partial_index_statistics(self, db_session, create_projects_in_db, sample_project_data):
+        """Test that approx_count() is not fooled by the partial templates index."""
+        # Arrange: 10 projects, 1 template (the only row of idx_projets_templates)
+        repository = SQLAlchemyProjectRepository(db_session)
+        models = create_projects_in_db([
+            {**sample_project_data, "numero": f"PROJ-{i:03d}", "nom": f"Project {i}"}
+            for i in range(10)
+        ])
+        repository.mark_as_template(models[0].id)
+        db_session.execute(text("ANALYZE"))
+        db_session.execute(text("ANALYZE ix_projets_nom"))
+        db_session.execute(text("ANALYZE ix_projets_numero"))
+
+        # Act & Assert
+        assert repository.approx_count() == 10
+
+class TestRepositoryStreamAfter:
+    """Test suite for repository stream_after (keyset pagination)."""
+
+    def test_stream_after_pages_by_id(self, db_session):
+        """Test that stream_after() resumes strictly after the given ID, in ID order."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        ids = [p.id for p in repository.save_many(build_projects(5))]
+
+        # Act
+        first_page = list(repository.stream_after(None, 2))
+        next_page = list(repository.stream_after(first_page[-1].id, 2))
+        last_page = list(repository.stream_after(ids[-1], 2))
+
+        # Assert
+        assert [p.id for p in first_page] == ids[:2]
+        assert [p.id for p in next_page] == ids[2:4]
+        assert last_page == []
+
+    def test_stream_after_is_lazy(self, db_session):
+        """Test that stream_after() returns an iterator, not a list."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+
+        # Act
+        result = repository.stream_after(None, 10)
+
+        # Assert
+        assert not isinstance(result, list)
+        assert list(result) == []
+
+
 class TestRepositoryFindTemplates:
     """Test suite for repository find_templates operations."""
 
@@ -324,6 +478,28 @@ class TestRepositoryFindTemplates:
         # Assert
         assert templates == []
 
+    def test_find_templates_with_pagination(self, db_session, create_projects_in_db, sample_project_data):
+        """Test that find_templates() pages through templates ordered by ID."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        create_projects_in_db([
+            {
+                **sample_project_data,
+                "numero": f"TEMPLATE-{i}",
+                "nom": f"Template {i}",
+                "est_template": True,
+            }
+            for i in range(3)
+        ])
+
+        # Act
+        first_page = repository.find_templates(offset=0, limit=2)
+        second_page = repository.find_templates(offset=2, limit=2)
+
+        # Assert
+        assert [t.nom for t in first_page] == ["Template 0", "Template 1"]
+        assert [t.nom for t in second_page] == ["Template 2"]
+
 
 class TestRepositoryUpdate:
     """Test suite for repository update operations."""
@@ -367,6 +543,133 @@ class TestRepositoryUpdate:
         assert result.heures_reelles == 120.0
         assert result.responsable_id == 2
 
+    def test_update_returns_none_if_not_found(self, db_session, sample_project):
+        """Test that update() returns None for a non-existent ID."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        missing = replace(sample_project, id=99999)
+
+        # Act
+        result = repository.update(missing)
+
+        # Assert
+        assert result is None
+
+    def test_mark_as_template_sets_flag(self, db_session, create_project_in_db, sample_project_data):
+        """Test that mark_as_template() flips est_template and returns the project."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        project_model = create_project_in_db(sample_project_data)
+
+        # Act
+        result = repository.mark_as_template(project_model.id)
+
+        # Assert
+        assert result.est_template is True
+        assert result.nom == sample_project_data["nom"]
+        assert repository.find_by_id(project_model.id).est_template is True
+
+
+class TestRepositoryCopies:
+    """Test suite for repository duplicate/create_from_template operations."""
+
+    def test_duplicate_copies_source_with_overrides(self, db_session, create_project_in_db, sample_project_data):
+        """Test that duplicate() copies the source row server-side."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        source = create_project_in_db({**sample_project_data, "heures_reelles": 40.0})
+        today = date.today()
+
+        # Act
+        copy = repository.duplicate(
+            source.id,
+            numero="PROJ-COPY",
+            nom="Copy",
+            date_debut=today,
+            date_echeance=today + timedelta(days=10),
+            date_creation=datetime.now()
+        )
+
+        # Assert
+        assert copy.id != source.id
+        assert (copy.numero, copy.nom) == ("PROJ-COPY", "Copy")
+        assert copy.date_echeance == today + timedelta(days=10)
+        assert copy.description == sample_project_data["description"]
+        assert copy.heures_planifiees == sample_project_data["heures_planifiees"]
+        assert copy.heures_reelles == 0.0
+        assert copy.est_template is False
+        assert copy.projet_template_id is None
+
+    def test_duplicate_returns_none_if_source_not_found(self, db_session):
+        """Test that duplicate() inserts nothing for a non-existent source."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        today = date.today()
+
+        # Act
+        copy = repository.duplicate(
+            99999,
+            numero="PROJ-COPY",
+            nom="Copy",
+            date_debut=today,
+            date_echeance=today + timedelta(days=10),
+            date_creation=datetime.now()
+        )
+
+        # Assert
+        assert copy is None
+        assert repository.find_all() == []
+
+    def test_create_from_template_requires_template(self, db_session, create_project_in_db, sample_project_data):
+        """Test that create_from_template() only copies projects marked as templates."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        template = create_project_in_db({**sample_project_data, "est_template": True})
+        regular = create_project_in_db({**sample_project_data, "numero": "PROJ-REG", "nom": "Regular"})
+        today = date.today()
+        kwargs = {
+            "date_debut": today,
+            "date_echeance": today + timedelta(days=10),
+            "responsable_id": 7,
+            "entreprise_id": 8,
+            "contact_id": None,
+            "date_creation": datetime.now(),
+        }
+
+        # Act
+        created = repository.create_from_template(template.id, numero="PROJ-T1", nom="From template", **kwargs)
+        refused = repository.create_from_template(regular.id, numero="PROJ-T2", nom="Refused", **kwargs)
+
+        # Assert
+        assert created.projet_template_id == template.id
+        assert created.est_template is False
+        assert (created.responsable_id, created.entreprise_id) == (7, 8)
+        assert refused is None
+
+
+class TestRepositoryGetHours:
+    """Test suite for repository get_hours operations."""
+
+    def test_get_hours_returns_planned_and_actual_hours(self, db_session, create_project_in_db, sample_project_data):
+        """Test that get_hours() returns (heures_planifiees, heures_reelles)."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+        project_model = create_project_in_db({**sample_project_data, "heures_reelles": 40.0})
+
+        # Act
+        hours = repository.get_hours(project_model.id)
+
+        # Assert
+        assert hours == (sample_project_data["heures_planifiees"], 40.0)
+
+    def test_get_hours_returns_none_if_not_found(self, db_session):
+        """Test that get_hours() returns None for a non-existent ID."""
+        # Arrange
+        repository = SQLAlchemyProjectRepository(db_session)
+
+        # Act & Assert
+        assert repository.get_hours(99999) is None
+
 
 class TestRepositoryDelete:
     """Test suite for repository delete operations."""
@@ -462,15 +765,15 @@ class TestRepositoryFindByTemplateId:
 class TestRepositoryFindByEntreprise:
     """Test suite for repository find_by_entreprise operations."""
 
-    def test_find_by_entreprise_returns_projects_for_entreprise(self, db_session, create_project_in_db):
+    def test_find_by_entreprise_returns_projects_for_entreprise(self, db_session, create_project_in_db, create_projects_in_db):
         """Test that find_by_entreprise() returns all projects for a specific entreprise."""
         # Arrange
         repository = SQLAlchemyProjectRepository(db_session)
         today = date.today()
 
         # Create projects for entreprise 1
-        for i in range(2):
-            project_data = {
+        create_projects_in_db([
+            {
                 "numero": f"PROJ-ENT1-{i}",
                 "nom": f"Entreprise 1 Project {i}",
                 "description": f"Description {i}",
@@ -487,7 +790,8 @@ class TestRepositoryFindByEntreprise:
                 "entreprise_id": 1,
                 "contact_id": None,
             }
-            create_project_in_db(project_data)
+            for i in range(2)
+        ])
 
         # Create project for entreprise 2
         project_data_ent2 = {
@@ -523,15 +827,15 @@ class TestRepositoryFindByEntreprise:
 class TestRepositoryFindByResponsable:
     """Test suite for repository find_by_responsable operations."""
 
-    def test_find_by_responsable_returns_projects_for_responsable(self, db_session, create_project_in_db):
+    def test_find_by_responsable_returns_projects_for_responsable(self, db_session, create_project_in_db, create_projects_in_db):
         """Test that find_by_responsable() returns all projects for a specific responsable."""
         # Arrange
         repository = SQLAlchemyProjectRepository(db_session)
         today = date.today()
 
         # Create projects for responsable 1
-        for i in range(3):
-            project_data = {
+        create_projects_in_db([
+            {
                 "numero": f"PROJ-RESP1-{i}",
                 "nom": f"Responsable 1 Project {i}",
                 "description": f"Description {i}",
@@ -548,7 +852,8 @@ class TestRepositoryFindByResponsable:
                 "entreprise_id": 1,
                 "contact_id": None,
             }
-            create_project_in_db(project_data)
+            for i in range(3)
+        ])
 
         # Create project for responsable 2
         project_data_resp2 = {
@@ -5,31 +5,15 @@ Ces tests vérifient l'interaction réelle avec une base de données.
 """
 import pytest
 from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
 
 from src.domain.entities.user import Utilisateur, RoleUtilisateur
 from src.adapters.secondary.repositories.sqlalchemy_user_repository import (
     SQLAlchemyUserRepository,
-    UtilisateurModel,
-    Base
+    UtilisateurModel
 )
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    """Session de test avec rollback automatique."""
-    # Créer un moteur SQLite en mémoire pour les tests
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-
-    yield session
-
-    session.close()
-
-
 @pytest.fixture
 def user_repository(db_session):
     """Repository avec session de test."""
@@ -81,6 +65,33 @@ def test_find_by_id_returns_user(user_repository, db_session):
     assert found.role == RoleUtilisateur.GESTIONNAIRE
 
 
+def test_find_by_id_reuses_session_identity_map(user_repository, db_session):
+    """Relire un utilisateur dans la même session ne refait pas de requête."""
+    saved = user_repository.save(Utilisateur(
+        id=None,
+        nom="Dupont",
+        prenom="Jean",
+        email="jean.dupont@example.com",
+        mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+        role=RoleUtilisateur.EMPLOYE,
+        date_creation=datetime.now(),
+        actif=True
+    ))
+    user_repository.find_by_id(saved.id)
+
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        found = user_repository.find_by_id(saved.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert found.email == "jean.dupont@example.com"
+    assert statements == []
+
+
 def test_find_by_id_returns_none_if_not_found(user_repository):
     """find_by_id doit retourner None si l'utilisateur n'existe pas."""
     found = user_repository.find_by_id(999)
@@ -158,6 +169,72 @@ def test_find_all_with_pagination(user_repository):
     assert page1[0].nom != page2[0].nom  # Pages différentes
 
 
+def test_find_with_email_check(user_repository):
+    """find_with_email_check renvoie l'utilisateur et la collision d'email en une requête."""
+    ids = [
+        user_repository.save(Utilisateur(
+            id=None,
+            nom=f"User{i}",
+            prenom="Test",
+            email=f"user{i}@example.com",
+            mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+            role=RoleUtilisateur.EMPLOYE,
+            date_creation=datetime.now(),
+            actif=True
+        )).id
+        for i in range(2)
+    ]
+
+    utilisateur, pris = user_repository.find_with_email_check(ids[0], "user1@example.com")
+    assert utilisateur.id == ids[0]
+    assert pris is True
+
+    # Son propre email n'est pas une collision
+    assert user_repository.find_with_email_check(ids[0], "user0@example.com")[1] is False
+    assert user_repository.find_with_email_check(99999, "user1@example.com") == (None, False)
+
+
+def test_find_after_pages_by_id(user_repository):
+    """find_after doit reprendre strictement après l'ID donné, trié par ID."""
+    ids = [
+        user_repository.save(Utilisateur(
+            id=None,
+            nom=f"User{i}",
+            prenom="Test",
+            email=f"user{i}@example.com",
+            mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+            role=RoleUtilisateur.EMPLOYE,
+            date_creation=datetime.now(),
+            actif=True
+        )).id
+        for i in range(5)
+    ]
+
+    page1 = user_repository.find_after(after_id=None, limit=2)
+    page2 = user_repository.find_after(after_id=page1[-1].id, limit=2)
+
+    assert [u.id for u in page1] == ids[:2]
+    assert [u.id for u in page2] == ids[2:4]
+    assert user_repository.find_after(after_id=ids[-1], limit=2) == []
+
+
+def test_approx_count_counts_users(user_repository):
+    """approx_count doit compter les utilisateurs (COUNT(*) sans statistiques)."""
+    for i in range(2):
+        user_repository.save(Utilisateur(
+            id=None,
+            nom=f"User{i}",
+            prenom="Test",
+            email=f"user{i}@example.com",
+            mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+            role=RoleUtilisateur.EMPLOYE,
+            date_creation=datetime.now(),
+            actif=True
+        ))
+
+    assert user_repository.approx_count() == 2
+
+
 def test_exists_by_email_returns_true_if_exists(user_repository):
     """exists_by_email doit retourner True si l'email existe."""
     # Créer un utilisateur
@@ -186,6 +263,33 @@ def test_exists_by_email_returns_false_if_not_exists(user_repository):
     assert exists is False
 
 
+def test_save_duplicate_email_raises_already_exists(user_repository):
+    """save doit traduire la violation d'unicité de l'email en erreur du domaine."""
+    from src.domain.exceptions import EntityAlreadyExistsError
+
+    mot_de_passe_hash = Utilisateur.hash_mot_de_passe("Password123!")
+
+    def nouvel_utilisateur(nom: str) -> Utilisateur:
+        return Utilisateur(
+            id=None,
+            nom=nom,
+            prenom="User",
+            email="doublon@example.com",
+            mot_de_passe_hash=mot_de_passe_hash,
+            role=RoleUtilisateur.EMPLOYE,
+            date_creation=datetime.now(),
+            actif=True
+        )
+
+    user_repository.save(nouvel_utilisateur("Premier"))
+
+    with pytest.raises(EntityAlreadyExistsError):
+        user_repository.save(nouvel_utilisateur("Second"))
+
+    # La session a été remise en état: le repository reste utilisable
+    assert user_repository.find_by_email("doublon@example.com").nom == "Premier"
+
+
 def test_update_user(user_repository):
     """update doit modifier un utilisateur existant."""
     # Créer un utilisateur
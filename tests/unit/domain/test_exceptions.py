@@ -71,6 +71,17 @@ class TestProjectNotFoundError:
         assert str(exception) == "Le projet avec l'ID 42 n'existe pas"
         assert exception.project_id == project_id
 
+    def test_exception_survives_pickling(self):
+        """Test that the lazily formatted message is rebuilt after pickling."""
+        import pickle
+
+        # Act
+        exception = pickle.loads(pickle.dumps(ProjectNotFoundError(7)))
+
+        # Assert
+        assert exception.project_id == 7
+        assert str(exception) == "Le projet avec l'ID 7 n'existe pas"
+
     def test_exception_can_be_raised_and_caught(self):
         """Test that exception can be raised and caught properly."""
         # Arrange
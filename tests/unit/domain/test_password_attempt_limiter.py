@@ -0,0 +1,55 @@
+"""
+Tests unitaires pour le limiteur de tentatives de mot de passe.
+"""
+from src.domain.services.password_attempt_limiter import PasswordAttemptLimiter
+from tests.fakes.clock import FakeClock
+
+
+class TestPasswordAttemptLimiter:
+    """Tests pour PasswordAttemptLimiter."""
+
+    def test_allows_attempts_below_threshold(self):
+        """Aucune attente tant que le seuil d'échecs n'est pas atteint."""
+        limiter = PasswordAttemptLimiter(max_attempts=3, clock=FakeClock(100.0))
+
+        limiter.record_failure(1)
+        limiter.record_failure(1)
+
+        assert limiter.retry_after(1) == 0.0
+
+    def test_delay_doubles_after_each_failure(self):
+        """Au-delà du seuil, l'attente double à chaque échec, plafonnée."""
+        clock = FakeClock(100.0)
+        limiter = PasswordAttemptLimiter(max_attempts=2, base_delay=1.0, max_delay=3.0, clock=clock)
+
+        limiter.record_failure(1)
+        delays = []
+        for _ in range(3):
+            limiter.record_failure(1)
+            delays.append(limiter.retry_after(1))
+
+        assert delays == [1.0, 2.0, 3.0]
+
+        clock.now += 3.0
+        assert limiter.retry_after(1) == 0.0
+
+    def test_reset_clears_failures(self):
+        """reset() efface le compteur d'un seul utilisateur."""
+        limiter = PasswordAttemptLimiter(max_attempts=1, clock=FakeClock(100.0))
+        limiter.record_failure(1)
+        limiter.record_failure(2)
+
+        limiter.reset(1)
+
+        assert limiter.retry_after(1) == 0.0
+        assert limiter.retry_after(2) > 0.0
+
+    def test_delay_stays_capped_after_many_failures(self):
+        """Un très grand nombre d'échecs ne fait pas déborder le calcul du délai."""
+        clock = FakeClock(100.0)
+        limiter = PasswordAttemptLimiter(max_attempts=5, base_delay=1.0, max_delay=300.0, clock=clock)
+
+        for _ in range(2000):
+            limiter.record_failure(1)
+
+        assert limiter.retry_after(1) == 300.0
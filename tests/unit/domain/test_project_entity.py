@@ -4,7 +4,10 @@ Unit tests for Project entity.
 Tests the business logic and validation rules in the Project entity.
 No infrastructure dependencies - pure domain logic testing.
 """
+import pickle
+
 import pytest
+from dataclasses import FrozenInstanceError, replace
 from datetime import date, datetime, timedelta
 
 from src.domain.entities.project import Project
@@ -274,6 +277,33 @@ class TestProjectValidation:
                 date_creation=datetime.now()
             )
 
+    def test_project_rejects_raw_string_matching_type_value(self):
+        """Test that a plain string equal to an enum value is not accepted as a type."""
+        # Arrange
+        today = date.today()
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Le type doit être une instance de ProjectType"):
+            Project(
+                id=None,
+                numero="PROJ-001",
+                nom="Test Project",
+                description="Test",
+                date_debut=today,
+                date_echeance=today + timedelta(days=30),
+                type="INTERNAL",  # type: ignore
+                stade=None,
+                commentaire=None,
+                heures_planifiees=100.0,
+                heures_reelles=0.0,
+                est_template=False,
+                projet_template_id=None,
+                responsable_id=1,
+                entreprise_id=1,
+                contact_id=None,
+                date_creation=datetime.now()
+            )
+
 
 class TestProjectBusinessLogic:
     """Test suite for Project business logic methods."""
@@ -428,6 +458,37 @@ class TestProjectBusinessLogic:
         # Assert
         assert result == 0
 
+    def test_date_methods_use_provided_reference_date(self):
+        """Test that is_active, days_remaining and est_en_retard honour an explicit today."""
+        # Arrange
+        start = date(2024, 1, 1)
+        project = Project(
+            id=1,
+            numero="PROJ-REF",
+            nom="Reference Date Project",
+            description="Evaluated against a fixed date",
+            date_debut=start,
+            date_echeance=start + timedelta(days=30),
+            type=ProjectType.INTERNAL,
+            stade="En cours",
+            commentaire=None,
+            heures_planifiees=100.0,
+            heures_reelles=10.0,
+            est_template=False,
+            projet_template_id=None,
+            responsable_id=1,
+            entreprise_id=1,
+            contact_id=None,
+            date_creation=datetime.now()
+        )
+        reference = start + timedelta(days=10)
+
+        # Act & Assert
+        assert project.is_active(reference) is True
+        assert project.days_remaining(reference) == 20
+        assert project.est_en_retard(reference) is False
+        assert project.est_en_retard(start + timedelta(days=31)) is True
+
     def test_calculer_avancement_normal(self):
         """Test avancement calculation with normal values."""
         # Arrange
@@ -578,6 +639,15 @@ class TestProjectBusinessLogic:
         # Assert
         assert result == -25.0
 
+    def test_hours_helpers_match_entity_methods(self):
+        """Test static hour helpers give the same results as the entity methods."""
+        # Arrange / Act / Assert
+        assert Project.avancement(80.0, 40.0) == 50.0
+        assert Project.avancement(0.0, 10.0) == 0.0
+        assert Project.ecart_temps(100.0, 120.0) == 20.0
+        assert Project.ecart_pourcentage(100.0, 75.0) == -25.0
+        assert Project.ecart_pourcentage(0.0, 10.0) == 0.0
+
     def test_est_en_retard_hours_exceeded(self):
         """Test that project is late when hours exceeded."""
         # Arrange
@@ -787,3 +857,117 @@ class TestProjectBusinessLogic:
 
         # Assert
         assert result is False
+
+
+class TestProjectFromDbRow:
+    """Test suite for Project.from_db_row (repository rehydration path)."""
+
+    def test_from_db_row_equals_validated_construction(self):
+        """Test that a rehydrated project is equal to one built through __init__."""
+        # Arrange
+        today = date.today()
+        fields = dict(
+            id=1,
+            numero="PROJ-001",
+            nom="Test Project",
+            description="A test project",
+            date_debut=today,
+            date_echeance=today + timedelta(days=30),
+            type=ProjectType.INTERNAL,
+            stade="En cours",
+            commentaire=None,
+            heures_planifiees=100.0,
+            heures_reelles=10.0,
+            est_template=False,
+            projet_template_id=None,
+            responsable_id=1,
+            entreprise_id=1,
+            contact_id=None,
+            date_creation=datetime.now()
+        )
+
+        # Act
+        project = Project.from_db_row(**fields)
+
+        # Assert
+        assert isinstance(project, Project)
+        assert project == Project(**fields)
+
+    def test_from_db_row_skips_validation(self):
+        """Test that persisted rows are trusted and not re-validated."""
+        # Arrange
+        today = date.today()
+
+        # Act
+        project = Project.from_db_row(
+            id=1,
+            numero="PROJ-001",
+            nom="Test Project",
+            description="A test project",
+            date_debut=today,
+            date_echeance=today,  # Would be rejected by __post_init__
+            type=ProjectType.INTERNAL,
+            stade=None,
+            commentaire=None,
+            heures_planifiees=100.0,
+            heures_reelles=0.0,
+            est_template=False,
+            projet_template_id=None,
+            responsable_id=1,
+            entreprise_id=1,
+            contact_id=None,
+            date_creation=datetime.now()
+        )
+
+        # Assert
+        assert project.date_echeance == project.date_debut
+
+
+class TestProjectImmutability:
+    """Test suite for the slotted, frozen Project dataclass."""
+
+    def _make_project(self) -> Project:
+        today = date.today()
+        return Project(
+            id=1,
+            numero="PROJ-001",
+            nom="Test Project",
+            description="A test project",
+            date_debut=today,
+            date_echeance=today + timedelta(days=30),
+            type=ProjectType.INTERNAL,
+            stade=None,
+            commentaire=None,
+            heures_planifiees=100.0,
+            heures_reelles=0.0,
+            est_template=False,
+            projet_template_id=None,
+            responsable_id=1,
+            entreprise_id=1,
+            contact_id=None,
+            date_creation=datetime.now()
+        )
+
+    def test_project_is_frozen_and_slotted(self):
+        """Test that attributes cannot be reassigned and no __dict__ is allocated."""
+        # Arrange
+        project = self._make_project()
+
+        # Act & Assert
+        with pytest.raises(FrozenInstanceError):
+            project.nom = "Renamed"
+        assert not hasattr(project, "__dict__")
+
+    def test_replace_and_pickle_round_trip(self):
+        """Test that replace() builds a modified copy and pickling still works."""
+        # Arrange
+        project = self._make_project()
+
+        # Act
+        renamed = replace(project, nom="Renamed")
+        restored = pickle.loads(pickle.dumps(renamed))
+
+        # Assert
+        assert project.nom == "Test Project"
+        assert restored == renamed
+        assert restored.nom == "Renamed"
@@ -5,14 +5,17 @@ Tests the domain service business logic with mocked repositories.
 No real database - testing domain logic in isolation.
 """
 import pytest
+from dataclasses import replace
 from datetime import date, datetime, timedelta
 from unittest.mock import Mock
 
-from src.domain.services.project_service import ProjectService
+from src.domain.services.project_service import ProjectService, frozen_clock
+from src.domain.services.template_cache import TemplateCache
 from src.domain.entities.project import Project
 from src.domain.entities.project_type import ProjectType
 from src.domain.exceptions import ProjectAlreadyExistsError, ProjectNotFoundError
-from src.ports.primary.project_use_cases import ProjectUseCasesPort
+from src.ports.primary.project_use_cases import ProjectFromTemplateSpec, ProjectUseCasesPort
+from src.ports.secondary.project_repository import ConflictFlags
 
 
 @pytest.fixture
@@ -75,6 +78,12 @@ class TestProjectServiceArchitecture:
             assert callable(getattr(service, method_name)), \
                 f"ProjectService.{method_name} must be callable"
 
+    def test_project_service_is_slotted(self, mock_repository):
+        """Service instances (one per request) carry no __dict__."""
+        service = ProjectService(mock_repository)
+
+        assert not hasattr(service, "__dict__")
+
 
 class TestCreateProject:
     """Tests du cas d'usage create_project."""
@@ -83,8 +92,7 @@ class TestCreateProject:
         """Créer un projet avec succès."""
         # Arrange
         service = ProjectService(mock_repository)
-        mock_repository.exists_by_numero.return_value = False
-        mock_repository.exists_by_name.return_value = False
+        mock_repository.check_conflicts.return_value = ConflictFlags()
 
         expected_project = Project(id=1, date_creation=datetime.now(), **sample_project_data)
         mock_repository.save.return_value = expected_project
@@ -93,17 +101,46 @@ class TestCreateProject:
         result = service.create_project(**sample_project_data)
 
         # Assert
-        mock_repository.exists_by_numero.assert_called_once_with(sample_project_data["numero"])
-        mock_repository.exists_by_name.assert_called_once_with(sample_project_data["nom"])
+        mock_repository.check_conflicts.assert_called_once_with(
+            sample_project_data["numero"], sample_project_data["nom"], exclude_id=None
+        )
         mock_repository.save.assert_called_once()
         assert result.id == 1
         assert result.nom == sample_project_data["nom"]
 
+    def test_create_project_uses_injected_clock(self, mock_repository, sample_project_data):
+        """La date de création provient de l'horloge injectée."""
+        # Arrange
+        fixed_now = datetime(2024, 1, 15, 9, 30)
+        service = ProjectService(mock_repository, clock=lambda: fixed_now)
+        mock_repository.check_conflicts.return_value = ConflictFlags()
+        mock_repository.save.side_effect = lambda project: project
+
+        # Act
+        result = service.create_project(**sample_project_data)
+
+        # Assert
+        assert result.date_creation == fixed_now
+
+    def test_frozen_clock_reads_clock_once(self, mock_repository):
+        """frozen_clock lit l'horloge une seule fois puis la restaure."""
+        # Arrange
+        clock = Mock(side_effect=[datetime(2024, 1, 1), datetime(2024, 1, 2)])
+        service = ProjectService(mock_repository, clock=clock)
+
+        # Act
+        with frozen_clock(service) as now:
+            first, second = service._clock(), service._clock()
+
+        # Assert
+        assert first == second == now == datetime(2024, 1, 1)
+        assert service._clock is clock
+
     def test_create_project_rejects_duplicate_numero(self, mock_repository, sample_project_data):
         """Ne pas créer un projet avec un numéro existant."""
         # Arrange
         service = ProjectService(mock_repository)
-        mock_repository.exists_by_numero.return_value = True
+        mock_repository.check_conflicts.return_value = ConflictFlags(numero=True)
 
         # Act & Assert
         with pytest.raises(ProjectAlreadyExistsError, match="numéro"):
@@ -116,8 +153,7 @@ class TestCreateProject:
         """Ne pas créer un projet avec un nom existant."""
         # Arrange
         service = ProjectService(mock_repository)
-        mock_repository.exists_by_numero.return_value = False
-        mock_repository.exists_by_name.return_value = True
+        mock_repository.check_conflicts.return_value = ConflictFlags(nom=True)
 
         # Act & Assert
         with pytest.raises(ProjectAlreadyExistsError, match="nom"):
@@ -130,8 +166,7 @@ class TestCreateProject:
         """Les règles de l'entité doivent être validées."""
         # Arrange
         service = ProjectService(mock_repository)
-        mock_repository.exists_by_numero.return_value = False
-        mock_repository.exists_by_name.return_value = False
+        mock_repository.check_conflicts.return_value = ConflictFlags()
 
         # Modifier les données pour invalider les dates
         sample_project_data["date_echeance"] = sample_project_data["date_debut"] - timedelta(days=1)
@@ -181,7 +216,7 @@ class TestUpdateProject:
         service = ProjectService(mock_repository)
         mock_repository.find_by_id.return_value = sample_project_with_id
         # Mock that the new name doesn't exist yet
-        mock_repository.exists_by_name.return_value = False
+        mock_repository.check_conflicts.return_value = ConflictFlags()
 
         updated_project = Project(
             id=1,
@@ -211,6 +246,71 @@ class TestUpdateProject:
         mock_repository.update.assert_called_once()
         assert result.nom == "Updated Name"
 
+    def test_update_project_applies_every_updatable_field(self, mock_repository, sample_project_with_id):
+        """Chaque champ de _UPDATABLE passé en argument est bien appliqué."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.find_by_id.return_value = sample_project_with_id
+        mock_repository.check_conflicts.return_value = ConflictFlags()
+        mock_repository.update.side_effect = lambda project: project
+        nouvelles_valeurs = {
+            "numero": "PROJ-NEW",
+            "nom": "New Name",
+            "description": "New description",
+            "date_debut": sample_project_with_id.date_debut + timedelta(days=1),
+            "date_echeance": sample_project_with_id.date_echeance + timedelta(days=1),
+            "type": ProjectType.EXTERNAL,
+            "stade": "Planifié",
+            "commentaire": "New comment",
+            "heures_planifiees": 200.0,
+            "heures_reelles": 10.0,
+            "est_template": True,
+            "projet_template_id": 7,
+            "responsable_id": 2,
+            "entreprise_id": 3,
+            "contact_id": 4,
+        }
+        assert set(nouvelles_valeurs) == set(ProjectService._UPDATABLE)
+
+        # Act
+        result = service.update_project(project_id=1, **nouvelles_valeurs)
+
+        # Assert
+        for field, value in nouvelles_valeurs.items():
+            assert getattr(result, field) == value
+
+    def test_update_project_keeps_unspecified_fields(self, mock_repository, sample_project_with_id):
+        """Seuls les champs fournis sont modifiés; id et date_creation sont conservés."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.find_by_id.return_value = sample_project_with_id
+        mock_repository.update.side_effect = lambda project: project
+
+        # Act
+        result = service.update_project(project_id=1, stade="Terminé")
+
+        # Assert
+        mock_repository.check_conflicts.assert_not_called()
+        assert result.stade == "Terminé"
+        assert result.id == sample_project_with_id.id
+        assert result.nom == sample_project_with_id.nom
+        assert result.date_creation == sample_project_with_id.date_creation
+        assert result is not sample_project_with_id
+
+    def test_update_project_without_changes_skips_update(self, mock_repository, sample_project_with_id):
+        """Un patch identique à l'existant ne déclenche aucune écriture."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.find_by_id.return_value = sample_project_with_id
+
+        # Act
+        result = service.update_project(project_id=1, nom=sample_project_with_id.nom)
+
+        # Assert
+        assert result is sample_project_with_id
+        mock_repository.check_conflicts.assert_not_called()
+        mock_repository.update.assert_not_called()
+
     def test_update_project_not_found(self, mock_repository):
         """Erreur si projet à mettre à jour n'existe pas."""
         # Arrange
@@ -229,7 +329,6 @@ class TestDeleteProject:
         """Supprimer un projet avec succès."""
         # Arrange
         service = ProjectService(mock_repository)
-        mock_repository.find_by_id.return_value = sample_project_with_id
         mock_repository.delete.return_value = True
 
         # Act
@@ -243,12 +342,14 @@ class TestDeleteProject:
         """Erreur si projet à supprimer n'existe pas."""
         # Arrange
         service = ProjectService(mock_repository)
-        mock_repository.find_by_id.return_value = None
+        mock_repository.delete.return_value = False
 
         # Act & Assert
         with pytest.raises(ProjectNotFoundError):
             service.delete_project(999)
 
+        mock_repository.find_by_id.assert_not_called()
+
 
 class TestListProjects:
     """Tests du cas d'usage list_projects."""
@@ -267,6 +368,47 @@ class TestListProjects:
         assert len(result) == 1
         assert result[0].id == 1
 
+    def test_stream_projects_delegates_to_stream_after(self, mock_repository, sample_project_with_id):
+        """Le parcours par curseur relaie le repository sans matérialiser de liste."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.stream_after.return_value = iter([sample_project_with_id])
+
+        # Act
+        result = service.stream_projects(last_id=10, limit=50)
+
+        # Assert
+        mock_repository.stream_after.assert_not_called()  # générateur paresseux
+        assert list(result) == [sample_project_with_id]
+        mock_repository.stream_after.assert_called_once_with(10, 50)
+
+    def test_list_projects_after_returns_next_cursor(self, mock_repository, sample_project_with_id):
+        """Une page pleine renvoie l'ID de son dernier projet comme curseur suivant."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.stream_after.side_effect = lambda cursor, limit: iter([sample_project_with_id])
+
+        # Act
+        full_page = service.list_projects_after(cursor=0, limit=1)
+        last_page = service.list_projects_after(cursor=0, limit=20)
+
+        # Assert
+        assert full_page == ([sample_project_with_id], 1)
+        assert last_page == ([sample_project_with_id], None)
+        mock_repository.stream_after.assert_called_with(0, 20)
+
+    def test_list_projects_after_rejects_limit_out_of_range(self, mock_repository):
+        """limit hors de [1, 100]: ValueError, sans lecture du repository."""
+        # Arrange
+        service = ProjectService(mock_repository)
+
+        # Act & Assert
+        for limit in (0, 101):
+            with pytest.raises(ValueError, match="entre 1 et 100"):
+                service.list_projects_after(cursor=None, limit=limit)
+
+        mock_repository.stream_after.assert_not_called()
+
 
 class TestDupliquerProjet:
     """Tests du cas d'usage dupliquer_projet."""
@@ -275,9 +417,7 @@ class TestDupliquerProjet:
         """Dupliquer un projet avec succès."""
         # Arrange
         service = ProjectService(mock_repository)
-        mock_repository.find_by_id.return_value = sample_project_with_id
-        mock_repository.exists_by_numero.return_value = False
-        mock_repository.exists_by_name.return_value = False
+        mock_repository.check_conflicts.return_value = ConflictFlags()
 
         nouveau_projet = Project(
             id=2,
@@ -298,7 +438,7 @@ class TestDupliquerProjet:
             contact_id=sample_project_with_id.contact_id,
             date_creation=datetime.now()
         )
-        mock_repository.save.return_value = nouveau_projet
+        mock_repository.duplicate.return_value = nouveau_projet
 
         # Act
         result = service.dupliquer_projet(
@@ -310,11 +450,100 @@ class TestDupliquerProjet:
         )
 
         # Assert
-        mock_repository.save.assert_called_once()
+        mock_repository.duplicate.assert_called_once()
+        mock_repository.find_by_id.assert_not_called()
         assert result.id == 2
         assert result.numero == "PROJ-002"
         assert result.heures_reelles == 0.0
 
+    def test_dupliquer_projet_source_not_found(self, mock_repository):
+        """Erreur si le projet source n'existe pas."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.check_conflicts.return_value = ConflictFlags()
+        mock_repository.duplicate.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ProjectNotFoundError):
+            service.dupliquer_projet(
+                project_id=999,
+                nouveau_numero="PROJ-002",
+                nouveau_nom="Duplicated Project",
+                nouvelle_date_debut=date.today(),
+                nouvelle_date_echeance=date.today() + timedelta(days=30)
+            )
+
+    def test_dupliquer_projet_validates_dates(self, mock_repository):
+        """Les nouvelles dates sont validées avant toute écriture."""
+        # Arrange
+        service = ProjectService(mock_repository)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="date d'échéance doit être après"):
+            service.dupliquer_projet(
+                project_id=1,
+                nouveau_numero="PROJ-002",
+                nouveau_nom="Duplicated Project",
+                nouvelle_date_debut=date.today(),
+                nouvelle_date_echeance=date.today() - timedelta(days=1)
+            )
+
+        mock_repository.duplicate.assert_not_called()
+
+    def test_dupliquer_projet_source_not_found_before_invalid_dates(self, mock_repository):
+        """Source introuvable: 404 même si les nouvelles dates sont invalides."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.find_by_id.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ProjectNotFoundError):
+            service.dupliquer_projet(
+                project_id=999,
+                nouveau_numero="PROJ-002",
+                nouveau_nom="Duplicated Project",
+                nouvelle_date_debut=date.today(),
+                nouvelle_date_echeance=date.today() - timedelta(days=1)
+            )
+
+        mock_repository.duplicate.assert_not_called()
+
+    def test_dupliquer_projet_source_not_found_before_conflict(self, mock_repository):
+        """Source introuvable: 404 même si le nouveau numero est déjà pris."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.check_conflicts.return_value = ConflictFlags(numero=True)
+        mock_repository.find_by_id.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ProjectNotFoundError):
+            service.dupliquer_projet(
+                project_id=999,
+                nouveau_numero="PROJ-001",
+                nouveau_nom="Duplicated Project",
+                nouvelle_date_debut=date.today(),
+                nouvelle_date_echeance=date.today() + timedelta(days=30)
+            )
+
+        mock_repository.duplicate.assert_not_called()
+
+    def test_dupliquer_projet_conflict_with_existing_source(self, mock_repository, sample_project_with_id):
+        """Source existante: le conflit de numero reste une erreur 409."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.check_conflicts.return_value = ConflictFlags(numero=True)
+        mock_repository.find_by_id.return_value = sample_project_with_id
+
+        # Act & Assert
+        with pytest.raises(ProjectAlreadyExistsError):
+            service.dupliquer_projet(
+                project_id=1,
+                nouveau_numero="PROJ-001",
+                nouveau_nom="Duplicated Project",
+                nouvelle_date_debut=date.today(),
+                nouvelle_date_echeance=date.today() + timedelta(days=30)
+            )
+
 
 class TestSauvegarderCommeTemplate:
     """Tests du cas d'usage sauvegarder_comme_template."""
@@ -323,7 +552,6 @@ class TestSauvegarderCommeTemplate:
         """Sauvegarder un projet comme template."""
         # Arrange
         service = ProjectService(mock_repository)
-        mock_repository.find_by_id.return_value = sample_project_with_id
 
         template_project = Project(
             id=sample_project_with_id.id,
@@ -344,15 +572,26 @@ class TestSauvegarderCommeTemplate:
             contact_id=sample_project_with_id.contact_id,
             date_creation=sample_project_with_id.date_creation
         )
-        mock_repository.update.return_value = template_project
+        mock_repository.mark_as_template.return_value = template_project
 
         # Act
         result = service.sauvegarder_comme_template(1)
 
         # Assert
-        mock_repository.update.assert_called_once()
+        mock_repository.mark_as_template.assert_called_once_with(1)
+        mock_repository.find_by_id.assert_not_called()
         assert result.est_template is True
 
+    def test_sauvegarder_comme_template_not_found(self, mock_repository):
+        """Erreur si le projet à transformer n'existe pas."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.mark_as_template.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ProjectNotFoundError):
+            service.sauvegarder_comme_template(999)
+
 
 class TestCreerDepuisTemplate:
     """Tests du cas d'usage creer_depuis_template."""
@@ -383,9 +622,7 @@ class TestCreerDepuisTemplate:
             date_creation=datetime.now()
         )
 
-        mock_repository.find_by_id.return_value = template
-        mock_repository.exists_by_numero.return_value = False
-        mock_repository.exists_by_name.return_value = False
+        mock_repository.check_conflicts.return_value = ConflictFlags()
 
         new_project = Project(
             id=2,
@@ -406,7 +643,7 @@ class TestCreerDepuisTemplate:
             contact_id=None,
             date_creation=datetime.now()
         )
-        mock_repository.save.return_value = new_project
+        mock_repository.create_from_template.return_value = new_project
 
         # Act
         result = service.creer_depuis_template(
@@ -420,7 +657,8 @@ class TestCreerDepuisTemplate:
         )
 
         # Assert
-        mock_repository.save.assert_called_once()
+        mock_repository.create_from_template.assert_called_once()
+        mock_repository.find_by_id.assert_not_called()
         assert result.projet_template_id == 1
         assert result.est_template is False
 
@@ -428,6 +666,8 @@ class TestCreerDepuisTemplate:
         """Erreur si le projet source n'est pas un template."""
         # Arrange
         service = ProjectService(mock_repository)
+        mock_repository.check_conflicts.return_value = ConflictFlags()
+        mock_repository.create_from_template.return_value = None
         mock_repository.find_by_id.return_value = sample_project_with_id
 
         # Act & Assert
@@ -443,32 +683,180 @@ class TestCreerDepuisTemplate:
             )
 
 
+    def test_creer_depuis_template_not_found_before_conflict(self, mock_repository):
+        """Template introuvable: 404 même si le numero est déjà pris."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.check_conflicts.return_value = ConflictFlags(numero=True)
+        mock_repository.find_by_id.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ProjectNotFoundError):
+            service.creer_depuis_template(
+                template_id=999,
+                numero="PROJ-001",
+                nom="Should Fail",
+                date_debut=date.today(),
+                date_echeance=date.today() + timedelta(days=30),
+                responsable_id=1,
+                entreprise_id=1
+            )
+
+        mock_repository.create_from_template.assert_not_called()
+
+    def test_creer_depuis_template_non_template_before_invalid_dates(
+        self, mock_repository, sample_project_with_id
+    ):
+        """Projet non-template: cette erreur passe avant celle des dates."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.find_by_id.return_value = sample_project_with_id
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="n'est pas un template"):
+            service.creer_depuis_template(
+                template_id=1,
+                numero="PROJ-004",
+                nom="Should Fail",
+                date_debut=date.today(),
+                date_echeance=date.today() - timedelta(days=1),
+                responsable_id=1,
+                entreprise_id=1
+            )
+
+        mock_repository.create_from_template.assert_not_called()
+
+
+class TestCreateManyFromTemplate:
+    """Tests du cas d'usage create_many_from_template."""
+
+    @staticmethod
+    def _spec(i: int) -> ProjectFromTemplateSpec:
+        return ProjectFromTemplateSpec(
+            numero=f"PROJ-10{i}",
+            nom=f"Projet {i}",
+            date_debut=date.today(),
+            date_echeance=date.today() + timedelta(days=30),
+            responsable_id=2,
+            entreprise_id=3
+        )
+
+    def test_create_many_from_template_success(self, mock_repository, sample_project_with_id):
+        """Tous les projets sont créés en un seul appel au repository."""
+        # Arrange
+        fixed_now = datetime(2024, 1, 15, 9, 30)
+        service = ProjectService(mock_repository, clock=lambda: fixed_now)
+        mock_repository.find_by_id.return_value = replace(sample_project_with_id, est_template=True)
+        mock_repository.find_existing_keys.return_value = (set(), set())
+        mock_repository.save_many.side_effect = lambda projects: projects
+
+        # Act
+        result = service.create_many_from_template(1, [self._spec(1), self._spec(2)])
+
+        # Assert
+        mock_repository.find_by_id.assert_called_once_with(1)
+        mock_repository.find_existing_keys.assert_called_once_with(
+            {"PROJ-101", "PROJ-102"}, {"Projet 1", "Projet 2"}
+        )
+        mock_repository.save_many.assert_called_once()
+        assert [p.numero for p in result] == ["PROJ-101", "PROJ-102"]
+        assert all(p.projet_template_id == 1 for p in result)
+        assert all(p.est_template is False and p.heures_reelles == 0.0 for p in result)
+        assert all(p.date_creation == fixed_now for p in result)
+
+    def test_create_many_from_template_reuses_cached_template(self, mock_repository, sample_project_with_id):
+        """Le template n'est lu qu'une fois grâce au cache partagé."""
+        # Arrange
+        cache = TemplateCache()
+        mock_repository.find_by_id.return_value = replace(sample_project_with_id, est_template=True)
+        mock_repository.find_existing_keys.return_value = (set(), set())
+        mock_repository.save_many.side_effect = lambda projects: projects
+
+        # Act: deux services distincts (une requête chacun), même cache
+        ProjectService(mock_repository, template_cache=cache).create_many_from_template(1, [self._spec(1)])
+        ProjectService(mock_repository, template_cache=cache).create_many_from_template(1, [self._spec(2)])
+
+        # Assert
+        mock_repository.find_by_id.assert_called_once_with(1)
+
+    def test_template_cache_invalidated_on_update(self, mock_repository, sample_project_with_id):
+        """Modifier un template le retire du cache."""
+        # Arrange
+        cache = TemplateCache()
+        cache.put(sample_project_with_id)
+        service = ProjectService(mock_repository, template_cache=cache)
+        mock_repository.find_by_id.return_value = sample_project_with_id
+        mock_repository.update.side_effect = lambda project: project
+
+        # Act
+        service.update_project(project_id=1, stade="Révisé")
+
+        # Assert
+        assert cache.get(1) is None
+
+    def test_create_many_from_template_rejects_duplicates_in_batch(self, mock_repository, sample_project_with_id):
+        """Un numéro présent deux fois dans le lot est refusé avant la base."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.find_by_id.return_value = replace(sample_project_with_id, est_template=True)
+
+        # Act & Assert
+        with pytest.raises(ProjectAlreadyExistsError, match="numéro"):
+            service.create_many_from_template(1, [self._spec(1), self._spec(1)])
+
+        mock_repository.find_existing_keys.assert_not_called()
+        mock_repository.save_many.assert_not_called()
+
+    def test_create_many_from_template_rejects_existing_name(self, mock_repository, sample_project_with_id):
+        """Un nom déjà pris en base fait échouer tout le lot."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.find_by_id.return_value = replace(sample_project_with_id, est_template=True)
+        mock_repository.find_existing_keys.return_value = (set(), {"Projet 2"})
+
+        # Act & Assert
+        with pytest.raises(ProjectAlreadyExistsError, match="Projet 2"):
+            service.create_many_from_template(1, [self._spec(1), self._spec(2)])
+
+        mock_repository.save_many.assert_not_called()
+
+
 class TestCalculerAvancement:
     """Tests du cas d'usage calculer_avancement."""
 
-    def test_calculer_avancement_success(self, mock_repository, sample_project_with_id):
+    def test_calculer_avancement_success(self, mock_repository):
         """Calculer l'avancement d'un projet."""
         # Arrange
         service = ProjectService(mock_repository)
-        sample_project_with_id.heures_reelles = 50.0
-        mock_repository.find_by_id.return_value = sample_project_with_id
+        mock_repository.get_hours.return_value = (100.0, 50.0)
 
         # Act
         result = service.calculer_avancement(1)
 
         # Assert
+        mock_repository.get_hours.assert_called_once_with(1)
+        mock_repository.find_by_id.assert_not_called()
         assert result == 50.0
 
+    def test_calculer_avancement_not_found(self, mock_repository):
+        """Erreur si le projet n'existe pas."""
+        # Arrange
+        service = ProjectService(mock_repository)
+        mock_repository.get_hours.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ProjectNotFoundError):
+            service.calculer_avancement(999)
+
 
 class TestCalculerEcartTemps:
     """Tests du cas d'usage calculer_ecart_temps."""
 
-    def test_calculer_ecart_temps_success(self, mock_repository, sample_project_with_id):
+    def test_calculer_ecart_temps_success(self, mock_repository):
         """Calculer l'écart temps d'un projet."""
         # Arrange
         service = ProjectService(mock_repository)
-        sample_project_with_id.heures_reelles = 120.0
-        mock_repository.find_by_id.return_value = sample_project_with_id
+        mock_repository.get_hours.return_value = (100.0, 120.0)
 
         # Act
         result = service.calculer_ecart_temps(1)
@@ -478,3 +866,67 @@ class TestCalculerEcartTemps:
         assert result["heures_reelles"] == 120.0
         assert result["ecart"] == 20.0
         assert result["ecart_pourcentage"] == 20.0
+
+
+class TestProjectServiceWithFakeRepository:
+    """Scénarios complets sur le repository en mémoire (pas de Mock)."""
+
+    def test_created_project_can_be_read_back(self, fake_repository, sample_project_data):
+        """Un projet créé est relu tel quel."""
+        # Arrange
+        service = ProjectService(fake_repository)
+
+        # Act
+        created = service.create_project(**sample_project_data)
+
+        # Assert
+        assert service.get_project(created.id) == created
+
+    def test_create_project_rejects_existing_name(self, fake_repository, sample_project_data):
+        """Le nom déjà enregistré est refusé."""
+        # Arrange
+        service = ProjectService(fake_repository)
+        service.create_project(**sample_project_data)
+
+        # Act & Assert
+        with pytest.raises(ProjectAlreadyExistsError):
+            service.create_project(**{**sample_project_data, "numero": "PROJ-002"})
+
+    def test_template_round_trip(self, fake_repository, sample_project_data):
+        """Projet -> template -> projet créé depuis le template."""
+        # Arrange
+        service = ProjectService(fake_repository)
+        template = service.sauvegarder_comme_template(
+            service.create_project(**sample_project_data).id
+        )
+
+        # Act
+        project = service.creer_depuis_template(
+            template_id=template.id,
+            numero="PROJ-002",
+            nom="From Template",
+            date_debut=sample_project_data["date_debut"],
+            date_echeance=sample_project_data["date_echeance"],
+            responsable_id=2,
+            entreprise_id=3,
+            contact_id=None
+        )
+
+        # Assert
+        assert project.projet_template_id == template.id
+        assert project.est_template is False
+        assert fake_repository.find_by_template_id(template.id) == [project]
+        assert service.find_templates() == [template]
+
+    def test_deleted_project_is_not_found(self, fake_repository, sample_project_data):
+        """Un projet supprimé n'est plus trouvé."""
+        # Arrange
+        service = ProjectService(fake_repository)
+        project = service.create_project(**sample_project_data)
+
+        # Act
+        service.delete_project(project.id)
+
+        # Assert
+        with pytest.raises(ProjectNotFoundError):
+            service.get_project(project.id)
@@ -49,6 +49,16 @@ class TestProjectType:
         assert ProjectType("MAINTENANCE") == ProjectType.MAINTENANCE
         assert ProjectType("DEVELOPMENT") == ProjectType.DEVELOPMENT
 
+    def test_from_string_returns_member(self):
+        """from_string doit retourner le membre correspondant à la valeur."""
+        for project_type in ProjectType:
+            assert ProjectType.from_string(project_type.value) is project_type
+
+    def test_from_string_invalid_value_raises_error(self):
+        """from_string doit lever ValueError comme le constructeur de l'enum."""
+        with pytest.raises(ValueError):
+            ProjectType.from_string("INVALIDE")
+
     def test_invalid_value_raises_error(self):
         """Une valeur invalide doit lever une erreur."""
         with pytest.raises(ValueError):
@@ -0,0 +1,55 @@
+"""
+Tests unitaires pour le cache des templates.
+"""
+from dataclasses import replace
+
+from src.domain.services.template_cache import TemplateCache
+from tests.fakes.clock import FakeClock
+
+
+class TestTemplateCache:
+    """Tests pour TemplateCache."""
+
+    def test_get_returns_cached_template(self, sample_project_with_id):
+        """Un template mis en cache est retrouvé par son ID."""
+        cache = TemplateCache()
+        cache.put(sample_project_with_id)
+
+        assert cache.get(sample_project_with_id.id) is sample_project_with_id
+        assert cache.get(999) is None
+
+    def test_entries_expire_after_ttl(self, sample_project_with_id):
+        """Une entrée n'est plus servie une fois son TTL écoulé."""
+        clock = FakeClock()
+        cache = TemplateCache(ttl=60.0, clock=clock)
+        cache.put(sample_project_with_id)
+
+        clock.now = 59.9
+        assert cache.get(sample_project_with_id.id) is sample_project_with_id
+
+        clock.now = 60.0
+        assert cache.get(sample_project_with_id.id) is None
+
+    def test_least_recently_used_entry_is_evicted(self, sample_project_with_id):
+        """Au-delà de maxsize, l'entrée la moins récemment utilisée est évincée."""
+        cache = TemplateCache(maxsize=2)
+        first, second, third = (replace(sample_project_with_id, id=i) for i in (1, 2, 3))
+        cache.put(first)
+        cache.put(second)
+        cache.get(1)  # 1 devient le plus récent
+
+        cache.put(third)
+
+        assert cache.get(1) is first
+        assert cache.get(2) is None
+        assert cache.get(3) is third
+
+    def test_invalidate_removes_entry(self, sample_project_with_id):
+        """invalidate() retire l'entrée (et ignore un ID absent)."""
+        cache = TemplateCache()
+        cache.put(sample_project_with_id)
+
+        cache.invalidate(sample_project_with_id.id)
+        cache.invalidate(999)
+
+        assert cache.get(sample_project_with_id.id) is None
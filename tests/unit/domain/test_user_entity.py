@@ -239,6 +239,23 @@ def test_verifier_permission_employe():
     assert utilisateur.verifier_permission("valider_temps") is False
 
 
+def test_verifier_permission_role_invalide():
+    """Un rôle inconnu ne doit avoir aucune permission."""
+    utilisateur = Utilisateur(
+        id=1,
+        nom="Inconnu",
+        prenom="Role",
+        email="inconnu@example.com",
+        mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+        role="ADMINISTRATEUR",
+        date_creation=datetime.now(),
+        actif=True
+    )
+
+    assert utilisateur.verifier_permission("saisir_temps") is False
+    assert utilisateur.verifier_permission("creer_projet") is False
+
+
 def test_changer_role():
     """La méthode changer_role() doit modifier le rôle."""
     utilisateur = Utilisateur(
@@ -254,3 +271,21 @@ def test_changer_role():
 
     utilisateur.changer_role(RoleUtilisateur.GESTIONNAIRE)
     assert utilisateur.role == RoleUtilisateur.GESTIONNAIRE
+
+
+def test_utilisateur_sans_dict():
+    """L'entité est slottée: pas de __dict__ ni d'attribut imprévu."""
+    utilisateur = Utilisateur(
+        id=1,
+        nom="Dupont",
+        prenom="Jean",
+        email="jean.dupont@example.com",
+        mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+        role=RoleUtilisateur.EMPLOYE,
+        date_creation=datetime.now(),
+        actif=True
+    )
+
+    assert not hasattr(utilisateur, "__dict__")
+    with pytest.raises(AttributeError):
+        utilisateur.telephone = "0600000000"
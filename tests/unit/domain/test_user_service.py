@@ -8,6 +8,8 @@ from unittest.mock import Mock
 from datetime import datetime
 
 from src.domain.entities.user import Utilisateur, RoleUtilisateur
+from src.domain.services.password_attempt_limiter import PasswordAttemptLimiter
+from src.domain.services.ttl_cache import TTLCache
 from src.domain.services.user_service import UserService
 from src.domain.exceptions import (
     EntityAlreadyExistsError,
@@ -29,6 +31,11 @@ def user_service(mock_user_repository):
     return UserService(mock_user_repository)
 
 
+def test_user_service_sans_dict(user_service):
+    """Le service (créé à chaque requête) n'a pas de __dict__ par instance."""
+    assert not hasattr(user_service, "__dict__")
+
+
 def test_creer_utilisateur_success(user_service, mock_user_repository):
     """Créer un utilisateur avec succès."""
     # Arrange
@@ -80,6 +87,27 @@ def test_creer_utilisateur_email_existe(user_service, mock_user_repository):
     mock_user_repository.save.assert_not_called()
 
 
+def test_creer_utilisateur_normalise_avant_verification(user_service, mock_user_repository):
+    """L'unicité est vérifiée sur l'email normalisé, celui qui sera stocké."""
+    # Arrange
+    mock_user_repository.exists_by_email.return_value = False
+    mock_user_repository.save.side_effect = lambda utilisateur: utilisateur
+
+    # Act
+    resultat = user_service.creer_utilisateur(
+        nom="  Dupont ",
+        prenom=" Jean",
+        email=" Jean.Dupont@Example.COM ",
+        mot_de_passe="Password123!",
+        role=RoleUtilisateur.EMPLOYE
+    )
+
+    # Assert
+    mock_user_repository.exists_by_email.assert_called_once_with("jean.dupont@example.com")
+    assert resultat.email == "jean.dupont@example.com"
+    assert (resultat.nom, resultat.prenom) == ("Dupont", "Jean")
+
+
 def test_creer_utilisateur_mot_de_passe_trop_court(user_service, mock_user_repository):
     """Rejeter un mot de passe trop court."""
     # Arrange
@@ -96,6 +124,26 @@ def test_creer_utilisateur_mot_de_passe_trop_court(user_service, mock_user_repos
         )
 
 
+def test_creer_utilisateur_erreur_chainee(user_service, mock_user_repository):
+    """L'erreur de domaine conserve la ValueError d'origine en __cause__."""
+    # Arrange
+    mock_user_repository.exists_by_email.return_value = False
+
+    # Act
+    with pytest.raises(DomainValidationError) as exc_info:
+        user_service.creer_utilisateur(
+            nom="Dupont",
+            prenom="Jean",
+            email="jean.dupont@example.com",
+            mot_de_passe="court",
+            role=RoleUtilisateur.EMPLOYE
+        )
+
+    # Assert
+    assert isinstance(exc_info.value.__cause__, ValueError)
+    assert exc_info.value.args == exc_info.value.__cause__.args
+
+
 def test_obtenir_utilisateur_success(user_service, mock_user_repository):
     """Récupérer un utilisateur par son ID."""
     # Arrange
@@ -167,6 +215,34 @@ def test_lister_utilisateurs_success(user_service, mock_user_repository):
     mock_user_repository.find_all.assert_called_once_with(offset=0, limit=20)
 
 
+def test_lister_utilisateurs_apres_renvoie_curseur_suivant(user_service, mock_user_repository):
+    """La pagination par curseur renvoie l'ID du dernier utilisateur si la page est pleine."""
+    # Arrange
+    utilisateurs = [
+        Utilisateur(
+            id=user_id,
+            nom="Dupont",
+            prenom="Jean",
+            email=f"jean{user_id}@example.com",
+            mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+            role=RoleUtilisateur.EMPLOYE,
+            date_creation=datetime.now(),
+            actif=True
+        )
+        for user_id in (11, 12)
+    ]
+    mock_user_repository.find_after.return_value = utilisateurs
+
+    # Act
+    page_pleine = user_service.lister_utilisateurs_apres(curseur=10, limit=2)
+    page_partielle = user_service.lister_utilisateurs_apres(curseur=10, limit=5)
+
+    # Assert
+    mock_user_repository.find_after.assert_called_with(after_id=10, limit=5)
+    assert page_pleine == (utilisateurs, 12)
+    assert page_partielle == (utilisateurs, None)
+
+
 def test_lister_utilisateurs_offset_negatif(user_service):
     """Rejeter un offset négatif."""
     with pytest.raises(DomainValidationError, match="ne peut pas être négatif"):
@@ -222,8 +298,7 @@ def test_modifier_utilisateur_email_existe(user_service, mock_user_repository):
         date_creation=datetime.now(),
         actif=True
     )
-    mock_user_repository.find_by_id.return_value = utilisateur_existant
-    mock_user_repository.exists_by_email.return_value = True
+    mock_user_repository.find_with_email_check.return_value = (utilisateur_existant, True)
 
     # Act & Assert
     with pytest.raises(EntityAlreadyExistsError):
@@ -233,6 +308,76 @@ def test_modifier_utilisateur_email_existe(user_service, mock_user_repository):
         )
 
 
+def test_modifier_utilisateur_sans_changement(user_service, mock_user_repository):
+    """Des valeurs identiques (ou absentes) ne déclenchent aucune écriture."""
+    # Arrange
+    utilisateur_existant = Utilisateur(
+        id=1,
+        nom="Dupont",
+        prenom="Jean",
+        email="jean.dupont@example.com",
+        mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+        role=RoleUtilisateur.EMPLOYE,
+        date_creation=datetime.now(),
+        actif=True
+    )
+    mock_user_repository.find_with_email_check.return_value = (utilisateur_existant, False)
+
+    # Act
+    resultat = user_service.modifier_utilisateur(
+        user_id=1,
+        nom=" Dupont ",
+        email="Jean.Dupont@example.com"
+    )
+
+    # Assert
+    assert resultat is utilisateur_existant
+    mock_user_repository.find_by_id.assert_not_called()
+    mock_user_repository.update.assert_not_called()
+
+
+def test_modifier_utilisateur_prenom_vide(user_service, mock_user_repository):
+    """Un prénom vidé est rejeté par le validateur du champ modifié."""
+    # Arrange
+    mock_user_repository.find_by_id.return_value = Utilisateur(
+        id=1,
+        nom="Dupont",
+        prenom="Jean",
+        email="jean.dupont@example.com",
+        mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+        role=RoleUtilisateur.EMPLOYE,
+        date_creation=datetime.now(),
+        actif=True
+    )
+
+    # Act & Assert
+    with pytest.raises(DomainValidationError, match="prénom ne peut pas être vide"):
+        user_service.modifier_utilisateur(user_id=1, nom="Durand", prenom="   ")
+
+    mock_user_repository.update.assert_not_called()
+
+
+def test_modifier_utilisateur_email_invalide(user_service, mock_user_repository):
+    """Un nouvel email mal formé est rejeté sans écriture."""
+    # Arrange
+    mock_user_repository.find_with_email_check.return_value = (Utilisateur(
+        id=1,
+        nom="Dupont",
+        prenom="Jean",
+        email="jean.dupont@example.com",
+        mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+        role=RoleUtilisateur.EMPLOYE,
+        date_creation=datetime.now(),
+        actif=True
+    ), False)
+
+    # Act & Assert
+    with pytest.raises(DomainValidationError, match="format valide"):
+        user_service.modifier_utilisateur(user_id=1, email="pas-un-email")
+
+    mock_user_repository.update.assert_not_called()
+
+
 def test_supprimer_utilisateur_success(user_service, mock_user_repository):
     """Supprimer (désactiver) un utilisateur avec succès."""
     # Arrange
@@ -287,6 +432,31 @@ def test_activer_desactiver_utilisateur(user_service, mock_user_repository):
     assert resultat.actif is True
 
 
+def test_activer_desactiver_utilisateur_sans_changement(user_service, mock_user_repository):
+    """Un statut inchangé ne déclenche aucune écriture."""
+    # Arrange
+    utilisateur = Utilisateur(
+        id=1,
+        nom="Dupont",
+        prenom="Jean",
+        email="jean.dupont@example.com",
+        mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+        role=RoleUtilisateur.EMPLOYE,
+        date_creation=datetime.now(),
+        actif=False
+    )
+    mock_user_repository.find_by_id.return_value = utilisateur
+
+    # Act
+    resultat = user_service.activer_desactiver_utilisateur(1, False)
+    supprime = user_service.supprimer_utilisateur(1)
+
+    # Assert
+    assert resultat is utilisateur
+    assert supprime is True
+    mock_user_repository.update.assert_not_called()
+
+
 def test_changer_role_success(user_service, mock_user_repository):
     """Changer le rôle d'un utilisateur."""
     # Arrange
@@ -363,3 +533,104 @@ def test_changer_mot_de_passe_ancien_incorrect(user_service, mock_user_repositor
             ancien_mot_de_passe="MauvaisMotDePasse",
             nouveau_mot_de_passe="NewPassword456!"
         )
+
+
+def test_changer_mot_de_passe_trop_de_tentatives(mock_user_repository):
+    """Après trop d'échecs, la demande est refusée sans relire l'utilisateur."""
+    # Arrange
+    service = UserService(
+        mock_user_repository,
+        password_limiter=PasswordAttemptLimiter(max_attempts=2, base_delay=60.0)
+    )
+    mock_user_repository.find_by_id.return_value = Utilisateur(
+        id=1,
+        nom="Dupont",
+        prenom="Jean",
+        email="jean.dupont@example.com",
+        mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+        role=RoleUtilisateur.EMPLOYE,
+        date_creation=datetime.now(),
+        actif=True
+    )
+    for _ in range(2):
+        with pytest.raises(DomainValidationError, match="incorrect"):
+            service.changer_mot_de_passe(1, "MauvaisMotDePasse", "NewPassword456!")
+
+    # Act & Assert
+    with pytest.raises(DomainValidationError, match="Trop de tentatives"):
+        service.changer_mot_de_passe(1, "Password123!", "NewPassword456!")
+
+    assert mock_user_repository.find_by_id.call_count == 2
+    mock_user_repository.update.assert_not_called()
+
+
+def test_creer_utilisateur_email_existe_cache(mock_user_repository):
+    """Les tentatives répétées avec un email pris ne refont pas la requête."""
+    # Arrange
+    service = UserService(mock_user_repository, email_cache=TTLCache())
+    mock_user_repository.exists_by_email.return_value = True
+
+    # Act & Assert
+    for _ in range(2):
+        with pytest.raises(EntityAlreadyExistsError):
+            service.creer_utilisateur(
+                nom="Dupont",
+                prenom="Jean",
+                email="  Jean.Dupont@Example.com ",
+                mot_de_passe="Password123!",
+                role=RoleUtilisateur.EMPLOYE
+            )
+
+    mock_user_repository.exists_by_email.assert_called_once_with("jean.dupont@example.com")
+    mock_user_repository.save.assert_not_called()
+
+
+def test_creer_utilisateur_email_libre_non_cache(mock_user_repository):
+    """Un email vu libre n'est pas mis en cache: il est revérifié à chaque création."""
+    # Arrange: l'email est libre à la vérification, mais pris à l'écriture
+    # (inséré entre-temps par un autre processus)
+    cache = TTLCache()
+    service = UserService(mock_user_repository, email_cache=cache)
+    mock_user_repository.exists_by_email.return_value = False
+    mock_user_repository.save.side_effect = EntityAlreadyExistsError("email pris")
+
+    # Act & Assert
+    for _ in range(2):
+        with pytest.raises(EntityAlreadyExistsError):
+            service.creer_utilisateur(
+                nom="Dupont",
+                prenom="Jean",
+                email="jean.dupont@example.com",
+                mot_de_passe="Password123!",
+                role=RoleUtilisateur.EMPLOYE
+            )
+
+    assert mock_user_repository.exists_by_email.call_count == 2
+    assert cache.get("jean.dupont@example.com") is None
+
+
+def test_modifier_utilisateur_email_met_a_jour_cache(mock_user_repository):
+    """Changer d'email libère l'ancien et réserve le nouveau dans le cache."""
+    # Arrange
+    cache = TTLCache()
+    cache.set("jean.dupont@example.com", True)
+    service = UserService(mock_user_repository, email_cache=cache)
+    utilisateur_existant = Utilisateur(
+        id=1,
+        nom="Dupont",
+        prenom="Jean",
+        email="jean.dupont@example.com",
+        mot_de_passe_hash=Utilisateur.hash_mot_de_passe("Password123!"),
+        role=RoleUtilisateur.EMPLOYE,
+        date_creation=datetime.now(),
+        actif=True
+    )
+    mock_user_repository.find_with_email_check.return_value = (utilisateur_existant, False)
+    mock_user_repository.update.return_value = utilisateur_existant
+
+    # Act
+    service.modifier_utilisateur(user_id=1, email="jean.durand@example.com")
+
+    # Assert
+    assert cache.get("jean.dupont@example.com") is None
+    assert cache.get("jean.durand@example.com") is True
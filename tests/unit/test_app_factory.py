@@ -0,0 +1,39 @@
+"""
+Tests de la fabrique d'application (src/app_factory.py).
+"""
+from fastapi.testclient import TestClient
+
+from src.app_factory import create_app
+
+
+def test_create_app_registers_routers():
+    """L'application expose les routes projets et utilisateurs."""
+    app = create_app()
+
+    paths = app.openapi()["paths"]
+
+    assert "/api/projects" in paths
+    assert "/api/users" in paths
+
+
+def test_root_endpoint_returns_endpoints():
+    """GET / répond 200 avec la liste des endpoints."""
+    client = TestClient(create_app())
+
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.json()["endpoints"]["projects"] == "/api/projects"
+    assert response.json()["endpoints"]["docs"] == "/docs"
+
+
+def test_create_app_without_docs_skips_openapi():
+    """with_docs=False désactive le schéma OpenAPI et la documentation."""
+    client = TestClient(create_app(with_docs=False))
+
+    assert client.get("/openapi.json").status_code == 404
+    assert client.get("/docs").status_code == 404
+    # L'endpoint racine n'annonce pas la documentation absente
+    endpoints = client.get("/").json()["endpoints"]
+    assert "docs" not in endpoints
+    assert "redoc" not in endpoints